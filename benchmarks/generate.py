@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import random
+import sys
+
+WORDS = [
+    u'administration', u'autorité', u'collectivité', u'contrat', u'déclaration', u'délai', u'disposition',
+    u'dossier', u'électronique', u'établissement', u'information', u'jour', u'personne', u'public', u'registre',
+    u'service', u'territoriale', u'titre', u'traitement', u'usager', u'données', u'demande', u'décision', u'État',
+]
+
+CODES = [
+    u'code civil', u'code de commerce', u'code de l\'éducation', u'code du travail', u'code de la route',
+    u'code pénal', u'code de la santé publique', u'code général des collectivités territoriales',
+]
+
+LAWS = [
+    (u'78-17', u'6 janvier 1978'),
+    (u'78-753', u'17 juillet 1978'),
+    (u'2000-321', u'12 avril 2000'),
+    (u'2016-1321', u'7 octobre 2016'),
+]
+
+ORDINALS = [u'premier', u'deuxième', u'troisième', u'quatrième', u'cinquième']
+
+ROMANS = [u'I', u'II', u'III', u'IV', u'V', u'VI', u'VII', u'VIII', u'IX', u'X']
+
+# Generate the text of a synthetic bill, in the format expected by bill_parser.parse_bill():
+# - articles: the number of articles;
+# - alineas: the number of items (I., 1°, a)...) at each level of an article;
+# - depth: the nesting level of those items, from 1 (flat alineas) to 3 (I. > 1° > a));
+# - references: the ratio of items referring to (and editing) a law or a code, the others being raw content;
+# - quote_length: the number of words of each quoted text.
+# The same seed always generates the same bill.
+def generate_bill(articles=10, alineas=3, depth=2, references=0.8, quote_length=8, seed=0):
+    rand = random.Random(seed)
+    lines = [
+        u'N° 1561',
+        u'QUATORZIÈME LÉGISLATURE',
+        u'Enregistré à la Présidence de l\'Assemblée nationale le 3 décembre 2013.',
+        u'PROPOSITION DE LOI',
+        u'visant à mesurer les performances de DuraLex',
+        u'présentée par',
+        u'M. Test',
+    ]
+
+    for article in range(1, articles + 1):
+        lines.append(u'Article 1er' if article == 1 else u'Article ' + str(article))
+        lines += generate_items(rand, alineas, depth, references, quote_length)
+
+    return u'\n'.join(lines) + u'\n'
+
+def generate_items(rand, alineas, depth, references, quote_length, level=1):
+    lines = []
+    for i in range(0, alineas):
+        prefix = get_item_prefix(i, level, depth)
+        if level == depth:
+            lines.append(prefix + generate_alinea(rand, references, quote_length))
+            continue
+        if rand.random() < references:
+            lines.append(prefix + u'Le ' + rand.choice(CODES) + u' est ainsi modifié :')
+        else:
+            lines.append(prefix + generate_words(rand, quote_length).capitalize() + u' :')
+        lines += generate_items(rand, alineas, depth, references, quote_length, level + 1)
+    return lines
+
+# The items are numbered "I. -", "1°" and "a)" at the 1st, 2nd and 3rd levels.
+def get_item_prefix(i, level, depth):
+    if depth == 1:
+        return u''
+    elif level == 1:
+        return (ROMANS[i] if i < len(ROMANS) else str(i + 1)) + u'. - '
+    elif level == 2:
+        return str(i + 1) + u'° '
+    return chr(ord('a') + i % 26) + u') '
+
+def generate_alinea(rand, references, quote_length):
+    if rand.random() >= references:
+        return generate_words(rand, quote_length).capitalize() + u'.'
+
+    article = u'L. ' + str(rand.randint(1, 999)) + u'-' + str(rand.randint(1, 30))
+    kind = rand.randint(0, 3)
+    if kind == 0:
+        return (
+            u'À la ' + rand.choice([u'première', u'deuxième', u'dernière']) + u' phrase du '
+            + rand.choice(ORDINALS) + u' alinéa de l\'article ' + article + u' du ' + rand.choice(CODES)
+            + u', les mots : "' + generate_words(rand, quote_length) + u'" sont remplacés par les mots : "'
+            + generate_words(rand, quote_length) + u'" ;'
+        )
+    elif kind == 1:
+        law_id, law_date = rand.choice(LAWS)
+        return (
+            u'L\'article ' + str(rand.randint(1, 99)) + u' de la loi n° ' + law_id + u' du ' + law_date
+            + u' est abrogé ;'
+        )
+    elif kind == 2:
+        return (
+            u'Après l\'article ' + article + u' du ' + rand.choice(CODES) + u', il est inséré un article '
+            + article + u'-1 ainsi rédigé : "Art. ' + article + u'-1. - ' + generate_words(rand, quote_length)
+            + u'." ;'
+        )
+    return (
+        u'Le ' + rand.choice(ORDINALS) + u' alinéa de l\'article ' + article + u' du ' + rand.choice(CODES)
+        + u' est complété par les mots : "' + generate_words(rand, quote_length) + u'" ;'
+    )
+
+def generate_words(rand, count):
+    return u' '.join(rand.choice(WORDS) for i in range(0, count))
+
+# Generate a synthetic nosdeputes.fr amendments JSON document for the bill above.
+def generate_amendments(amendments=50, articles=10, quote_length=8, seed=0):
+    rand = random.Random(seed)
+    data = {'amendements': []}
+    for i in range(1, amendments + 1):
+        article = rand.randint(1, articles)
+        if rand.random() < 0.5:
+            text = u'<p>Supprimer cet article.</p>'
+        else:
+            text = (
+                u'<p>À l\'alinéa ' + str(rand.randint(1, 5)) + u', substituer au mot : « '
+                + rand.choice(WORDS) + u' » les mots : « ' + generate_words(rand, quote_length) + u' ».</p>'
+            )
+        data['amendements'].append({'amendement': {
+            'numero': str(i),
+            'sujet': u'ART. PREMIER' if article == 1 else u'ART. ' + str(article),
+            'texte': text,
+            'sort': rand.choice([u'Adopté', u'Rejeté', u'Non soutenu', u'Retiré']),
+            'expose': u'<p>' + generate_words(rand, quote_length * 4) + u'</p>',
+            'signataires': u'M. A, Mme B',
+            'source': u'http://www.nosdeputes.fr/14/amendement/1561/' + str(i),
+        }})
+    return data
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='generate')
+    parser.add_argument('--articles', type=int, default=10)
+    parser.add_argument('--alineas', type=int, default=3)
+    parser.add_argument('--depth', type=int, choices=[1, 2, 3], default=2)
+    parser.add_argument('--references', type=float, default=0.8)
+    parser.add_argument('--quote-length', type=int, default=8)
+    parser.add_argument('--amendments', type=int, default=None, help='generate amendments instead of a bill')
+    parser.add_argument('--seed', type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    if args.amendments is not None:
+        data = generate_amendments(args.amendments, args.articles, args.quote_length, args.seed)
+        sys.stdout.write(json.dumps(data, indent=2, ensure_ascii=False))
+    else:
+        sys.stdout.write(generate_bill(
+            args.articles, args.alineas, args.depth, args.references, args.quote_length, args.seed
+        ))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+import cProfile
+import datetime
+import importlib.machinery
+import importlib.util
+import json
+import os
+import platform
+import pstats
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.realpath(os.path.dirname(__file__)), '..')
+
+sys.path.insert(0, ROOT)
+
+import duralex.alinea_lexer
+import duralex.alinea_parser
+import duralex.amendment_parser
+import duralex.bill_parser
+import duralex.diff_parser
+import duralex.lexicon
+import duralex.tree
+from duralex.ForkReferenceVisitor import ForkReferenceVisitor
+from duralex.ResolveFullyQualifiedDefinitionsVisitor import ResolveFullyQualifiedDefinitionsVisitor
+from duralex.ResolveFullyQualifiedReferencesVisitor import ResolveFullyQualifiedReferencesVisitor
+from duralex.FixMissingCodeOrLawReferenceVisitor import FixMissingCodeOrLawReferenceVisitor
+from duralex.SortReferencesVisitor import SortReferencesVisitor
+from duralex.SwapDefinitionAndReferenceVisitor import SwapDefinitionAndReferenceVisitor
+from duralex.RemoveQuotePrefixVisitor import RemoveQuotePrefixVisitor
+from duralex.DeleteUUIDVisitor import DeleteUUIDVisitor
+from duralex.DeleteParentVisitor import DeleteParentVisitor
+from duralex.DeleteEmptyChildrenVisitor import DeleteEmptyChildrenVisitor
+
+from generate import generate_bill, generate_amendments
+
+# the visitors in the order they are applied by bin/duralex
+VISITORS = [
+    ForkReferenceVisitor,
+    ResolveFullyQualifiedDefinitionsVisitor,
+    ResolveFullyQualifiedReferencesVisitor,
+    FixMissingCodeOrLawReferenceVisitor,
+    SortReferencesVisitor,
+    SwapDefinitionAndReferenceVisitor,
+    RemoveQuotePrefixVisitor,
+    DeleteUUIDVisitor,
+    DeleteParentVisitor,
+    DeleteEmptyChildrenVisitor,
+]
+
+def load_script():
+    loader = importlib.machinery.SourceFileLoader('duralex_script', os.path.join(ROOT, 'bin', 'duralex'))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(loader.name, loader))
+    loader.exec_module(module)
+    return module
+
+def get_article_texts(bill_data):
+    return [
+        duralex.alinea_lexer.TOKEN_NEW_LINE.join(value for key, value in sorted(article['alineas'].items()))
+        for article in bill_data['articles']
+    ]
+
+def parse_tree(bill_data, visitors=[]):
+    tree = duralex.tree.create_node(None, {})
+    duralex.alinea_parser.parse(bill_data, tree)
+    for visitor in visitors:
+        visitor().visit(tree)
+    return tree
+
+def parse_each(fn, texts):
+    for text in texts:
+        fn(text, duralex.tree.create_node(None, {}))
+
+# Return a list of (name, setup, run) benchmarks: setup() is called before each measure of run(*setup()) so the
+# benchmarks that alter their input always start from the same state (cf clear_caches()).
+def get_benchmarks(bill, amendments, amendments_path):
+    bill_data = duralex.bill_parser.parse_bill(bill, None)
+    texts = get_article_texts(bill_data)
+    script = load_script()
+
+    benchmarks = [
+        (
+            'alinea_lexer.tokenize',
+            lambda: (texts,),
+            lambda texts: [duralex.alinea_lexer.tokenize(text.strip()) for text in texts]
+        ),
+        (
+            'alinea_parser.parse',
+            lambda: (bill_data, duralex.tree.create_node(None, {})),
+            duralex.alinea_parser.parse
+        ),
+        (
+            'alinea_parser.parse_alineas',
+            lambda: (duralex.alinea_parser.parse_alineas, texts),
+            parse_each
+        ),
+        (
+            'alinea_parser.parse_header1',
+            # the tokens keep what the rules parsed (cf alinea_lexer.TokenList): they're tokenized again for each run
+            lambda: ([duralex.alinea_lexer.tokenize(text.strip()) for text in texts],),
+            lambda tokens: [
+                duralex.alinea_parser.parse_for_each(
+                    duralex.alinea_parser.parse_header1, t, 0, duralex.tree.create_node(None, {})
+                )
+                for t in tokens
+            ]
+        ),
+        (
+            'bill_parser.parse_bill',
+            lambda: (bill, None),
+            duralex.bill_parser.parse_bill
+        ),
+        (
+            'amendment_parser.parse',
+            lambda: (amendments, parse_tree(bill_data)),
+            duralex.amendment_parser.parse
+        ),
+    ]
+
+    for i, visitor in enumerate(VISITORS):
+        benchmarks.append((
+            visitor.__name__,
+            lambda i=i: (parse_tree(bill_data, VISITORS[:i]),),
+            lambda tree, visitor=visitor: visitor().visit(tree)
+        ))
+
+    args = argparse.Namespace(
+        url=None,
+        quiet=True,
+        uuid=False,
+        amendments=amendments_path,
+        jobs=None,
+        merge_diff_lines=False,
+        cache_dir=None,
+        no_cache=True,
+        offline=True,
+        memory_report=False,
+        article_max_steps=None,
+        article_timeout=None,
+        code_names=None,
+        debug=False,
+    )
+    benchmarks.append(('handle_data', lambda: (bill, args), script.handle_data))
+
+    return benchmarks
+
+# The caches the parsers keep across calls: they are cleared before each measure, so each run parses as much as the
+# first one (the caches of the command line start empty too, unless they are loaded from the cache directory).
+CACHED_FUNCTIONS = [
+    duralex.tree.get_type_mask,
+    duralex.lexicon.parse_roman_number,
+    duralex.amendment_parser.parse_subject_fields,
+    duralex.diff_parser.parse_law_id,
+    duralex.diff_parser.parse_article_id,
+]
+
+def clear_caches():
+    duralex.alinea_parser.reference_cache.clear()
+    for fn in CACHED_FUNCTIONS:
+        fn.cache_clear()
+
+def measure(setup, run, repeat):
+    times = []
+    for i in range(0, repeat):
+        args = setup()
+        clear_caches()
+        start = time.perf_counter()
+        run(*args)
+        times.append(time.perf_counter() - start)
+
+    return {
+        'repeat': repeat,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+    }
+
+# Profile a whole parse of the bill to get the time spent in each alinea_parser.parse_* rule, including the ones that
+# can not be called on their own.
+def profile_rules(bill_data):
+    profiler = cProfile.Profile()
+    profiler.runcall(parse_tree, bill_data)
+
+    rules = {}
+    for (filename, line, name), (cc, calls, tottime, cumtime, callers) in pstats.Stats(profiler).stats.items():
+        if name.startswith('parse') and filename == duralex.alinea_parser.__file__:
+            rules['alinea_parser.' + name] = {'calls': calls, 'time': tottime, 'cumulative': cumtime}
+    return rules
+
+def get_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=ROOT,
+            stderr=subprocess.DEVNULL
+        ).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline):
+    sys.stderr.write('%-50s %12s %12s %8s\n' % ('benchmark', 'baseline', 'current', 'ratio'))
+    for name, result in sorted(results['benchmarks'].items()):
+        if name not in baseline['benchmarks']:
+            continue
+        before = baseline['benchmarks'][name]['median']
+        after = result['median']
+        sys.stderr.write('%-50s %11.3fms %11.3fms %7.2fx\n' % (name, before * 1000, after * 1000, after / before))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='run')
+    parser.add_argument('--articles', type=int, default=50)
+    parser.add_argument('--alineas', type=int, default=3)
+    parser.add_argument('--depth', type=int, choices=[1, 2, 3], default=2)
+    parser.add_argument('--references', type=float, default=0.8)
+    parser.add_argument('--quote-length', type=int, default=8)
+    parser.add_argument('--amendments', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', help='only run the benchmarks whose name contains this string')
+    parser.add_argument('--output', help='the path of the JSON results (default: stdout)')
+    parser.add_argument('--compare', help='the path of previous JSON results to compare with', type=argparse.FileType('r'))
+
+    args = parser.parse_args(argv)
+
+    params = {
+        'articles': args.articles,
+        'alineas': args.alineas,
+        'depth': args.depth,
+        'references': args.references,
+        'quote_length': args.quote_length,
+        'amendments': args.amendments,
+        'seed': args.seed,
+    }
+    bill = generate_bill(args.articles, args.alineas, args.depth, args.references, args.quote_length, args.seed)
+    amendments = generate_amendments(args.amendments, args.articles, args.quote_length, args.seed)
+
+    results = {
+        'commit': get_commit(),
+        'date': datetime.datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': params,
+        'benchmarks': {},
+    }
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8') as f:
+        json.dump(amendments, f, ensure_ascii=False)
+        f.flush()
+
+        for name, setup, run in get_benchmarks(bill, amendments, f.name):
+            if args.only and args.only not in name:
+                continue
+            results['benchmarks'][name] = measure(setup, run, args.repeat)
+            sys.stderr.write('%-50s %11.3fms\n' % (name, results['benchmarks'][name]['median'] * 1000))
+
+    if not args.only:
+        results['rules'] = profile_rules(duralex.bill_parser.parse_bill(bill, None))
+
+    if args.compare:
+        compare(results, json.load(args.compare))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    else:
+        sys.stdout.write(json.dumps(results, indent=2, sort_keys=True))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -73,16 +73,47 @@ class AbstractVisitor(object):
     def visit_bill_article_node(self, node, post):
         pass
 
+    # Called when the visit of a node starts, before the visit_*_node(node, False) handler. Return False to skip the
+    # node's children and the end of its visit.
+    def enter_node(self, node):
+        return True
+
+    # Called when the visit of a node ends, after its children and the visit_*_node(node, True) handler.
+    def leave_node(self, node):
+        pass
+
+    # Visit the node and its descendants in depth-first order. The traversal uses an explicit stack rather than
+    # recursion, so deep trees can't exceed the recursion limit: subclasses hook into it with enter_node() and
+    # leave_node(). Each list of children is iterated as is when its node is entered, so the children added or removed
+    # by the handlers in the meantime are taken into account.
     def visit_node(self, node):
+        if not self.enter(node):
+            return
+
+        stack = [(node, iter(node['children'] if 'children' in node else []))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                self.leave(node)
+            elif self.enter(child):
+                stack.append((child, iter(child['children'] if 'children' in child else [])))
+
+    def enter(self, node):
+        if not self.enter_node(node):
+            return False
+
         if 'type' in node and node['type'] in self.visitors:
             self.visitors[node['type']](node, False)
 
-        if 'children' in node:
-            for child in node['children']:
-                self.visit_node(child)
+        return True
 
+    def leave(self, node):
         if 'type' in node and node['type'] in self.visitors:
             self.visitors[node['type']](node, True)
 
+        self.leave_node(node)
+
     def visit(self, node):
         self.visit_node(node)
@@ -8,12 +8,13 @@ class AddParentVisitor(AbstractVisitor):
 
         super(AddParentVisitor, self).__init__()
 
-    def visit_node(self, node):
+    def enter_node(self, node):
         if 'parent' not in node and len(self.parent):
             node['parent'] = self.parent[-1]
 
         self.parent.append(node)
 
-        super(AddParentVisitor, self).visit_node(node)
+        return True
 
+    def leave_node(self, node):
         del self.parent[-1]
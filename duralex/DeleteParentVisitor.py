@@ -1,8 +1,15 @@
 from duralex.AbstractVisitor import AbstractVisitor
 
 class DeleteParentVisitor(AbstractVisitor):
-    def visit_node(self, node):
+    def enter_node(self, node):
         if 'parent' in node:
             del node['parent']
+        # the cached depth and descendant types are meaningless without the parent links
+        if 'depth' in node:
+            del node['depth']
+        if 'descendantTypes' in node:
+            del node['descendantTypes']
+        if 'staleTypes' in node:
+            del node['staleTypes']
 
-        super(DeleteParentVisitor, self).visit_node(node)
+        return True
@@ -1,8 +1,8 @@
 from duralex.AbstractVisitor import AbstractVisitor
 
 class DeleteUUIDVisitor(AbstractVisitor):
-    def visit_node(self, node):
+    def enter_node(self, node):
         if 'uuid' in node:
             del node['uuid']
 
-        super(DeleteUUIDVisitor, self).visit_node(node)
+        return True
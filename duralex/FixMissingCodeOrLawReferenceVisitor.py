@@ -1,5 +1,7 @@
 # -*- coding=utf-8 -*-
 
+import duralex.metrics
+
 from duralex.AbstractVisitor import AbstractVisitor
 
 from duralex.tree import *
@@ -27,10 +29,9 @@ class FixMissingCodeOrLawReferenceVisitor(AbstractVisitor):
     def visit_article_reference_node(self, node, post):
         if post:
             return
-        ancestor_refs = [n for n in get_node_ancestors(node) + get_node_descendants(node) if
-            not is_root(n) and n['type'] in [TYPE_CODE_REFERENCE, TYPE_LAW_REFERENCE]
-        ]
-        if len(ancestor_refs) == 0:
+        types = [TYPE_CODE_REFERENCE, TYPE_LAW_REFERENCE]
+        if not has_ancestor_of_type(node, types) and not has_descendant_of_type(node, types):
             while len(node['children']) != 0:
                 node = node['children'][0]
-            node['children'] = [copy_node(self.law_or_code_ref, False)]
+            push_node(node, copy_node(self.law_or_code_ref, False))
+            duralex.metrics.count('references_resolved')
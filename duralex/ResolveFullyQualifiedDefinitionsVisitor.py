@@ -5,9 +5,9 @@ from duralex.AbstractVisitor import AbstractVisitor
 import duralex.tree
 
 class ResolveFullyQualifiedDefinitionsVisitor(AbstractVisitor):
-    def visit_node(self, node):
+    def enter_node(self, node):
         self.resolve_fully_qualified_definitions(node)
-        super(ResolveFullyQualifiedDefinitionsVisitor, self).visit_node(node)
+        return True
 
     def resolve_fully_qualified_definitions(self, node):
         if 'type' in node and node['type'] == 'edit':
@@ -5,11 +5,17 @@ from duralex.AbstractVisitor import AbstractVisitor
 class ResolveFullyQualifiedReferencesVisitor(AbstractVisitor):
     def __init__(self):
         self.ctx = []
+        self.ctx_nodes = []
         super(ResolveFullyQualifiedReferencesVisitor, self).__init__()
 
-    def visit_node(self, node):
-        if not self.resolve_fully_qualified_references(node):
-            super(ResolveFullyQualifiedReferencesVisitor, self).visit_node(node)
+    def enter_node(self, node):
+        return not self.resolve_fully_qualified_references(node)
+
+    def leave_node(self, node):
+        # the context given by an edit node only applies to its descendants
+        if len(self.ctx_nodes) > 0 and self.ctx_nodes[-1] is node:
+            self.ctx_nodes.pop()
+            self.ctx.pop()
 
     def resolve_fully_qualified_references(self, node):
         # If we are on an edit node that has edit ancestors
@@ -21,18 +27,18 @@ class ResolveFullyQualifiedReferencesVisitor(AbstractVisitor):
         # context to its descendants.
         if (not duralex.tree.is_reference(node) and len(node['children']) >= 1 and node['children'][0]['type'] == 'edit'
             and node['children'][0]['editType'] == 'edit'
-            and len(filter_nodes(node, lambda n: 'type' in n and n['type'] == 'edit')) > 1):
+            and self.has_other_edit(node)):
             context = node['children'][0]['children'][0]
             remove_node(node, node['children'][0])
             self.ctx.append([copy_node(ctx_node, False) for ctx_node in filter_nodes(context, lambda x: duralex.tree.is_reference(x))])
-            for child in node['children']:
-                self.visit_node(child)
-            self.ctx.pop()
-            return True
+            self.ctx_nodes.append(node)
+            # the children are then visited with that context, until leave_node()
+            return False
         # If we have a context and there is no ref type at all and we're not on a 'swap' edit
-        elif len(self.ctx) > 0 and node['type'] == 'edit' and len(filter_nodes(node, lambda x : duralex.tree.is_reference(x))) == 0:
+        elif len(self.ctx) > 0 and node['type'] == 'edit' and not has_descendant_of_type(node, TYPE_REFERENCE):
             n = [copy_node(item) for sublist in self.ctx for item in sublist]
             n = sorted(n, key=lambda x : duralex.tree.TYPE_REFERENCE.index(x['type']))
+            duralex.metrics.count('references_resolved')
             unshift_node(node, n[0])
             for i in range(1, len(n)):
                 unshift_node(n[i - 1], n[i])
@@ -41,6 +47,7 @@ class ResolveFullyQualifiedReferencesVisitor(AbstractVisitor):
         elif len(self.ctx) > 0 and duralex.tree.is_reference(node) and not duralex.tree.is_reference(node['parent']):
             n = [copy_node(item) for sublist in self.ctx for item in sublist]
             n = sorted(n, key=lambda x : duralex.tree.TYPE_REFERENCE.index(x['type']))
+            duralex.metrics.count('references_resolved')
             unshift_node(node['parent'], n[0])
             for i in range(1, len(n)):
                 unshift_node(n[i - 1], n[i])
@@ -53,3 +60,9 @@ class ResolveFullyQualifiedReferencesVisitor(AbstractVisitor):
             return True
 
         return False
+
+    # Whether the subtree of node has another edit than its first child.
+    def has_other_edit(self, node):
+        return (('type' in node and node['type'] == TYPE_EDIT)
+            or has_descendant_of_type(node['children'][0], [TYPE_EDIT])
+            or any(has_node_of_type(child, [TYPE_EDIT]) for child in node['children'][1:]))
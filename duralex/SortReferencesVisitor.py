@@ -5,19 +5,22 @@ from duralex.AbstractVisitor import AbstractVisitor
 import duralex.tree
 
 class SortReferencesVisitor(AbstractVisitor):
-    def visit_node(self, node):
-        if not self.sort_references(node):
-            super(SortReferencesVisitor, self).visit_node(node)
+    def enter_node(self, node):
+        return not self.sort_references(node)
 
     def sort_references(self, node):
-        root_refs = filter_nodes(node, lambda n: duralex.tree.is_reference(n) and 'parent' in n and (not duralex.tree.is_reference(n['parent'])))
+        root_refs = filter_nodes_of_type(
+            node,
+            TYPE_REFERENCE,
+            lambda n: 'parent' in n and (not duralex.tree.is_reference(n['parent']))
+        )
 
         if len(root_refs) == 0:
             return False
 
         for root_ref in root_refs:
             root_ref_parent = root_ref['parent']
-            refs = filter_nodes(root_ref, lambda n: duralex.tree.is_reference(n))
+            refs = filter_nodes_of_type(root_ref, TYPE_REFERENCE)
             sorted_refs = sorted(refs, key=lambda r: duralex.tree.TYPE_REFERENCE.index(r['type']))
             filtered_refs = [sorted_refs[0]]
             for ref in sorted_refs:
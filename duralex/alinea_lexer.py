@@ -1,12 +1,27 @@
 # -*- coding: utf-8 -*-
 
+import itertools
 import re
+import sys
+
+import duralex.metrics
 
 TOKEN_DELIMITERS = re.compile(u'(\xa0|\s|\(|\)|\.|\!|\'|,|")')
+TOKEN_SPACES = re.compile('\s+')
+TOKEN_WORD = re.compile('[\wà]+', re.IGNORECASE | re.UNICODE)
 TOKEN_NEW_LINE = '\n'
 TOKEN_SINGLE_QUOTE = u'\''
 TOKEN_DOUBLE_QUOTE_OPEN = u'"'
 TOKEN_DOUBLE_QUOTE_CLOSE = u'"'
+# the tokens the parser skips to, cf TokenList
+TOKEN_ANCHORS = [
+    TOKEN_NEW_LINE,
+    TOKEN_DOUBLE_QUOTE_OPEN,
+    u'n°',
+    u'loi',
+    u'ordonnance',
+    u'code',
+]
 TOKEN_MONTH_NAMES = [
     u'janvier',
     u'février',
@@ -47,18 +62,143 @@ TOKEN_MULTIPLICATIVE_ADVERBS = [
     u'quatervicies',
     u'quinvicies',
     u'sexvicies',
-    u'septvicies'
+    u'septvicies',
+    u'octovicies',
+    u'novovicies',
+    u'tricies',
+    u'untricies',
+    u'duotricies',
+    u'tertricies',
+    u'quatertricies',
+    u'quintricies',
+    u'sextricies',
+    u'septtricies',
+    u'octotricies',
+    u'novotricies',
+    u'quadragies',
 ]
 
+# The token that follows the last token of a TokenList, TOKEN_PADDING times: it's not a word nor a space and is equal
+# to none of the tokens the grammar rules look for, so a rule looking past the end of the alinea simply doesn't match.
+TOKEN_SENTINEL = u''
+# more than the farthest token a rule looks at after its current position (tokens[i + 8])
+TOKEN_PADDING = 16
+
+# A list followed by TOKEN_PADDING sentinels: tokens[i + 6] can be read without checking len(tokens) first, even at
+# the end of the alinea. Reading the sentinels past the end is all they're for: otherwise the list behaves as the list
+# of its items (len(), iteration, negative indices, slices, ==, in, index(), count(), +, *, copies...). It's not meant
+# to be modified.
+class PaddedList(list):
+    def __init__(self, items):
+        items = list(items)
+        super(PaddedList, self).__init__(items + [TOKEN_SENTINEL] * TOKEN_PADDING)
+        self.length = len(items)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, i):
+        if type(i) is int:
+            if i < 0:
+                i += self.length
+                if i < 0:
+                    raise IndexError('list index out of range')
+            return list.__getitem__(self, i)
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self.length)
+            # a negative step stops before the first item, rather than at the last sentinel
+            return list.__getitem__(self, slice(start, stop if stop >= 0 else None, step))
+        return list.__getitem__(self, i)
+
+    def __iter__(self):
+        return itertools.islice(list.__iter__(self), self.length)
+
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __contains__(self, item):
+        return any(token is item or token == item for token in self)
+
+    def index(self, item, start=0, stop=sys.maxsize):
+        start, stop, _ = slice(start, stop).indices(self.length)
+        return list.index(self, item, start, stop)
+
+    def count(self, item):
+        return list(self).count(item)
+
+    def copy(self):
+        return list(self)
+
+    def __add__(self, other):
+        return list(self) + other
+
+    def __radd__(self, other):
+        return other + list(self)
+
+    def __mul__(self, n):
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        return list(self) == list(other) if isinstance(other, list) else NotImplemented
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(list(self))
+
+    # Return a plain list of the items followed by the sentinels, for the loops reading every item: indexing a plain
+    # list is faster than going through __getitem__().
+    def get_padded_items(self):
+        return list.__getitem__(self, slice(None))
+
+    # a copy or an unpickled list is built again from its items, with its own sentinels
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+# A list of tokens that also holds their lowercase forms, computed once by tokenize(): the grammar rules test
+# tokens.lowered[i] rather than tokens[i].lower(), which allocates a new string at each call. Both the tokens and
+# their lowercase forms are interned, so comparing them with the (interned) string literals of the rules mostly
+# amounts to comparing pointers.
+#
+# It also indexes the next occurrence of each of the TOKEN_ANCHORS from any position, so skip_to_token() can jump
+# straight to it instead of scanning the rest of the alinea. Each index is built on its first use. The phrases matched
+# at each position are kept too (cf duralex.phrases), as well as the positions where a reference can start (cf
+# alinea_parser.get_reference_starts()), the positions where no edit was found (cf alinea_parser.parse_edit()) and the
+# parse budget of the alinea, if any (cf alinea_parser.ParseBudget).
+class TokenList(PaddedList):
+    def __init__(self, tokens):
+        super(TokenList, self).__init__(tokens)
+        self.lowered = PaddedList([sys.intern(token.lower()) for token in tokens])
+        self.next_indices = {}
+        self.phrase_matches = {}
+        self.reference_starts = None
+        self.edit_failures = {}
+        self.budget = None
+
+    # Return the list of the index of the next occurrence of token from each position (len(self) if there is none).
+    def get_next_indices(self, token):
+        if token not in self.next_indices:
+            next_indices = [len(self)] * (len(self) + 1)
+            items = self.get_padded_items()
+            for i in range(len(self) - 1, -1, -1):
+                next_indices[i] = i if items[i] == token else next_indices[i + 1]
+            self.next_indices[token] = next_indices
+        return self.next_indices[token]
+
 def tokenize(text):
     try:
         text = text.decode('utf-8')
     except:
         pass
 
-    tokens = TOKEN_DELIMITERS.split(text)
-    # remove empty strings
-    tokens = [s for s in tokens if s != '']
+    with duralex.metrics.span('tokenize'):
+        tokens = TOKEN_DELIMITERS.split(text)
+        # remove empty strings
+        tokens = TokenList([sys.intern(s) for s in tokens if s != ''])
+    duralex.metrics.count('tokens', len(tokens))
     return tokens
 
 def skip_tokens(tokens, i, f):
@@ -67,12 +207,14 @@ def skip_tokens(tokens, i, f):
     return i
 
 def skip_spaces(tokens, i):
-    return skip_tokens(tokens, i, lambda t: re.compile('\s+').match(t))
+    return skip_tokens(tokens, i, TOKEN_SPACES.match)
 
 def skip_to_next_word(tokens, i):
-    return skip_tokens(tokens, i, lambda t: not re.compile('[\wà]+', re.IGNORECASE | re.UNICODE).match(t))
+    return skip_tokens(tokens, i, lambda t: not TOKEN_WORD.match(t))
 
 def skip_to_token(tokens, i, token):
+    if i < len(tokens) and token in TOKEN_ANCHORS and isinstance(tokens, TokenList):
+        return tokens.get_next_indices(token)[i]
     return skip_tokens(tokens, i, lambda t: t != token)
 
 def skip_to_end_of_line(tokens, i):
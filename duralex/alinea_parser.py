@@ -2,99 +2,194 @@
 
 import re
 import sys
+import time
 
 import duralex.alinea_lexer as alinea_lexer
+import duralex.lexicon
+import duralex.metrics
 import duralex.tree
 
+from duralex.cache import SpanCache, hash_data
+from duralex.phrases import PhraseMatcher
+from duralex.lexicon import (
+    ParseSyntaxError, is_number, parse_int, word_to_number, is_number_word, month_to_number, is_roman_number, parse_roman_number,
+    get_multiplicative_adverb, match_code_name
+)
 from duralex.tree import *
 
 def debug(node, tokens, i, msg):
     if '--debug' in sys.argv:
         print('    ' * get_node_depth(node) + msg + ' ' + str(tokens[i:i+8]))
 
-def is_number(token):
-    return re.compile('\d+').match(token)
+# Back-references such as "le même code" or "cet article" are resolved using the previous nodes of the whole tree. When
+# the referenced node is outside of the bill article (or amendment) being parsed, the parsed content of that article
+# depends on the articles before it: it is then flagged so it's never reused on its own (cf parse_json_alineas()).
+def resolve_back_reference(parent, node):
+    scope = parent
+    while scope is not None and scope.get('type') not in [TYPE_BILL_ARTICLE, TYPE_AMENDMENT]:
+        scope = scope.get('parent')
+    duralex.metrics.count('references_resolved')
+    if scope is None:
+        return node
+
+    ancestor = node
+    while ancestor is not None and ancestor is not scope:
+        ancestor = ancestor.get('parent')
+    if ancestor is None:
+        scope['isContextual'] = True
+
+    return node
+
+# Return the node a back-reference refers to, resolved with resolve_back_reference(): the offset-th last of nodes (the
+# nodes of its type in order of traversal). Raise a ParseSyntaxError if there is none, such as for "le même article"
+# with no previous article.
+def get_back_reference(parent, nodes, offset=1):
+    if len(nodes) < offset:
+        raise ParseSyntaxError('nothing to refer to')
+    return resolve_back_reference(parent, nodes[-offset])
+
+class ParseBudgetExceeded(Exception):
+    pass
+
+# The parse budget of a bill article: the number of parse steps (attempts to parse one of several rules, cf
+# parse_one_of()) and/or the number of seconds it may take before it's abandoned (cf parse_json_alineas()).
+class ParseBudget(object):
+    def __init__(self, max_steps=None, max_seconds=None):
+        self.max_steps = max_steps
+        self.max_seconds = max_seconds
+        self.start()
+
+    def start(self):
+        self.steps = 0
+        self.deadline = time.perf_counter() + self.max_seconds if self.max_seconds else None
+
+    def step(self):
+        self.steps += 1
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise ParseBudgetExceeded('more than ' + str(self.max_steps) + ' parse steps')
+        # checking the time at each step would cost more than the step itself
+        if self.deadline is not None and self.steps % 64 == 0 and time.perf_counter() > self.deadline:
+            raise ParseBudgetExceeded('more than ' + str(self.max_seconds) + ' seconds')
+
+# the number of law and code names kept by reference_cache
+REFERENCE_CACHE_SIZE = 4096
+
+# The law and code names ("la loi n° 78-17 du 6 janvier 1978", "code de la sécurité sociale") recur in most of the
+# bills and amendments: the fields parsed from their tokens are kept across the articles, and the bills when the
+# cache is loaded and saved by the caller (cf SpanCache.dump() and load()). The hits and misses are also counted as
+# reference_cache_hits and reference_cache_misses.
+reference_cache = SpanCache(REFERENCE_CACHE_SIZE)
+
+# Parse the fields of a reference name with fn(tokens, i), or get them from reference_cache. fn() returns None or the
+# fields, the index of the token after the name and the index of the token after the last one it read. Return None or
+# a copy of the fields and the index of the token after the name. The names are cached by fn and by generation, if
+# the names fn parses depend on data that may change, such as the known code names.
+def parse_cached_name(fn, tokens, i, generation=None):
+    namespace = fn.__name__ if generation is None else fn.__name__ + '-' + str(generation)
+    cached = reference_cache.get(tokens, i, namespace)
+    if cached is not None:
+        duralex.metrics.count('reference_cache_hits')
+        fields, size = cached
+        return dict(fields), i + size
+    duralex.metrics.count('reference_cache_misses')
+
+    result = fn(tokens, i)
+    if result is None:
+        return None
+    fields, j, end = result
+    reference_cache.set(tokens, i, end - i, fields, j - i, namespace)
+    return dict(fields), j
+
+# The phrases of the rules that are a fixed sequence of words, by rule, in the order they're tried by each rule.
+PHRASES = PhraseMatcher([
+    # la section {order}
+    # de la section {order}
+    (TYPE_SECTION_REFERENCE, u'~la section <int>'),
+    (TYPE_SECTION_REFERENCE, u'de la section <int>'),
+    # la sous-section {order}
+    # de la sous-section {order}
+    (TYPE_SUBSECTION_REFERENCE, u'~la sous-section <int>'),
+    (TYPE_SUBSECTION_REFERENCE, u'de la sous-section <int>'),
+    # du chapitre {order}
+    # le chapitre {order}
+    (TYPE_CHAPTER_REFERENCE, u'~du|le chapitre <roman>'),
+    # du paragraphe {order}
+    # le paragraphe {order}
+    (TYPE_PARAGRAPH_REFERENCE, u'~du|le paragraphe <int>'),
+    # le titre {order}
+    # du titre {order}
+    (TYPE_TITLE_REFERENCE, u'~le|du titre <roman>'),
+    # un titre {order}
+    (TYPE_TITLE_DEFINITION, u'~un titre <roman>'),
+    # la {order} partie
+    # de la {order} partie
+    (TYPE_CODE_PART_REFERENCE, u'la <ordinal> partie'),
+    (TYPE_CODE_PART_REFERENCE, u'de la <ordinal> partie'),
+    # le livre {order}
+    # du livre {order}
+    (TYPE_BOOK_REFERENCE, u'~le|du livre <roman>'),
+    # après
+    # avant
+    # au début
+    # à la fin
+    ('after', u'~après'),
+    ('before', u'~avant'),
+    ('beginning', u'~au début'),
+    ('end', u'~à la fin'),
+])
+
+# The (lowercase) words a reference can start with, including the positions ("après", "au début"...) and scopes ("la
+# fin de") some references start with.
+REFERENCE_START_WORDS = set([
+    u'à', u'après', u'au', u'avant', u'cet', u'code', u'de', u'des', u'du', u'il', u'l', u'la', u'le', u'les', u'un',
+    u'une', u'alinéa',
+])
+
+# Return whether a reference can start at each token, in a single pass over the tokens. A token is marked when it's
+# one of REFERENCE_START_WORDS, a number word or a word starting with "article", or when the "ordonnance" of a law
+# reference follows it. The word references skip the tokens that are not words first: those tokens are marked when the
+# next word is. Every token a reference rule can match is marked, so parse_reference() doesn't need to try the rules
+# anywhere else.
+def get_reference_starts(tokens):
+    if tokens.reference_starts is not None:
+        return tokens.reference_starts
+
+    starts = bytearray(len(tokens) + 1)
+    items = tokens.get_padded_items()
+    lowered = tokens.lowered.get_padded_items()
+    # whether a reference can start at the next word
+    next_word_start = 0
+    for i in range(len(tokens) - 1, -1, -1):
+        word = lowered[i]
+        if not alinea_lexer.TOKEN_WORD.match(word):
+            starts[i] = next_word_start
+            continue
+        if (word in REFERENCE_START_WORDS or word.startswith(u'article') or is_number_word(word)
+            or items[i + 2] == u'ordonnance' or items[i + 4] == u'ordonnance'):
+            starts[i] = 1
+        next_word_start = starts[i]
+    tokens.reference_starts = starts
+    return starts
 
 def is_space(token):
     return re.compile('^\s+$').match(token)
 
-def parse_int(s):
-    return int(re.search(r'\d+', s).group())
-
-def parse_roman_number(n):
-    romans_map = zip(
-        (1000,  900, 500, 400 , 100,  90 , 50 ,  40 , 10 ,   9 ,  5 ,  4  ,  1),
-        ( 'M', 'CM', 'D', 'CD', 'C', 'XC', 'L', 'XL', 'X', 'IX', 'V', 'IV', 'I')
-    )
-
-    n = n.upper()
-    i = res = 0
-    for d, r in romans_map:
-        while n[i:i + len(r)] == r:
-            res += d
-            i += len(r)
-    return res
-
-def is_roman_number(token):
-    return re.compile(r"[IVXCLDM]+(er)?").match(token)
-
-def is_number_word(word):
-    return word_to_number(word) >= 0
-
-def word_to_number(word):
-    words = [
-        [u'un', u'une', u'premier', u'première'],
-        [u'deux', u'deuxième', u'second', u'seconde'],
-        [u'trois', u'troisième'],
-        [u'quatre', u'quatrième'],
-        [u'cinq', u'cinquième'],
-        [u'six', u'sixième'],
-        [u'sept', u'septième'],
-        [u'huit', u'huitième'],
-        [u'neuf', u'neuvième'],
-        [u'dix', u'dixième'],
-        [u'onze', u'onzième'],
-        [u'douze', u'douzième'],
-        [u'treize', u'treizième'],
-        [u'quatorze', u'quatorzième'],
-        [u'quinze', u'quinzième'],
-        [u'seize', u'seizième'],
-    ]
-
-    word = word.lower()
-    word = word.replace(u'È', u'è')
-
-    for i in range(0, len(words)):
-        if word in words[i]:
-            return i + 1
-
-    return -1
-
-def month_to_number(month):
-    return alinea_lexer.TOKEN_MONTH_NAMES.index(month) + 1
-
 def parse_section_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
 
+    debug(parent, tokens, i, 'parse_section_reference')
+
+    match = PHRASES.match_first(tokens, i, TYPE_SECTION_REFERENCE)
+    if not match:
+        return i
+
     node = create_node(parent, {
         'type': TYPE_SECTION_REFERENCE,
         'children': [],
     })
-
-    debug(parent, tokens, i, 'parse_section_reference')
-
-    # la section {order}
-    if tokens[i].lower() == u'la' and tokens[i + 2] == u'section':
-        node['order'] = parse_int(tokens[i + 4]);
-        i += 6
-    # de la section {order}
-    elif tokens[i] == u'de' and tokens[i + 2] == u'la' and tokens[i + 4] == u'section':
-        node['order'] = parse_int(tokens[i + 6]);
-        i += 8
-    else:
-        remove_node(parent, node)
-        return i
+    node['order'] = match.captures[0]
+    i = match.end
 
     i = parse_reference(tokens, i, node)
 
@@ -106,24 +201,18 @@ def parse_subsection_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
 
+    debug(parent, tokens, i, 'parse_subsection_reference')
+
+    match = PHRASES.match_first(tokens, i, TYPE_SUBSECTION_REFERENCE)
+    if not match:
+        return i
+
     node = create_node(parent, {
         'type': TYPE_SUBSECTION_REFERENCE,
         'children': [],
     })
-
-    debug(parent, tokens, i, 'parse_subsection_reference')
-
-    # de la sous-section {order}
-    if tokens[i].lower() == u'la' and tokens[i + 2] == u'sous-section':
-        node['order'] = parse_int(tokens[i + 4]);
-        i += 6
-    # de la sous-section {order}
-    elif tokens[i] == u'de' and tokens[i + 2] == u'la' and tokens[i + 4] == u'sous-section':
-        node['order'] = parse_int(tokens[i + 6]);
-        i += 8
-    else:
-        remove_node(parent, node)
-        return i
+    node['order'] = match.captures[0]
+    i = match.end
 
     i = parse_reference(tokens, i, node)
 
@@ -135,21 +224,18 @@ def parse_chapter_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
 
+    debug(parent, tokens, i, 'parse_chapter_reference')
+
+    match = PHRASES.match_first(tokens, i, TYPE_CHAPTER_REFERENCE)
+    if not match:
+        return i
+
     node = create_node(parent, {
         'type': TYPE_CHAPTER_REFERENCE,
         'children': [],
     })
-
-    debug(parent, tokens, i, 'parse_chapter_reference')
-
-    # du chapitre {order}
-    # le chapitre {order}
-    if tokens[i].lower() in [u'du', u'le'] and tokens[i + 2] == u'chapitre' and is_roman_number(tokens[i + 4]):
-        node['order'] = parse_roman_number(tokens[i + 4]);
-        i += 6
-    else:
-        remove_node(parent, node)
-        return i
+    node['order'] = match.captures[0]
+    i = match.end
 
     i = parse_reference(tokens, i, node)
 
@@ -161,21 +247,18 @@ def parse_paragraph_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
 
+    debug(parent, tokens, i, 'parse_paragraph_reference')
+
+    match = PHRASES.match_first(tokens, i, TYPE_PARAGRAPH_REFERENCE)
+    if not match:
+        return i
+
     node = create_node(parent, {
         'type': TYPE_PARAGRAPH_REFERENCE,
         'children': [],
     })
-
-    debug(parent, tokens, i, 'parse_paragraph_reference')
-
-    # du paragraphe {order}
-    # le paragraphe {order}
-    if tokens[i].lower() in [u'du', u'le'] and tokens[i + 2] == u'paragraphe':
-        node['order'] = parse_int(tokens[i + 4]);
-        i += 6
-    else:
-        remove_node(parent, node)
-        return i
+    node['order'] = match.captures[0]
+    i = match.end
 
     i = parse_reference(tokens, i, node)
 
@@ -204,8 +287,7 @@ def parse_subparagraph_definition(tokens, i, parent):
         if is_number(tokens[i]):
             node['order'] = parse_int(tokens[i])
         # ainsi rédigé
-        if (i + 2 < len(tokens) and tokens[i + 2].startswith(u'rédigé')
-            or (i + 4 < len(tokens) and tokens[i + 4].startswith(u'rédigé'))):
+        if tokens[i + 2].startswith(u'rédigé') or tokens[i + 4].startswith(u'rédigé'):
             i = alinea_lexer.skip_to_quote_start(tokens, i)
             i = parse_for_each(parse_quote, tokens, i, node)
     else:
@@ -217,6 +299,51 @@ def parse_subparagraph_definition(tokens, i, parent):
 
     return i
 
+def parse_law_type(tokens, i, fields):
+    if tokens[i] == u'organique':
+        fields['lawType'] = 'organic'
+        i += 2
+    return i
+
+def parse_law_date(tokens, i, fields):
+    if tokens[i] == u'du' and tokens[i + 4] in alinea_lexer.TOKEN_MONTH_NAMES:
+        fields['lawDate'] = tokens[i + 6] + u'-' + str(month_to_number(tokens[i + 4])) + u'-' + tokens[i + 2]
+        # skip {lawDate} and the following space
+        i += 7
+    return i
+
+# Parse the name of a law or an ordonnance: "la loi organique n° 2001-692 du 1er août 2001", for
+# parse_cached_name().
+def parse_law_name(tokens, i):
+    fields = {}
+
+    # de l'ordonnance
+    # l'ordonnance
+    if tokens[i + 2] == u'ordonnance' or tokens[i + 4] == u'ordonnance':
+        fields['lawType'] = 'ordonnance'
+        i = alinea_lexer.skip_to_token(tokens, i, u'ordonnance') + 2
+    # de la loi
+    # la loi
+    else:
+        i = alinea_lexer.skip_to_token(tokens, i, u'loi') + 2
+
+    i = parse_law_type(tokens, i, fields)
+
+    i = alinea_lexer.skip_to_token(tokens, i, u'n°') + 1
+    # If we didn't find the "n°" token, the reference is incomplete and we forget about it.
+    if i >= len(tokens):
+        return None
+    i = alinea_lexer.skip_spaces(tokens, i)
+    fields['id'] = tokens[i]
+    # skip {id} and the following space
+    i += 2
+
+    j = parse_law_date(tokens, i, fields)
+    # parse_law_date() reads "du" and the month, or only the token after the id
+    end = j if j > i else i + 5 if tokens[i] == u'du' else i + 1
+
+    return fields, j, end
+
 def parse_law_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
@@ -233,52 +360,34 @@ def parse_law_reference(tokens, i, parent):
 
     # de l'ordonnance
     # l'ordonnance
-    if i + 4 < len(tokens) and (tokens[i + 2] == u'ordonnance' or tokens[i + 4] == u'ordonnance'):
-        node['lawType'] = 'ordonnance'
-        i = alinea_lexer.skip_to_token(tokens, i, u'ordonnance') + 2
     # de la loi
     # la loi
-    elif i + 4 < len(tokens) and ((tokens[i] == u'la' and tokens[i + 2] == u'loi') or (tokens[i] == u'de' and tokens[i + 4] == u'loi')):
-        i = alinea_lexer.skip_to_token(tokens, i, u'loi') + 2
+    if (tokens[i + 2] == u'ordonnance' or tokens[i + 4] == u'ordonnance'
+        or (tokens[i] == u'la' and tokens[i + 2] == u'loi') or (tokens[i] == u'de' and tokens[i + 4] == u'loi')):
+        name = parse_cached_name(parse_law_name, tokens, i)
+        if name is None:
+            remove_node(parent, node)
+            return j
+        fields, i = name
+        node.update(fields)
     # de la même loi
-    elif tokens[i].lower() == u'de' and tokens[i + 2] == u'la' and tokens[i + 4] == u'même' and tokens[i + 6] == u'loi':
+    elif tokens.lowered[i] == u'de' and tokens[i + 2] == u'la' and tokens[i + 4] == u'même' and tokens[i + 6] == u'loi':
         i += 8
-        law_refs = filter_nodes(
-            get_root(parent),
-            lambda n: 'type' in n and n['type'] == TYPE_LAW_REFERENCE
-        )
+        law_refs = filter_nodes_of_type(get_root(parent), [TYPE_LAW_REFERENCE])
         # the lduralex.tree.one in order of traversal is the previous one in order of syntax
         # don't forget the current node is in the list too => -2 instead of -1
-        law_ref = copy_node(law_refs[-2], False)
+        law_ref = copy_node(get_back_reference(parent, law_refs, 2), False)
         push_node(parent, law_ref)
         remove_node(parent, node)
         node = law_ref
+        i = parse_law_type(tokens, i, node)
+        i = parse_law_date(tokens, i, node)
     else:
         remove_node(parent, node)
         return i
 
-    if i < len(tokens) and tokens[i] == u'organique':
-        node['lawType'] = 'organic'
-        i += 2
-
-    if node['id'] == '':
-        i = alinea_lexer.skip_to_token(tokens, i, u'n°') + 1
-        # If we didn't find the "n°" token, the reference is incomplete and we forget about it.
-        if i >= len(tokens):
-            remove_node(parent, node)
-            return j
-        i = alinea_lexer.skip_spaces(tokens, i)
-        node['id'] = tokens[i]
-        # skip {id} and the following space
-        i += 2
-
-    if i < len(tokens) and tokens[i] == u'du':
-        node['lawDate'] = tokens[i + 6] + u'-' + str(month_to_number(tokens[i + 4])) + u'-' + tokens[i + 2]
-        # skip {lawDate} and the following space
-        i += 7
-
     i = alinea_lexer.skip_spaces(tokens, i)
-    if i < len(tokens) and tokens[i] == u'modifiant':
+    if tokens[i] == u'modifiant':
         j = alinea_lexer.skip_to_token(tokens, i, 'code')
         if j < len(tokens):
             i = parse_code_reference(tokens, j, node)
@@ -302,14 +411,12 @@ def parse_multiplicative_adverb(tokens, i, node):
     if i >= len(tokens):
         return i
 
-    adverbs = alinea_lexer.TOKEN_MULTIPLICATIVE_ADVERBS.sort(key = lambda s: -len(s))
-    for adverb in alinea_lexer.TOKEN_MULTIPLICATIVE_ADVERBS:
-        if tokens[i].endswith(adverb):
-            node['is' + adverb.title()] = True;
-            # skip {multiplicativeAdverb} and the following space
-            i += 1
-            i = alinea_lexer.skip_spaces(tokens, i)
-            return i
+    adverb = get_multiplicative_adverb(tokens[i])
+    if adverb:
+        node['is' + adverb.title()] = True;
+        # skip {multiplicativeAdverb} and the following space
+        i += 1
+        i = alinea_lexer.skip_spaces(tokens, i)
     return i
 
 def parse_definition(tokens, i, parent):
@@ -350,8 +457,7 @@ def parse_sentence_definition(tokens, i, parent):
         # ainsi rédigé
         # est rédigé
         # est ainsi rédigé
-        if (i + 2 < len(tokens) and tokens[i + 2].startswith(u'rédigé')
-            or (i + 4 < len(tokens) and tokens[i + 4].startswith(u'rédigé'))):
+        if tokens[i + 2].startswith(u'rédigé') or tokens[i + 4].startswith(u'rédigé'):
             # we expect {count} definitions => {count} quotes
             # but they don't always match, so for now we parse all of the available contents
             # FIXME: issue a warning because the expected count doesn't match?
@@ -388,14 +494,14 @@ def parse_word_definition(tokens, i, parent):
     # le mot
     # les mots
     # des mots
-    if tokens[i].lower() in [u'le', u'les', u'des'] and tokens[i + 2].startswith(u'mot'):
+    if tokens.lowered[i] in [u'le', u'les', u'des'] and tokens[i + 2].startswith(u'mot'):
         i = alinea_lexer.skip_to_quote_start(tokens, i)
         i = parse_for_each(parse_quote, tokens, i, node)
         # i = alinea_lexer.skip_spaces(tokens, i)
     # le nombre
     # le chiffre
     # le taux
-    elif tokens[i].lower() == u'le' and tokens[i + 2] in [u'nombre', u'chiffre', u'taux']:
+    elif tokens.lowered[i] == u'le' and tokens[i + 2] in [u'nombre', u'chiffre', u'taux']:
         i = alinea_lexer.skip_to_quote_start(tokens, i)
         i = parse_quote(tokens, i, node)
     # "
@@ -404,7 +510,7 @@ def parse_word_definition(tokens, i, parent):
         i = alinea_lexer.skip_spaces(tokens, i)
     # la référence
     # les références
-    elif tokens[i].lower() in [u'la', u'les'] and tokens[i + 2].startswith(u'référence'):
+    elif tokens.lowered[i] in [u'la', u'les'] and tokens[i + 2].startswith(u'référence'):
         i = alinea_lexer.skip_to_quote_start(tokens, i)
         i = parse_quote(tokens, i, node)
     else:
@@ -425,10 +531,10 @@ def parse_article_definition(tokens, i, parent):
     debug(parent, tokens, i, 'parse_article_definition')
 
     # un article
-    if tokens[i].lower() == u'un' and tokens[i + 2] == u'article':
+    if tokens.lowered[i] == u'un' and tokens[i + 2] == u'article':
         i += 4
     # l'article
-    elif tokens[i].lower() == u'l' and tokens[i + 2] == u'article':
+    elif tokens.lowered[i] == u'l' and tokens[i + 2] == u'article':
         i += 4
     else:
         debug(parent, tokens, i, 'parse_article_definition none')
@@ -438,7 +544,7 @@ def parse_article_definition(tokens, i, parent):
     i = parse_article_id(tokens, i, node)
 
     i = alinea_lexer.skip_spaces(tokens, i)
-    if i < len(tokens) and tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
+    if tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
         i = alinea_lexer.skip_to_quote_start(tokens, i)
         i = parse_for_each(parse_quote, tokens, i, node)
 
@@ -459,8 +565,7 @@ def parse_alinea_definition(tokens, i, parent):
         # ainsi rédigé
         # est rédigé
         # est ainsi rédigé
-        if (i + 2 < len(tokens) and tokens[i + 2].startswith(u'rédigé')
-            or (i + 4 < len(tokens) and tokens[i + 4].startswith(u'rédigé'))):
+        if tokens[i + 2].startswith(u'rédigé') or tokens[i + 4].startswith(u'rédigé'):
             # we expect {count} definitions => {count} quotes
             # but they don't always match, so for now we parse all of the available contents
             # FIXME: issue a warning because the expected count doesn't match?
@@ -490,7 +595,7 @@ def parse_mention_definition(tokens, i, parent):
     })
     debug(parent, tokens, i, 'parse_mention_definition')
     # la mention
-    if tokens[i].lower() == u'la' and tokens[i + 2] == u'mention':
+    if tokens.lowered[i] == u'la' and tokens[i + 2] == u'mention':
         i += 4
     else:
         debug(parent, tokens, i, 'parse_mention_definition none')
@@ -511,25 +616,24 @@ def parse_header1_definition(tokens, i, parent):
 
     debug(parent, tokens, i, 'parse_header1_definition')
     # un {romanPartNumber}
-    if tokens[i].lower() == u'un' and is_roman_number(tokens[i + 2]):
+    if tokens.lowered[i] == u'un' and is_roman_number(tokens[i + 2]):
         node = create_node(parent, {
             'type': TYPE_HEADER1_DEFINITION,
             'order': parse_roman_number(tokens[i + 2]),
             })
         i += 4
         i = alinea_lexer.skip_spaces(tokens, i)
-        if i + 2 < len(tokens) and tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
+        if tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
             i = alinea_lexer.skip_to_quote_start(tokens, i)
             i = parse_quote(tokens, i, node)
     # des {start} à {end}
-    elif (tokens[i].lower() == u'des' and is_roman_number(tokens[i + 2])
+    elif (tokens.lowered[i] == u'des' and is_roman_number(tokens[i + 2])
         and tokens[i + 4] == u'à' and is_roman_number(tokens[i + 6])):
         start = parse_roman_number(tokens[i + 2])
         end = parse_roman_number(tokens[i + 6])
         i += 8
         # ainsi rédigés
-        if (i + 2 < len(tokens) and tokens[i + 2].startswith(u'rédigé')
-            or (i + 4 < len(tokens) and tokens[i + 4].startswith(u'rédigé'))):
+        if tokens[i + 2].startswith(u'rédigé') or tokens[i + 4].startswith(u'rédigé'):
             i = alinea_lexer.skip_to_quote_start(tokens, i + 4)
             i = parse_for_each(
                 parse_quote,
@@ -550,7 +654,7 @@ def parse_header2_definition(tokens, i, parent):
     debug(parent, tokens, i, 'parse_header2_definition')
 
     # un ... ° ({articlePartRef})
-    if tokens[i].lower() == u'un' and ''.join(tokens[i + 2:i + 5]) == u'...' and tokens[i + 6] == u'°':
+    if tokens.lowered[i] == u'un' and ''.join(tokens[i + 2:i + 5]) == u'...' and tokens[i + 6] == u'°':
         node = create_node(parent, {
             'type': TYPE_HEADER2_DEFINITION,
             })
@@ -562,7 +666,7 @@ def parse_header2_definition(tokens, i, parent):
             i = alinea_lexer.skip_to_quote_start(tokens, i + 4)
             i = parse_quote(tokens, i, node)
     # un {order}° ({orderLetter}) ({multiplicativeAdverb}) ({articlePartRef})
-    elif tokens[i].lower() == u'un' and re.compile(u'\d+°').match(tokens[i + 2]):
+    elif tokens.lowered[i] == u'un' and re.compile(u'\d+°').match(tokens[i + 2]):
         node = create_node(parent, {
             'type': TYPE_HEADER2_DEFINITION,
             })
@@ -574,18 +678,17 @@ def parse_header2_definition(tokens, i, parent):
         i = parse_multiplicative_adverb(tokens, i, node)
         i = parse_article_part_reference(tokens, i, node)
         i = alinea_lexer.skip_spaces(tokens, i)
-        if i < len(tokens) and tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
+        if tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
             i = alinea_lexer.skip_to_quote_start(tokens, i + 4)
             i = parse_quote(tokens, i, node)
     # des {start}° à {end}°
-    elif (tokens[i].lower() == u'des' and re.compile(u'\d+°').match(tokens[i + 2])
+    elif (tokens.lowered[i] == u'des' and re.compile(u'\d+°').match(tokens[i + 2])
         and tokens[i + 4] == u'à' and re.compile(u'\d+°').match(tokens[i + 6])):
         start = parse_int(tokens[i + 2])
         end = parse_int(tokens[i + 6])
         i += 8
         # ainsi rédigés
-        if (i + 2 < len(tokens) and tokens[i + 2].startswith(u'rédigé')
-            or (i + 4 < len(tokens) and tokens[i + 4].startswith(u'rédigé'))):
+        if tokens[i + 2].startswith(u'rédigé') or tokens[i + 4].startswith(u'rédigé'):
             i = alinea_lexer.skip_to_quote_start(tokens, i + 4)
             i = parse_for_each(
                 parse_quote,
@@ -606,25 +709,24 @@ def parse_header3_definition(tokens, i, parent):
     debug(parent, tokens, i, 'parse_header3_definition')
 
     # un {orderLetter}
-    if tokens[i].lower() == u'un' and re.compile(u'^[a-z]$').match(tokens[i + 2]):
+    if tokens.lowered[i] == u'un' and re.compile(u'^[a-z]$').match(tokens[i + 2]):
         node = create_node(parent, {
             'type': TYPE_HEADER3_DEFINITION,
             'order': ord(str(tokens[i + 2])) - ord('a') + 1,
             })
         i += 4
         i = alinea_lexer.skip_spaces(tokens, i)
-        if i < len(tokens) and tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
+        if tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
             i = alinea_lexer.skip_to_quote_start(tokens, i + 4)
             i = parse_quote(tokens, i, node)
     # des {orderLetter} à {orderLetter}
-    elif (tokens[i].lower() == u'des' and re.compile(u'^[a-z]$').match(tokens[i + 2])
+    elif (tokens.lowered[i] == u'des' and re.compile(u'^[a-z]$').match(tokens[i + 2])
         and tokens[i + 4] == u'à' and re.compile(u'^[a-z]$').match(tokens[i + 6])):
         start = ord(str(tokens[i + 2])) - ord('a') + 1
         end = ord(str(tokens[i + 6])) - ord('a') + 1
         i += 8
         # ainsi rédigés
-        if (i + 2 < len(tokens) and tokens[i + 2].startswith(u'rédigé')
-            or (i + 4 < len(tokens) and tokens[i + 4].startswith(u'rédigé'))):
+        if tokens[i + 2].startswith(u'rédigé') or tokens[i + 4].startswith(u'rédigé'):
             i = alinea_lexer.skip_to_quote_start(tokens, i + 4)
             i = parse_for_each(
                 parse_quote,
@@ -642,12 +744,12 @@ def parse_article_id(tokens, i, node):
     node['id'] = ''
 
     # article {articleId}
-    if i < len(tokens) and tokens[i] == 'L' and tokens[i + 1] == '.':
-        while not re.compile('\d+(-\d+)?').match(tokens[i]):
+    if tokens[i] == 'L' and tokens[i + 1] == '.':
+        while i < len(tokens) and not re.compile('\d+(-\d+)?').match(tokens[i]):
             node['id'] += tokens[i]
             i += 1
 
-    if i < len(tokens) and re.compile('\d+(-\d+)?').match(tokens[i]):
+    if re.compile('\d+(-\d+)?').match(tokens[i]):
         node['id'] += tokens[i]
         # skip {articleId} and the following space
         i += 1
@@ -655,7 +757,7 @@ def parse_article_id(tokens, i, node):
 
     # {articleId} {articleLetter}
     # FIXME: handle the {articleLetter}{multiplicativeAdverb} case?
-    if i < len(tokens) and re.compile('^[A-Z]$').match(tokens[i]):
+    if re.compile('^[A-Z]$').match(tokens[i]):
         node['id'] += ' ' + tokens[i]
         # skip {articleLetter} and the following space
         i += 1
@@ -672,28 +774,27 @@ def parse_title_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
 
-    node = create_node(parent, {
-        'type': TYPE_TITLE_REFERENCE,
-        'children': [],
-    })
-
     debug(parent, tokens, i, 'parse_title_reference')
 
+    # the position and scope are only set on the node once the phrase is found
+    fields = {}
     j = i
-    i = parse_position(tokens, i, node)
-    i = parse_scope(tokens, i, node)
+    i = parse_position(tokens, i, fields)
+    i = parse_scope(tokens, i, fields)
 
-    # le titre {order}
-    # du titre {order}
-    if tokens[i].lower() in [u'le', u'du'] and tokens[i + 2] == u'titre' and is_roman_number(tokens[i + 4]):
-        node['order'] = parse_roman_number(tokens[i + 4])
-        i += 6
-        i = parse_multiplicative_adverb(tokens, i, node)
-    else:
+    match = PHRASES.match_first(tokens, i, TYPE_TITLE_REFERENCE)
+    if not match:
         debug(parent, tokens, i, 'parse_title_reference none')
-        remove_node(parent, node)
         return j
 
+    node = create_node(parent, {
+        'type': TYPE_TITLE_REFERENCE,
+        'children': [],
+    })
+    node.update(fields)
+    node['order'] = match.captures[0]
+    i = parse_multiplicative_adverb(tokens, match.end, node)
+
     i = parse_reference(tokens, i, node)
 
     debug(parent, tokens, i, 'parse_title_reference end')
@@ -704,23 +805,20 @@ def parse_title_definition(tokens, i, parent):
     if i >= len(tokens):
         return i
 
-    node = create_node(parent, {
-        'type': TYPE_TITLE_DEFINITION,
-        'children': [],
-    })
-
     debug(parent, tokens, i, 'parse_title_definition')
 
-    # un titre {order}
-    if tokens[i].lower() == u'un' and tokens[i + 2] == u'titre' and is_roman_number(tokens[i + 4]):
-        node['order'] = parse_roman_number(tokens[i + 4])
-        i += 6
-        i = parse_multiplicative_adverb(tokens, i, node)
-    else:
+    match = PHRASES.match_first(tokens, i, TYPE_TITLE_DEFINITION)
+    if not match:
         debug(parent, tokens, i, 'parse_title_definition none')
-        remove_node(parent, node)
         return i
 
+    node = create_node(parent, {
+        'type': TYPE_TITLE_DEFINITION,
+        'children': [],
+    })
+    node['order'] = match.captures[0]
+    i = parse_multiplicative_adverb(tokens, match.end, node)
+
     i = alinea_lexer.skip_spaces(tokens, i)
     if tokens[i] == u'ainsi' and tokens[i + 2] == u'rédigé':
         i = alinea_lexer.skip_to_quote_start(tokens, i)
@@ -734,32 +832,27 @@ def parse_code_part_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
 
-    node = create_node(parent, {
-        'type': TYPE_CODE_PART_REFERENCE,
-        'children': [],
-    })
-
     debug(parent, tokens, i, 'parse_code_part_reference')
 
+    fields = {}
     j = i
-    i = parse_position(tokens, i, node)
-    i = parse_scope(tokens, i, node)
+    i = parse_position(tokens, i, fields)
+    i = parse_scope(tokens, i, fields)
 
-    # la {order} partie [{codeReference}]
-    if tokens[i] == u'la' and is_number_word(tokens[i + 2]) and tokens[i + 4] == u'partie':
-        node['order'] = word_to_number(tokens[i + 2])
-        i += 6
-        i = parse_code_reference(tokens, i, node)
-    # de la {order} partie [{codeReference}]
-    elif tokens[i] == u'de' and tokens[i + 2] == u'la' and is_number_word(tokens[i + 4]) and tokens[i + 6] == u'partie':
-        node['order'] = word_to_number(tokens[i + 4])
-        i += 8
-        i = parse_code_reference(tokens, i, node)
-    else:
+    # [de] la {order} partie [{codeReference}]
+    match = PHRASES.match_first(tokens, i, TYPE_CODE_PART_REFERENCE)
+    if not match:
         debug(parent, tokens, i, 'parse_code_part_reference none')
-        remove_node(parent, node)
         return j
 
+    node = create_node(parent, {
+        'type': TYPE_CODE_PART_REFERENCE,
+        'children': [],
+    })
+    node.update(fields)
+    node['order'] = match.captures[0]
+    i = parse_code_reference(tokens, match.end, node)
+
     debug(parent, tokens, i, 'parse_code_part_reference end')
 
     return i
@@ -768,27 +861,26 @@ def parse_book_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
 
-    node = create_node(parent, {
-        'type': TYPE_BOOK_REFERENCE,
-        'children': [],
-    })
-
     debug(parent, tokens, i, 'parse_book_reference')
 
+    fields = {}
     j = i
-    i = parse_position(tokens, i, node)
-    i = parse_scope(tokens, i, node)
+    i = parse_position(tokens, i, fields)
+    i = parse_scope(tokens, i, fields)
 
-    # le livre {order}
-    # du livre {order}
-    if tokens[i].lower() in [u'le', u'du'] and tokens[i + 2] == u'livre' and is_roman_number(tokens[i + 4]):
-        node['order'] = parse_roman_number(tokens[i + 4])
-        i += 6
-    else:
+    match = PHRASES.match_first(tokens, i, TYPE_BOOK_REFERENCE)
+    if not match:
         debug(parent, tokens, i, 'parse_book_reference none')
-        remove_node(parent, node)
         return j
 
+    node = create_node(parent, {
+        'type': TYPE_BOOK_REFERENCE,
+        'children': [],
+    })
+    node.update(fields)
+    node['order'] = match.captures[0]
+    i = match.end
+
     i = parse_reference(tokens, i, node)
 
     debug(parent, tokens, i, 'parse_book_reference end')
@@ -821,12 +913,9 @@ def parse_bill_article_reference(tokens, i, parent):
     # cet article
     if tokens[i] == u'cet' and tokens[i + 2] == u'article':
         i += 4
-        article_refs = filter_nodes(
-            get_root(parent),
-            lambda n: 'type' in n and n['type'] == TYPE_BILL_ARTICLE_REFERENCE
-        )
+        article_refs = filter_nodes_of_type(get_root(parent), [TYPE_BILL_ARTICLE_REFERENCE])
         # the last one in order of traversal is the previous one in order of syntax
-        article_ref = copy_node(article_refs[-1])
+        article_ref = copy_node(get_back_reference(parent, article_refs))
         push_node(parent, article_ref)
 
     debug(parent, tokens, i, 'parse_bill_article_reference end')
@@ -848,18 +937,18 @@ def parse_article_reference(tokens, i, parent):
     i = parse_scope(tokens, i, node)
     # de l'article
     # à l'article
-    if tokens[i].lower() in [u'de', u'à'] and tokens[i + 2] == u'l' and tokens[i + 4] == u'article':
+    if tokens.lowered[i] in [u'de', u'à'] and tokens[i + 2] == u'l' and tokens[i + 4] == u'article':
         i += 5
         i = alinea_lexer.skip_spaces(tokens, i)
         i = parse_article_id(tokens, i, node)
     # l'article
-    elif tokens[i].lower() == u'l' and tokens[i + 2].startswith(u'article'):
+    elif tokens.lowered[i] == u'l' and tokens[i + 2].startswith(u'article'):
         i += 3
         i = alinea_lexer.skip_spaces(tokens, i)
         i = parse_article_id(tokens, i, node)
     # les articles
     # des articles
-    elif tokens[i].lower() in [u'des', u'les'] and tokens[i + 2].startswith(u'article'):
+    elif tokens.lowered[i] in [u'des', u'les'] and tokens[i + 2].startswith(u'article'):
         i += 3
         i = alinea_lexer.skip_spaces(tokens, i)
         i = parse_article_id(tokens, i, node)
@@ -902,21 +991,18 @@ def parse_article_reference(tokens, i, parent):
     # elif tokens[i] == u'un' and tokens[i + 2] == u'article':
     #     i += 4
     # Article {articleNumber}
-    elif tokens[i].lower().startswith(u'article'):
+    elif tokens.lowered[i].startswith(u'article'):
         i += 1
         i = alinea_lexer.skip_spaces(tokens, i)
         i = parse_article_id(tokens, i, node)
     # le même article
     # du même article
-    elif tokens[i].lower() in [u'le', u'du'] and tokens[i + 2] == u'même' and tokens[i + 4] == u'article':
+    elif tokens.lowered[i] in [u'le', u'du'] and tokens[i + 2] == u'même' and tokens[i + 4] == u'article':
         i += 6
-        article_refs = filter_nodes(
-            get_root(parent),
-            lambda n: 'type' in n and n['type'] == TYPE_ARTICLE_REFERENCE
-        )
+        article_refs = filter_nodes_of_type(get_root(parent), [TYPE_ARTICLE_REFERENCE])
         # the last one in order of traversal is the previous one in order of syntax
         # don't forget the current node is in the list too => -2 instead of -1
-        article_ref = copy_node(article_refs[-2])
+        article_ref = copy_node(get_back_reference(parent, article_refs, 2))
         push_node(parent, article_ref)
         remove_node(parent, node)
     else:
@@ -951,27 +1037,14 @@ def parse_position(tokens, i, node):
     if i >= len(tokens):
         return i
 
-    j = i
-    # i = alinea_lexer.skip_to_next_word(tokens, i)
-
     # après
-    if tokens[i].lower() == u'après':
-        node['position'] = 'after'
-        i += 2
     # avant
-    elif tokens[i].lower() == u'avant':
-        node['position'] = 'before'
-        i += 2
     # au début
-    elif tokens[i].lower() == u'au' and tokens[i + 2] == u'début':
-        node['position'] = 'beginning'
-        i += 4
     # à la fin du {article}
-    elif tokens[i].lower() == u'à' and tokens[i + 2] == u'la' and tokens[i + 4] == u'fin':
-        node['position'] = 'end'
-        i += 6
-    else:
-        return j
+    for match in PHRASES.match(tokens, i):
+        if match.name in ['after', 'before', 'beginning', 'end']:
+            node['position'] = match.name
+            return match.end
 
     return i
 
@@ -990,71 +1063,68 @@ def parse_alinea_reference(tokens, i, parent):
     # le {order} alinéa
     # du {order} alinéa
     # au {order} alinéa
-    if tokens[i].lower() in [u'du', u'le', u'au'] and is_number_word(tokens[i + 2]) and tokens[i + 4].startswith(u'alinéa'):
+    if tokens.lowered[i] in [u'du', u'le', u'au'] and is_number_word(tokens[i + 2]) and tokens[i + 4].startswith(u'alinéa'):
         node['order'] = word_to_number(tokens[i + 2])
         i += 6
-    # l'alinéa
-    elif tokens[i].lower() == u'l' and tokens[i + 2].startswith(u'alinéa'):
+    # l'alinéa {order}
+    elif tokens.lowered[i] == u'l' and tokens[i + 2].startswith(u'alinéa') and is_number(tokens[i + 4]):
         node['order'] = parse_int(tokens[i + 4])
         i += 6
     # de l'alinéa
-    elif tokens[i] == 'de' and tokens[i + 2].lower() == [u'l'] and tokens[i + 4].startswith(u'alinéa'):
+    elif tokens[i] == 'de' and tokens.lowered[i + 2] == [u'l'] and tokens[i + 4].startswith(u'alinéa'):
         i += 6
     # {order} {partType}
-    elif is_number_word(tokens[i].lower()) and tokens[i + 2].startswith(u'alinéa'):
+    elif is_number_word(tokens.lowered[i]) and tokens[i + 2].startswith(u'alinéa'):
         node['order'] = word_to_number(tokens[i])
         i += 4
     # aux {count} {position} alinéas
     # elif tokens[i].lowers() == u'aux' and is_number_word(tokens[i + 2]) and tokens[i + 6] == u'alinéas':
     # le même alinéa
-    elif tokens[i].lower() in [u'le'] and tokens[i + 2] == u'même' and tokens[i + 4] == u'alinéa':
+    elif tokens.lowered[i] in [u'le'] and tokens[i + 2] == u'même' and tokens[i + 4] == u'alinéa':
         i += 6
-        alinea_refs = filter_nodes(
-            get_root(parent),
-            lambda n: 'type' in n and n['type'] == TYPE_ALINEA_REFERENCE
-        )
+        alinea_refs = filter_nodes_of_type(get_root(parent), [TYPE_ALINEA_REFERENCE])
         # the lduralex.tree.one in order of traversal is the previous one in order of syntax
         # don't forget the current node is in the list too => -2 instead of -1
-        alinea_ref = copy_node(alinea_refs[-2])
+        alinea_ref = copy_node(get_back_reference(parent, alinea_refs, 2))
         push_node(parent, alinea_ref)
         remove_node(parent, node)
     # du dernier alinéa
     # au dernier alinéa
     # le dernier alinéa
-    elif tokens[i].lower() in [u'du', u'au', u'le'] and tokens[i + 2] == u'dernier' and tokens[i + 4] == u'alinéa':
+    elif tokens.lowered[i] in [u'du', u'au', u'le'] and tokens[i + 2] == u'dernier' and tokens[i + 4] == u'alinéa':
         node['order'] = -1
         i += 6
     # à l'avant dernier alinéa
-    elif tokens[i].lower() == u'à' and tokens[i + 4] == u'avant' and tokens[i + 6] == u'dernier' and tokens[i + 8] == u'alinéa':
+    elif tokens.lowered[i] == u'à' and tokens[i + 4] == u'avant' and tokens[i + 6] == u'dernier' and tokens[i + 8] == u'alinéa':
         node['order'] = -2
         i += 10
     # l'avant-dernier alinéa
-    elif tokens[i].lower() == u'l' and tokens[i + 2] == u'avant-dernier' and tokens[i + 4] == u'alinéa':
+    elif tokens.lowered[i] == u'l' and tokens[i + 2] == u'avant-dernier' and tokens[i + 4] == u'alinéa':
         node['order'] = -2
         i += 6
     # à l'avant-dernier alinéa
-    elif tokens[i].lower() == u'à' and tokens[i + 2] == u'l' and tokens[i + 4] == u'avant-dernier' and tokens[i + 6] == u'alinéa':
+    elif tokens.lowered[i] == u'à' and tokens[i + 2] == u'l' and tokens[i + 4] == u'avant-dernier' and tokens[i + 6] == u'alinéa':
         node['order'] = -2
         i += 10
     # alinéa {order}
-    elif tokens[i].lower() == u'alinéa' and is_number(tokens[i + 2]):
+    elif tokens.lowered[i] == u'alinéa' and is_number(tokens[i + 2]):
         node['order'] = parse_int(tokens[i + 2])
         i += 4
-    # les alinéas
-    # des alinéas
-    elif tokens[i].lower() in [u'les', u'des'] and tokens[i + 2] == u'alinéas':
+    # les alinéas {order}, {order} et {order}
+    # des alinéas {order}, {order} et {order}
+    elif tokens.lowered[i] in [u'les', u'des'] and tokens[i + 2] == u'alinéas' and is_number(tokens[i + 4]):
         node['order'] = parse_int(tokens[i + 4])
         i += 5
         i = alinea_lexer.skip_spaces(tokens, i)
         nodes = []
-        while tokens[i] == u',':
+        while tokens[i] == u',' and is_number(tokens[i + 2]):
             nodes.append(create_node(parent, {
                 'type': TYPE_ALINEA_REFERENCE,
                 'order': parse_int(tokens[i + 2])
             }))
             i += 3
             i = alinea_lexer.skip_spaces(tokens, i)
-        if tokens[i] == u'et':
+        if tokens[i] == u'et' and is_number(tokens[i + 2]):
             i += 2
             nodes.append(create_node(parent, {
                 'type': TYPE_ALINEA_REFERENCE,
@@ -1093,27 +1163,27 @@ def parse_sentence_reference(tokens, i, parent):
     i = parse_scope(tokens, i, node)
     # une phrase
     # la phrase
-    if tokens[i].lower() in [u'la', u'une'] and tokens[i + 2] == 'phrase':
+    if tokens.lowered[i] in [u'la', u'une'] and tokens[i + 2] == 'phrase':
         i += 4
     # de la {partNumber} phrase
-    elif tokens[i].lower() == u'de' and tokens[i + 2] == u'la' and is_number_word(tokens[i + 4]) and tokens[i + 6] == u'phrase':
+    elif tokens.lowered[i] == u'de' and tokens[i + 2] == u'la' and is_number_word(tokens[i + 4]) and tokens[i + 6] == u'phrase':
         node['order'] = word_to_number(tokens[i + 4])
         i += 8
     # la {partNumber} phrase
-    elif tokens[i].lower() == u'la' and is_number_word(tokens[i + 2]) and tokens[i + 4] == u'phrase':
+    elif tokens.lowered[i] == u'la' and is_number_word(tokens[i + 2]) and tokens[i + 4] == u'phrase':
         node['order'] = word_to_number(tokens[i + 2])
         i += 6
     # à la {partNumber} phrase
     # À la {partNumber} phrase
-    elif (tokens[i] == u'à' or tokens[i] == u'À') and tokens[i + 2].lower() == u'la' and is_number_word(tokens[i + 4]) and tokens[i + 6] == u'phrase':
+    elif (tokens[i] == u'à' or tokens[i] == u'À') and tokens.lowered[i + 2] == u'la' and is_number_word(tokens[i + 4]) and tokens[i + 6] == u'phrase':
         node['order'] = word_to_number(tokens[i + 4])
         i += 8
     # la dernière phrase
-    elif tokens[i].lower() == u'la' and tokens[i + 2] == u'dernière' and tokens[i + 4] == u'phrase':
+    elif tokens.lowered[i] == u'la' and tokens[i + 2] == u'dernière' and tokens[i + 4] == u'phrase':
         node['order'] = -1
         i += 6
     # les {n} première phrases
-    elif tokens[i].lower() == u'les' and is_number_word(tokens[i + 2]) and tokens[i + 4] == u'premières' and tokens[i + 6] == u'phrases':
+    elif tokens.lowered[i] == u'les' and is_number_word(tokens[i + 2]) and tokens[i + 4] == u'premières' and tokens[i + 6] == u'phrases':
         node['order'] = [0, word_to_number(tokens[i + 2])]
         i += 8
     else:
@@ -1134,7 +1204,7 @@ def fix_incomplete_references(parent, node):
         for child in parent['children']:
             if child['type'] == TYPE_INCOMPLETE_REFERENCE:
                 # set the actual reference type
-                child['type'] = node['type']
+                set_node_type(child, node['type'])
                 # copy all the child of the fully qualified reference node
                 for c in node['children']:
                     push_node(child, copy_node(c))
@@ -1143,13 +1213,11 @@ def parse_back_reference(tokens, i, parent):
     if i >= len(tokens):
         return i
     if tokens[i] == u'Il':
-        refs = filter_nodes(
-            get_root(parent),
-            lambda n: is_reference(n)
-        )
+        refs = filter_nodes_of_type(get_root(parent), TYPE_REFERENCE)
+        depth = get_node_depth(parent)
         for j in reversed(range(0, len(refs))):
-            if get_node_depth(refs[j]) <= get_node_depth(parent):
-                push_node(parent, copy_node(refs[j]))
+            if get_node_depth(refs[j]) <= depth:
+                push_node(parent, copy_node(resolve_back_reference(parent, refs[j])))
                 break
         i += 2
     return i
@@ -1163,10 +1231,10 @@ def parse_incomplete_reference(tokens, i, parent):
     j = i
     i = parse_position(tokens, i, node)
     i = parse_scope(tokens, i, node)
-    if tokens[i].lower() == u'à' and tokens[i + 2] in [u'le', u'la'] and is_number_word(tokens[i + 4]):
+    if tokens.lowered[i] == u'à' and tokens[i + 2] in [u'le', u'la'] and is_number_word(tokens[i + 4]):
         node['order'] = word_to_number(tokens[i + 4])
         i += 6
-    elif tokens[i].lower() in [u'le', u'la'] and is_number_word(tokens[i + 2]):
+    elif tokens.lowered[i] in [u'le', u'la'] and is_number_word(tokens[i + 2]):
         node['order'] = word_to_number(tokens[i + 2])
         i += 4
     elif j == i:
@@ -1189,7 +1257,7 @@ def parse_word_reference(tokens, i, parent):
     # le mot
     # les mots
     # des mots
-    if tokens[i].lower() in [u'le', u'les', u'des'] and tokens[i + 2].startswith(u'mot'):
+    if tokens.lowered[i] in [u'le', u'les', u'des'] and tokens[i + 2].startswith(u'mot'):
         i = alinea_lexer.skip_to_quote_start(tokens, i)
         i = parse_for_each(parse_quote, tokens, i, node)
         i = alinea_lexer.skip_to_next_word(tokens, i)
@@ -1197,12 +1265,12 @@ def parse_word_reference(tokens, i, parent):
     # le nombre
     # le chiffre
     # le taux
-    elif tokens[i].lower() == u'le' and tokens[i + 2] in [u'nombre', u'chiffre', u'taux']:
+    elif tokens.lowered[i] == u'le' and tokens[i + 2] in [u'nombre', u'chiffre', u'taux']:
         i = alinea_lexer.skip_to_quote_start(tokens, i)
         i = parse_quote(tokens, i, node)
     # la référence
     # les références
-    elif tokens[i].lower() in [u'la', u'les'] and tokens[i + 2].startswith(u'référence'):
+    elif tokens.lowered[i] in [u'la', u'les'] and tokens[i + 2].startswith(u'référence'):
         i = alinea_lexer.skip_to_quote_start(tokens, i)
         i = parse_quote(tokens, i, node)
     else:
@@ -1227,7 +1295,7 @@ def parse_header2_reference(tokens, i, parent):
     # le {order}° ({multiplicativeAdverb}) ({articlePartRef})
     # du {order}° ({multiplicativeAdverb}) ({articlePartRef})
     # au {order}° ({multiplicativeAdverb}) ({articlePartRef})
-    if tokens[i].lower() in [u'le', u'du', u'au'] and re.compile(u'\d+°').match(tokens[i + 2]):
+    if tokens.lowered[i] in [u'le', u'du', u'au'] and re.compile(u'\d+°').match(tokens[i + 2]):
         node['order'] = parse_int(tokens[i + 2])
         i += 4
         i = parse_multiplicative_adverb(tokens, i, node)
@@ -1235,7 +1303,7 @@ def parse_header2_reference(tokens, i, parent):
     # le même {order}° ({multiplicativeAdverb}) ({articlePartRef})
     # du même {order}° ({multiplicativeAdverb}) ({articlePartRef})
     # au même {order}° ({multiplicativeAdverb}) ({articlePartRef})
-    elif tokens[i].lower() in [u'le', u'du', u'au'] and tokens[i + 2] == u'même' and re.compile(u'\d+°').match(tokens[i + 4]):
+    elif tokens.lowered[i] in [u'le', u'du', u'au'] and tokens[i + 2] == u'même' and re.compile(u'\d+°').match(tokens[i + 4]):
         node['order'] = parse_int(tokens[i + 4])
         i += 6
         i = parse_multiplicative_adverb(tokens, i, node)
@@ -1263,7 +1331,7 @@ def parse_header3_reference(tokens, i, parent):
     # le {orderLetter} ({articlePartRef})
     # du {orderLetter} ({articlePartRef})
     # au {orderLetter} ({articlePartRef})
-    if tokens[i].lower() in [u'le', u'du', u'au'] and re.compile(u'^[a-z]$').match(tokens[i + 2]):
+    if tokens.lowered[i] in [u'le', u'du', u'au'] and re.compile(u'^[a-z]$').match(tokens[i + 2]):
         node['order'] = ord(str(tokens[i + 2])) - ord('a') + 1
         i += 4
         i = parse_multiplicative_adverb(tokens, i, node)
@@ -1271,7 +1339,7 @@ def parse_header3_reference(tokens, i, parent):
     # le même {orderLetter} ({articlePartRef})
     # du même {orderLetter} ({articlePartRef})
     # au même {orderLetter} ({articlePartRef})
-    elif tokens[i].lower() in [u'le', u'du', u'au'] and tokens[i + 2] == u'même' and re.compile(u'^[a-z]$').match(tokens[i + 4]):
+    elif tokens.lowered[i] in [u'le', u'du', u'au'] and tokens[i + 2] == u'même' and re.compile(u'^[a-z]$').match(tokens[i + 4]):
         node['order'] = ord(str(tokens[i + 4])) - ord('a') + 1
         i += 6
         i = parse_multiplicative_adverb(tokens, i, node)
@@ -1297,7 +1365,7 @@ def parse_header1_reference(tokens, i, parent):
     # le {romanPartNumber}
     # du {romanPartNumber}
     # un {romanPartNumber}
-    if tokens[i].lower() in [u'le', u'du', u'un'] and is_roman_number(tokens[i + 2]):
+    if tokens.lowered[i] in [u'le', u'du', u'un'] and is_roman_number(tokens[i + 2]):
         node['order'] = parse_roman_number(tokens[i + 2])
         i += 4
     else:
@@ -1318,6 +1386,9 @@ def parse_article_part_reference(tokens, i, parent):
 
     # i = alinea_lexer.skip_to_next_word(tokens, i)
 
+    if not get_reference_starts(tokens)[i]:
+        return i
+
     i = parse_one_of(
         [
             parse_alinea_reference,
@@ -1361,9 +1432,12 @@ def parse_quote(tokens, i, parent):
         remove_node(parent, node)
         return i
 
-    while i < len(tokens) and tokens[i] != alinea_lexer.TOKEN_DOUBLE_QUOTE_CLOSE and tokens[i] != alinea_lexer.TOKEN_NEW_LINE:
-        node['words'] += tokens[i]
-        i += 1
+    j = min(
+        alinea_lexer.skip_to_token(tokens, i, alinea_lexer.TOKEN_DOUBLE_QUOTE_CLOSE),
+        alinea_lexer.skip_to_token(tokens, i, alinea_lexer.TOKEN_NEW_LINE)
+    )
+    node['words'] += ''.join(tokens[i:j])
+    i = j
     node['words'] = node['words'].strip()
 
     # skipalinea_lexer.TOKEN_DOUBLE_QUOTE_CLOSE
@@ -1379,6 +1453,11 @@ def parse_edit(tokens, i, parent):
     if i >= len(tokens):
         return i
 
+    # a line with no edit is tried again by the header of each level (cf parse_header1()): the index the edit rules
+    # failed at is kept, so they only run once for each line segment
+    if i in tokens.edit_failures:
+        return tokens.edit_failures[i]
+
     node = create_node(parent, {
         'type': TYPE_EDIT
     })
@@ -1403,6 +1482,7 @@ def parse_edit(tokens, i, parent):
     if len(node['children']) == 0 and tokens[i] != 'Est' and tokens[i] != 'Sont':
         remove_node(parent, node)
         debug(parent, tokens, i, 'parse_edit none')
+        tokens.edit_failures[r] = i
         return i
     # i = r
 
@@ -1410,6 +1490,7 @@ def parse_edit(tokens, i, parent):
     if i + 2 >= len(tokens):
         remove_node(parent, node)
         debug(parent, tokens, i, 'parse_edit eof')
+        tokens.edit_failures[r] = r
         return r
 
     # sont supprimés
@@ -1420,14 +1501,14 @@ def parse_edit(tokens, i, parent):
     # est abrogée
     # sont abrogés
     # sont abrogées
-    if i + 2 < len(tokens) and (tokens[i + 2].startswith(u'supprimé') or tokens[i + 2].startswith(u'abrogé')):
+    if tokens[i + 2].startswith(u'supprimé') or tokens[i + 2].startswith(u'abrogé'):
         node['editType'] = 'delete'
         i = alinea_lexer.skip_to_end_of_line(tokens, i)
     # est ainsi rédigé
     # est ainsi rédigée
     # est ainsi modifié
     # est ainsi modifiée
-    elif i + 4 < len(tokens) and (tokens[i + 4].startswith(u'rédigé') or tokens[i + 4].startswith(u'modifié')):
+    elif tokens[i + 4].startswith(u'rédigé') or tokens[i + 4].startswith(u'modifié'):
         node['editType'] = 'edit'
         i = alinea_lexer.skip_to_end_of_line(tokens, i)
         i = alinea_lexer.skip_spaces(tokens, i)
@@ -1436,19 +1517,19 @@ def parse_edit(tokens, i, parent):
     # est remplacée par
     # sont remplacés par
     # sont remplacées par
-    elif i + 2 < len(tokens) and (tokens[i + 2].startswith(u'remplacé')):
+    elif tokens[i + 2].startswith(u'remplacé'):
         node['editType'] = 'replace'
         i += 6
         i = parse_definition(tokens, i, node)
         i = alinea_lexer.skip_to_end_of_line(tokens, i)
     # remplacer
-    elif tokens[i].lower() == u'remplacer':
+    elif tokens.lowered[i] == u'remplacer':
         node['editType'] = 'replace'
         i += 2
         # i = parse_definition(tokens, i, node)
         i = parse_reference(tokens, i, node)
         i = alinea_lexer.skip_to_end_of_line(tokens, i)
-        if tokens[i].lower() == 'par':
+        if tokens.lowered[i] == 'par':
             i += 2
             i = parse_definition(tokens, i, node)
             i = alinea_lexer.skip_to_end_of_line(tokens, i)
@@ -1460,19 +1541,19 @@ def parse_edit(tokens, i, parent):
     # est ajoutée
     # sont ajoutés
     # sont ajoutées
-    elif i + 2 < len(tokens) and (tokens[i + 2].startswith(u'inséré') or tokens[i + 2].startswith(u'ajouté')):
+    elif tokens[i + 2].startswith(u'inséré') or tokens[i + 2].startswith(u'ajouté'):
         node['editType'] = 'add'
         i += 4
         i = parse_definition(tokens, i, node)
         i = alinea_lexer.skip_to_end_of_line(tokens, i)
     # est ainsi rétabli
-    elif i + 4 < len(tokens) and tokens[i + 4].startswith(u'rétabli'):
+    elif tokens[i + 4].startswith(u'rétabli'):
         node['editType'] = 'add'
         i = alinea_lexer.skip_to_end_of_line(tokens, i)
         i = alinea_lexer.skip_spaces(tokens, i)
         i = parse_definition(tokens, i, node)
     # est complété par
-    elif i + 2 < len(tokens) and tokens[i + 2] == u'complété':
+    elif tokens[i + 2] == u'complété':
         node['editType'] = 'add'
         i += 6
         # i = parse_definition(tokens, i, node)
@@ -1484,7 +1565,7 @@ def parse_edit(tokens, i, parent):
         i += 2
         i = parse_definition(tokens, i, node)
     # est ratifié:
-    elif i + 2 < len(tokens) and (tokens[i].lower() == u'est' and tokens[i + 2] == u'ratifié'):
+    elif tokens.lowered[i] == u'est' and tokens[i + 2] == u'ratifié':
         node['editType']= 'ratified'
         i += 4
     else:
@@ -1507,15 +1588,15 @@ def parse_edit(tokens, i, parent):
 
 def parse_raw_article_content(tokens, i, parent):
     node = create_node(parent, {
-        'type': 'raw-content',
+        'type': TYPE_RAW_CONTENT,
         'content': ''
     })
 
     debug(parent, tokens, i, 'parse_raw_article_content')
 
-    while i < len(tokens) and tokens[i] != alinea_lexer.TOKEN_NEW_LINE:
-        node['content'] += tokens[i]
-        i += 1
+    j = alinea_lexer.skip_to_token(tokens, i, alinea_lexer.TOKEN_NEW_LINE)
+    node['content'] += ''.join(tokens[i:j])
+    i = j
 
     if node['content'] == '' or is_space(node['content']):
         remove_node(parent, node)
@@ -1525,12 +1606,18 @@ def parse_raw_article_content(tokens, i, parent):
     return i
 
 
-def parse_code_name(tokens, i, node):
-    while i < len(tokens) and tokens[i] != u',' and tokens[i] != u'est':
-        node['id'] += tokens[i]
-        i += 1
-    node['id'] = node['id'].strip()
-    return i
+# Parse the name of a code, for parse_cached_name(): the longest of the known code names (cf lexicon.CODE_NAMES) or,
+# if there is none, the tokens up to the next comma or "est".
+def parse_code_name(tokens, i):
+    j, end = match_code_name(tokens, i)
+    if j >= 0:
+        return {'id': ''.join(tokens[i:j])}, j, end
+
+    j = i
+    while j < len(tokens) and tokens[j] != u',' and tokens[j] != u'est':
+        j += 1
+    # the comma or "est" was read too
+    return {'id': ''.join(tokens[i:j]).strip()}, j, max(j + 1, end)
 
 # Parse a reference to a specific or aforementioned code.
 # References to a specific code are specified by using the exact name of that code (cf parse_code_name).
@@ -1548,22 +1635,20 @@ def parse_code_reference(tokens, i, parent):
 
     # code
     if tokens[i] == u'code':
-        i = parse_code_name(tokens, i, node)
+        fields, i = parse_cached_name(parse_code_name, tokens, i, duralex.lexicon.code_names_generation)
+        node.update(fields)
     # le code
     # du code
-    elif tokens[i].lower() in [u'le', u'du'] and tokens[i + 2] == 'code':
-        i = parse_code_name(tokens, i + 2, node)
+    elif tokens.lowered[i] in [u'le', u'du'] and tokens[i + 2] == 'code':
+        fields, i = parse_cached_name(parse_code_name, tokens, i + 2, duralex.lexicon.code_names_generation)
+        node.update(fields)
     # le même code
     # du même code
-    elif tokens[i].lower() in [u'le', u'du'] and tokens[i + 2] == u'même' and tokens[i + 4] == 'code':
+    elif tokens.lowered[i] in [u'le', u'du'] and tokens[i + 2] == u'même' and tokens[i + 4] == 'code':
         remove_node(parent, node)
-        codeRefs = filter_nodes(
-            get_root(parent),
-            lambda n: 'type' in n and n['type'] == TYPE_CODE_REFERENCE
-        )
+        codeRefs = filter_nodes_of_type(get_root(parent), [TYPE_CODE_REFERENCE])
         # the lduralex.tree.one in order of traversal is the previous one in order of syntax
-        node = copy_node(codeRefs[-1])
-        node['children'] = []
+        node = copy_node(get_back_reference(parent, codeRefs), False)
         push_node(parent, node)
         # skip "le même code "
         i += 6
@@ -1578,21 +1663,31 @@ def parse_code_reference(tokens, i, parent):
     return i
 
 def parse_definition_list(tokens, i, parent):
-    if i >= len(tokens):
-        return i
+    # parse the definitions of the list in a loop rather than recursively, so long lists can't exceed the recursion
+    # limit
+    count = 0
+    while i < len(tokens):
+        i = parse_definition(tokens, i, parent)
+        i = alinea_lexer.skip_spaces(tokens, i)
+        count += 1
+        if not ((tokens[i] == u',' and tokens[i + 2] in [u'à', u'au'])
+            or (tokens[i] == u'et' and tokens[i + 2] != alinea_lexer.TOKEN_SENTINEL)):
+            break
+        i += 2
 
-    i = parse_definition(tokens, i, parent)
-    i = alinea_lexer.skip_spaces(tokens, i)
-    if ((i + 2 < len(tokens) and tokens[i] == u',' and tokens[i + 2] in [u'à', u'au'])
-        or (i + 2 < len(tokens) and tokens[i] == u'et')):
-        i = parse_definition_list(tokens, i + 2, parent)
-    i = alinea_lexer.skip_spaces(tokens, i)
+    # the quotes are looked for once per definition of the list, as they were when each definition of the list was
+    # parsed by a recursive call
+    for j in range(0, count):
+        i = alinea_lexer.skip_spaces(tokens, i)
+        i = parse_definition_list_quotes(tokens, i, parent)
+
+    return i
 
+def parse_definition_list_quotes(tokens, i, parent):
     # est rédigé(es)
     # ainsi rédigé(es)
     # est ainsi rédigé(es)
-    if (i + 2 < len(tokens) and tokens[i + 2].startswith(u'rédigé')
-        or (i + 4 < len(tokens) and tokens[i + 4].startswith(u'rédigé'))):
+    if tokens[i + 2].startswith(u'rédigé') or tokens[i + 4].startswith(u'rédigé'):
         i += 6
         def_nodes = filter_nodes(parent, lambda x: duralex.tree.is_definition(x))
         for def_node in def_nodes:
@@ -1605,15 +1700,13 @@ def parse_definition_list(tokens, i, parent):
 # All the parsed references will be siblings in parent['children'] and reso lve_fully_qualified_references + sort_references
 # will take care of reworking the tree to make sure each reference in the list is complete and consistent.
 def parse_reference_list(tokens, i, parent):
-    if i >= len(tokens):
-        return i
-
-    i = parse_reference(tokens, i, parent)
-    i = alinea_lexer.skip_spaces(tokens, i)
-    if ((i + 2 < len(tokens) and tokens[i] == u',' and tokens[i + 2] in [u'à', u'au'])
-        or (i + 2 < len(tokens) and tokens[i] == u'et')):
-        i = parse_reference_list(tokens, i + 2, parent)
-    i = alinea_lexer.skip_spaces(tokens, i)
+    while i < len(tokens):
+        i = parse_reference(tokens, i, parent)
+        i = alinea_lexer.skip_spaces(tokens, i)
+        if not ((tokens[i] == u',' and tokens[i + 2] in [u'à', u'au'])
+            or (tokens[i] == u'et' and tokens[i + 2] != alinea_lexer.TOKEN_SENTINEL)):
+            break
+        i += 2
 
     return i
 
@@ -1623,6 +1716,9 @@ def parse_one_of(fns, tokens, i, parent):
     if i >= len(tokens):
         return i
 
+    if tokens.budget is not None:
+        tokens.budget.step()
+
     for fn in fns:
         j = fn(tokens, i, parent)
         if j != i:
@@ -1636,6 +1732,9 @@ def parse_reference(tokens, i, parent):
     # node = create_node(parent, {'type':'reference'})
     node = parent
 
+    if i >= len(tokens) or not get_reference_starts(tokens)[i]:
+        return i
+
     j = i
     i = parse_one_of(
         [
@@ -1717,7 +1816,7 @@ def parse_header2(tokens, i, parent):
     debug(parent, tokens, i, 'parse_header2')
 
     i = alinea_lexer.skip_spaces(tokens, i)
-    if i < len(tokens) and re.compile(u'\d+°').match(tokens[i]):
+    if re.compile(u'\d+°').match(tokens[i]):
         debug(parent, tokens, i, 'parse_header2 found article header-2')
 
         node['order'] = parse_int(tokens[i])
@@ -1799,16 +1898,16 @@ def parse_for_each(fn, tokens, i, parent):
 
     return i
 
-def parse_bill_articles(data, parent):
+def parse_bill_articles(data, parent, cache=None, budget=None):
     if 'articles' in data:
         for article_data in data['articles']:
-            parse_bill_article(article_data, parent)
+            parse_bill_article(article_data, parent, cache, budget)
     elif 'alineas' in data:
-        parse_bill_article(data, parent)
+        parse_bill_article(data, parent, cache, budget)
 
     return data
 
-def parse_bill_article(data, parent):
+def parse_bill_article(data, parent, cache=None, budget=None):
     node = create_node(parent, {
         'type': TYPE_BILL_ARTICLE,
         'order': 1,
@@ -1818,21 +1917,63 @@ def parse_bill_article(data, parent):
     node['order'] = data['order']
 
     if 'alineas' in data:
-        parse_json_alineas(data['alineas'], node)
-
-def parse_json_alineas(data, parent):
+        parse_json_alineas(data['alineas'], node, cache, budget)
+
+# When a cache is set, the parsed content of each article is stored using the fingerprint of its alineas. When a
+# revised version of the bill is parsed, the articles that did not change are then loaded from the cache instead of
+# being parsed again.
+#
+# When the article exceeds its parse budget, or when its text ends in the middle of a rule, it's kept as a single
+# raw-content node flagged with a 'parseError' ('budget' or 'syntax') rather than failing the whole bill.
+def parse_json_alineas(data, parent, cache=None, budget=None):
     text = alinea_lexer.TOKEN_NEW_LINE.join(value for key, value in list(iter(sorted(data.items()))))
     parent['content'] = text#.decode('utf-8')
-    return parse_alineas(text, parent)
 
-def parse_alineas(data, parent):
+    key = hash_data(text) if cache is not None else None
+    if key:
+        cached = cache.get(key)
+        if cached is not None:
+            for child in cached:
+                load_node(parent, child)
+            return
+
+    try:
+        parse_alineas(text, parent, budget)
+        parse_error = None
+    except ParseBudgetExceeded:
+        parse_error = 'budget'
+    except ParseSyntaxError:
+        parse_error = 'syntax'
+
+    if parse_error is not None:
+        for child in list(parent['children']):
+            remove_node(parent, child)
+        parent.pop('isContextual', None)
+        create_node(parent, {
+            'type': TYPE_RAW_CONTENT,
+            'content': text,
+            'parseError': parse_error,
+        })
+        duralex.metrics.count('articles_unparsed')
+        duralex.metrics.count('articles_unparsed_' + parse_error)
+        # another budget may parse it: it's not cached
+        return
+
+    # an article that refers to the previous ones would not parse the same way in another bill
+    if not parent.pop('isContextual', False) and key:
+        cache[key] = [dump_node(child) for child in parent['children']]
+
+def parse_alineas(data, parent, budget=None):
     tokens = alinea_lexer.tokenize(data.strip())
+    if budget is not None:
+        budget.start()
+        tokens.budget = budget
     parse_for_each(parse_header1, tokens, 0, parent)
 
     if len(parent['children']) == 0:
         parse_raw_article_content(tokens, 0, parent)
 
-def parse(data, tree):
+def parse(data, tree, cache=None, budget=None):
     # tree = create_node(tree, {'type': 'articles'})
-    parse_bill_articles(data, tree)
+    parse_bill_articles(data, tree, cache, budget)
     return tree
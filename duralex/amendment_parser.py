@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 
-import duralex.alinea_lexer as lexer
+import functools
+import json
+import re
 
 from duralex.bill_parser import clean_html
+from duralex.cache import hash_data
 from duralex.tree import *
-from duralex.alinea_parser import is_number_word, word_to_number, is_number, parse_int, parse_alineas
+from duralex.alinea_parser import is_number, parse_int, parse_alineas
+from duralex.lexicon import is_number_word, word_to_number
 
 AMENDMENT_STATUS = {
     u'rejeté': 'rejected',
@@ -14,18 +18,76 @@ AMENDMENT_STATUS = {
     u'adopté': 'approved'
 }
 
-def parse(data, tree):
+SUBJECT_POSITION = {
+    u'AVANT': u'before',
+    u'APRÈS': u'after',
+}
+
+# {position} ART. {order}
+re_subject = re.compile(r'^(?:(AVANT|APRÈS)[\s\xa0])?ART\.[\s\xa0]([^\s\xa0().!\',"]+)')
+re_amendments_start = re.compile(r'"amendements"\s*:\s*\[')
+re_amendments_separator = re.compile(r'[\s,]*')
+
+# The optional cache is a dict-like object (such as duralex.cache.DiskCache) mapping each amendment number to its
+# previously parsed subtree. Only the amendments that are new or whose subject/text changed are actually parsed again.
+def parse(data, tree, cache=None):
     amendements = []
     # ast = create_node(ast, {'type': 'amendments'})
     for amendement in data['amendements']:
-        amendements.append(parse_amendment(amendement['amendement'], tree))
+        amendements.append(parse_amendment(amendement['amendement'], tree, cache))
+    return tree
+
+# Same as parse() but reading the JSON data from an iterable of text chunks (cf read_amendments).
+def parse_stream(chunks, tree, cache=None):
+    for amendement in read_amendments(chunks):
+        parse_amendment(amendement, tree, cache)
     return tree
 
-def parse_amendment(data, parent):
+# Incrementally decode the {"amendements": [{"amendement": {...}}, ...]} structure from an iterable of text chunks
+# and yield each "amendement" object as soon as it is complete. Only the amendment being decoded is held in memory,
+# not the whole dump.
+def read_amendments(chunks):
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    data = ''
+    i = -1
+
+    # skip everything up to the opening bracket of the amendments list
+    while i < 0:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return
+        data += chunk
+        match = re_amendments_start.search(data)
+        if match:
+            i = match.end()
+        else:
+            # keep enough data to match a '"amendements" : [' split over two chunks
+            data = data[-64:]
+
+    while True:
+        i = re_amendments_separator.match(data, i).end()
+        if i < len(data) and data[i] == ']':
+            return
+        try:
+            if i == len(data):
+                raise ValueError('incomplete amendment')
+            value, i = decoder.raw_decode(data, i)
+        except ValueError:
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise
+            data = data[i:] + chunk
+            i = 0
+            continue
+        yield value['amendement']
+        data = data[i:]
+        i = 0
+
+def parse_amendment(data, parent, cache=None):
     subject = data['sujet']
     text = clean_html(data['texte'])
 
-    tokens = lexer.tokenize(subject + '\n' + text)
     node = create_node(parent, {
         'type': 'amendment',
         'id': data['numero'],
@@ -36,43 +98,56 @@ def parse_amendment(data, parent):
         'url': data['source']
     })
 
+    # The metadata (status, signatories...) above is always refreshed, but the parsed content is reused as long as
+    # the subject and the text of the amendment did not change.
+    checksum = hash_data(subject, data['texte'])
+    if cache is not None:
+        cached = cache.get(data['numero'])
+        if cached and cached['checksum'] == checksum:
+            for child in cached['children']:
+                load_node(node, child)
+            return node
+
     # The "subject" declares the target bill article reference for this admendment.
     # That reference will be referenced later on using syntaxes such as "cet article" ("this article").
-    parse_subject(tokens, 0, node)
+    parse_subject(subject, node)
     parse_alineas(node['content'], node)
     # If the admendment content actually need that bill article reference, they already have it copied by now.
     # So we simply we remove it.
     remove_node(node, node['children'][0])
 
-    return node
+    # the same goes for the amendments referring to the previous ones ("la même loi"...)
+    if not node.pop('isContextual', False) and cache is not None:
+        cache[data['numero']] = {
+            'checksum': checksum,
+            'children': [dump_node(child) for child in node['children']],
+        }
 
-def parse_subject(tokens, i, parent):
-    node = create_node(parent, {
-        'type': TYPE_BILL_ARTICLE_REFERENCE
-    })
+    return node
 
-    i = parse_ref_position(tokens, i, node)
+# The subject of an amendment is a short header such as "ART. PREMIER", "APRÈS ART. 3" or "AVANT ART. 2".
+# The same subjects are used by many amendments, so the parsed fields are memoized.
+def parse_subject(subject, parent):
+    return create_node(parent, dict(parse_subject_fields(subject)))
 
-    # ART. PREMIER
-    if tokens[i] == 'ART' and is_number_word(tokens[i + 3]):
-        node['order'] = word_to_number(tokens[i + 3])
-        i += lexer.skip_to_end_of_line(tokens, i)
-    # ART. {order}
-    elif tokens[i] == 'ART' and is_number(tokens[i + 3]):
-        node['order'] = parse_int(tokens[i + 3])
-        i += lexer.skip_to_end_of_line(tokens, i)
+@functools.lru_cache(maxsize=1024)
+def parse_subject_fields(subject):
+    fields = [('type', TYPE_BILL_ARTICLE_REFERENCE)]
 
-    return i
+    match = re_subject.match(subject)
+    if not match:
+        return tuple(fields)
 
-def parse_ref_position(tokens, i, node):
-    if i >= len(tokens):
-        return
+    # AVANT
+    # APRÈS
+    if match.group(1):
+        fields.append(('position', SUBJECT_POSITION[match.group(1)]))
 
-    if tokens[i] == u'AVANT':
-        node['position'] = u'before'
-        i += 2
-    elif tokens[i] == u'APRÈS':
-        node['position'] = u'after'
-        i += 2
+    # ART. PREMIER
+    if is_number_word(match.group(2)):
+        fields.append(('order', word_to_number(match.group(2))))
+    # ART. {order}
+    elif is_number(match.group(2)):
+        fields.append(('order', parse_int(match.group(2))))
 
-    return i
+    return tuple(fields)
@@ -7,8 +7,9 @@ Original code by RegardsCitoyen (https://github.com/RegardsCitoyens) for the-law
 import sys, re, html5lib
 from bs4 import BeautifulSoup
 
-from duralex.alinea_parser import word_to_number, month_to_number
+from duralex.lexicon import word_to_number, month_to_number, parse_roman_number
 
+import duralex.metrics
 import duralex.tree
 
 bister = u'(un|duo|tre|bis|qua|quin[tqu]*|sex|sept|octo?|novo?|non|dec|vic|ter|ies)+'
@@ -39,19 +40,6 @@ clean_legifrance_regexps = [
 
 # Convert from roman numbers
 re_mat_romans = re.compile(r"[IVXCLDM]+", re.I)
-romans_map = zip(
-    (1000,  900, 500, 400 , 100,  90 , 50 ,  40 , 10 ,   9 ,  5 ,  4  ,  1),
-    ( u'M', u'CM', u'D', u'CD', u'C', u'XC', u'L', u'XL', u'X', u'IX', u'V', u'IV', u'I')
-)
-
-def romans(n):
-    n = n.upper()
-    i = res = 0
-    for d, r in romans_map:
-        while n[i:i + len(r)] == r:
-            res += d
-            i += len(r)
-    return res
 
 upcase_accents = u"ÇÀÂÄÉÈÊËÎÏÔÖÙÛÜ"
 locase_accents = u"çàâäéèêëîïôöùûü"
@@ -201,7 +189,8 @@ def parse_bill(string, url):
     indextext = -1
 
     definitif = re_definitif.search(string) is not None
-    soup = BeautifulSoup(string, "html5lib")
+    with duralex.metrics.span('html'):
+        soup = BeautifulSoup(string, "html5lib")
 
     texte = {
         "type": "projet de loi",
@@ -240,7 +229,8 @@ def parse_bill(string, url):
     lines = soup.body.find_all('p') if is_html else string.split(u'\n')
 
     for line in lines:
-        line = clean_html(line.text if is_html else line)
+        with duralex.metrics.span('clean'):
+            line = clean_html(line.text if is_html else line)
 
         if re_stars.match(line):
             continue
@@ -328,7 +318,7 @@ def parse_bill(string, url):
                 m2 = re_mat_romans.match(section_num)
                 if m2:
                     rest = section_num.replace(m2.group(0), '')
-                    section_num = romans(m2.group(0))
+                    section_num = parse_roman_number(m2.group(0))
                     if rest: section_num = str(section_num) + rest
             # Get parent section id to build current section id
             section_par = re.sub(r""+section_typ+"[\dL].*$", "", section["id"])
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import hashlib
+import json
+import os
+
+def get_default_cache_dir():
+    if 'XDG_CACHE_HOME' in os.environ:
+        return os.path.join(os.environ['XDG_CACHE_HOME'], 'duralex')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'duralex')
+
+def hash_file(path, chunk_size=64 * 1024):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def hash_data(*parts):
+    h = hashlib.sha1()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = str(part).encode('utf-8')
+        h.update(part)
+        h.update(b'\0')
+    return h.hexdigest()
+
+# the share of max_size a DiskCache is brought down to when it's evicted
+DISK_CACHE_EVICTION_RATIO = 0.9
+
+# A persistent key/value store with a dict-like interface: each value is stored as a JSON file named after the hash of
+# its key (and of the namespace, if any, so several stores can share a directory) in the cache directory. If max_size
+# is set, the least recently used entries are evicted whenever the total size of the cache directory exceeds max_size
+# bytes. That size is only read from the directory on the first write and on each eviction: in between, it's updated
+# with the size of the written entries, and the eviction goes down to DISK_CACHE_EVICTION_RATIO of max_size so it doesn't run again
+# on the next write.
+class DiskCache(object):
+    def __init__(self, path, max_size=None, namespace=None):
+        self.path = path
+        self.max_size = max_size
+        self.namespace = namespace
+        self.size = None
+
+    def get_path(self, key):
+        name = hash_data(key) if self.namespace is None else hash_data(self.namespace, key)
+        return os.path.join(self.path, name + '.json')
+
+    def get(self, key, default=None):
+        path = self.get_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except (IOError, ValueError):
+            return default
+        if self.max_size:
+            # the modification time is used as the last access time for the LRU eviction
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return value
+
+    def __contains__(self, key):
+        return os.path.exists(self.get_path(key))
+
+    def __getitem__(self, key):
+        value = self.get(key, self)
+        if value is self:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        path = self.get_path(key)
+        if self.max_size and self.size is None:
+            self.size = self.get_size()
+        # write to a temporary file first so a concurrent reader never sees a partial entry
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        if self.max_size:
+            try:
+                self.size -= os.path.getsize(path)
+            except OSError:
+                pass
+            self.size += os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+        if self.max_size and self.size > self.max_size:
+            self.evict()
+
+    def __delitem__(self, key):
+        path = self.get_path(key)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            raise KeyError(key)
+        if self.size is not None:
+            self.size -= size
+
+    def get_entries(self):
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith('.json'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def get_size(self):
+        return sum(entry_size for mtime, entry_size, path in self.get_entries()) if os.path.isdir(self.path) else 0
+
+    def evict(self):
+        entries = self.get_entries()
+        size = sum(entry_size for mtime, entry_size, path in entries)
+        for mtime, entry_size, path in sorted(entries):
+            if size <= self.max_size * DISK_CACHE_EVICTION_RATIO:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
+        self.size = size
+
+# A bounded cache of the values parsed from spans of tokens: a value is found by reading the tokens from a given
+# position, without knowing where its span ends.
+#
+#     value, size = cache.get(tokens, i, 'law')
+#     ...
+#     cache.set(tokens, i, length, value, size, 'law')
+#
+# A value is stored with the tokens of its span (the length tokens from i, including every token read to parse the
+# value) and the number of tokens the parse moved forward (size). The spans are kept in a trie of their tokens, one for
+# each namespace: get() follows the tokens from i in the trie and returns the first span it reaches, which holds all the
+# tokens the parse would read from i and so the value it would return. When there are more than max_entries values, the
+# least recently used one is evicted. The values are kept as they are: get() doesn't copy them.
+class SpanCache(object):
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.clear()
+
+    def clear(self):
+        self.entries = collections.OrderedDict()
+        self.tries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tokens, i, namespace=None):
+        node = self.tries.get(namespace)
+        while node is not None:
+            # the None key holds the span ending at this node, if any
+            if None in node:
+                key = node[None]
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            node = node.get(tokens[i])
+            i += 1
+        self.misses += 1
+        return None
+
+    def set(self, tokens, i, length, value, size, namespace=None):
+        # the span may end with some of the sentinels read past the end of a TokenList, which its slices leave out
+        key = (namespace,) + tuple(tokens[k] for k in range(i, i + length))
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        node = self.tries.setdefault(namespace, {})
+        for token in key[1:]:
+            node = node.setdefault(token, {})
+        node[None] = key
+        self.entries[key] = (value, size)
+        while len(self.entries) > self.max_entries:
+            self.remove(next(iter(self.entries)))
+
+    def remove(self, key):
+        del self.entries[key]
+        path = [self.tries[key[0]]]
+        for token in key[1:]:
+            path.append(path[-1][token])
+        del path[-1][None]
+        # remove the nodes left without any span
+        for k in range(len(path) - 1, 0, -1):
+            if path[k]:
+                break
+            del path[k - 1][key[k]]
+
+    def get_hit_rate(self):
+        return self.hits / float(self.hits + self.misses) if self.hits + self.misses else 0.0
+
+    # Return the entries as a JSON-serializable list, from the least to the most recently used.
+    def dump(self):
+        return [[key[0], list(key[1:]), value, size] for key, (value, size) in self.entries.items()]
+
+    def load(self, entries):
+        for namespace, tokens, value, size in entries:
+            self.set(tokens, 0, len(tokens), value, size, namespace)
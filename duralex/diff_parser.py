@@ -1,15 +1,67 @@
 # -*- coding=utf-8 -*-
 
+import collections
+import concurrent.futures
+import functools
+import io
+import itertools
 import re
 
-from unidiff import PatchSet
+from unidiff import PatchSet, LINE_TYPE_ADDED, LINE_TYPE_REMOVED
 
 import duralex.tree
 
-def parse(data, tree):
-    patches = PatchSet.from_string(data)
-    for patch in patches:
-        parse_patch(patch, tree)
+re_law_id = re.compile(r"loi_([-0-9]+)")
+re_article_id = re.compile(r"Article_([-0-9]+)\.")
+
+# When workers is set, the file patches are parsed concurrently by that many processes. The amendments are still
+# added to the tree in the order of the diff.
+def parse(data, tree, workers=None):
+    for amendment in iter_amendments(io.StringIO(data), False, workers):
+        duralex.tree.push_node(tree, amendment)
+    return tree
+
+# Same as parse() but reading the diff from an iterable of lines (such as a file object) one file patch at a time. When
+# merge_lines is set, consecutive lines of the same type are merged in a single quote.
+def parse_stream(lines, tree, workers=None, merge_lines=True):
+    for amendment in iter_amendments(lines, merge_lines, workers):
+        duralex.tree.push_node(tree, amendment)
+    return tree
+
+# Yield a (parentless) amendment node for each file patch of the diff read from an iterable of lines.
+def iter_amendments(lines, merge_lines=True, workers=None):
+    file_diffs = iter_file_diffs(lines)
+    if workers:
+        # The file patches are independent from each other. Only a window of them is submitted at once, so the diff is
+        # still read (and its results kept) a few file patches at a time, and the results are yielded in order.
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = collections.deque()
+            for file_diff in file_diffs:
+                futures.append(executor.submit(parse_file_diff, file_diff, merge_lines))
+                if len(futures) >= 2 * workers:
+                    for amendment in futures.popleft().result():
+                        yield amendment
+            while futures:
+                for amendment in futures.popleft().result():
+                    yield amendment
+    else:
+        for file_diff in file_diffs:
+            for amendment in parse_file_diff(file_diff, merge_lines):
+                yield amendment
+
+def parse_file_diff(file_diff, merge_lines=True):
+    return [parse_patch(patch, None, merge_lines) for patch in PatchSet.from_string(file_diff)]
+
+# Split a git diff in one chunk of text per file, using the "diff ..." header lines.
+def iter_file_diffs(lines):
+    file_diff = []
+    for line in lines:
+        if line.startswith('diff ') and file_diff:
+            yield ''.join(file_diff)
+            file_diff = []
+        file_diff.append(line)
+    if file_diff:
+        yield ''.join(file_diff)
 
 def parse_article_reference(patch, tree):
     law_ref = duralex.tree.create_node(tree, {
@@ -24,13 +76,15 @@ def parse_article_reference(patch, tree):
 
     return law_ref
 
+@functools.lru_cache(maxsize=4096)
 def parse_law_id(filename):
-    return re.search(r"loi_([-0-9]+)", filename).group(1)
+    return re_law_id.search(filename).group(1)
 
+@functools.lru_cache(maxsize=4096)
 def parse_article_id(filename):
-    return re.search(r"Article_([-0-9]+)\.", filename).group(1)
+    return re_article_id.search(filename).group(1)
 
-def parse_patch(patch, tree):
+def parse_patch(patch, tree, merge_lines=False):
     amendment = duralex.tree.create_node(tree, {
         'type': duralex.tree.TYPE_AMENDMENT,
         'id': '1',
@@ -53,7 +107,12 @@ def parse_patch(patch, tree):
         duralex.tree.push_node(edit, law_ref)
     else:
         for hunk in patch:
-            parse_hunk(hunk, amendment, law_ref)
+            if merge_lines:
+                parse_merged_hunk(hunk, amendment, law_ref)
+            else:
+                parse_hunk(hunk, amendment, law_ref)
+
+    return amendment
 
 def parse_hunk(hunk, parent, ref):
     line_type = ''
@@ -84,3 +143,23 @@ def parse_hunk(hunk, parent, ref):
 
     if edit and "editType" in edit:
         duralex.tree.push_node(parent, edit)
+
+# Same as parse_hunk() but with a single edit and quote for each run of added or removed lines. Context lines are
+# skipped right away.
+def parse_merged_hunk(hunk, parent, ref):
+    for line_type, lines in itertools.groupby(hunk, lambda line: line.line_type):
+        if line_type not in [LINE_TYPE_ADDED, LINE_TYPE_REMOVED]:
+            continue
+
+        edit = duralex.tree.create_node(parent, {
+            'type': duralex.tree.TYPE_EDIT,
+            'editType': 'add' if line_type == LINE_TYPE_ADDED else 'delete',
+        })
+        duralex.tree.push_node(edit, duralex.tree.copy_node(ref))
+        word_def = duralex.tree.create_node(edit, {
+            'type': duralex.tree.TYPE_WORD_DEFINITION,
+        })
+        duralex.tree.create_node(word_def, {
+            'type': duralex.tree.TYPE_QUOTE,
+            'words': ''.join(line.value for line in lines),
+        })
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import base64
+
+import requests
+import requests.structures
+
+class OfflineCacheMiss(Exception):
+    pass
+
+# Fetch documents over HTTP with a single pooled session. When a cache is set (any dict-like object, such as a
+# duralex.cache.DiskCache), the responses are stored and revalidated using their ETag/Last-Modified headers. A
+# streamed response is not stored, since its whole content would have to be read in memory, but it's still served
+# from the cache when an earlier response was stored. In offline mode, the documents are only served from the cache.
+class Fetcher(object):
+    def __init__(self, cache=None, session=None, offline=False):
+        self.cache = cache
+        self.session = session if session is not None else requests.Session()
+        self.offline = offline
+
+    def get(self, url, stream=False):
+        cached = self.cache.get(url) if self.cache is not None else None
+
+        if self.offline:
+            if cached is None:
+                raise OfflineCacheMiss('document not available offline: ' + url)
+            return self.make_response(url, cached)
+
+        headers = {}
+        if cached:
+            if 'etag' in cached['headers']:
+                headers['If-None-Match'] = cached['headers']['etag']
+            if 'last-modified' in cached['headers']:
+                headers['If-Modified-Since'] = cached['headers']['last-modified']
+
+        res = self.session.get(url, headers=headers, stream=stream)
+        if res.status_code == 304 and cached:
+            return self.make_response(url, cached)
+        res.raise_for_status()
+
+        if self.cache is not None and not stream:
+            self.cache[url] = {
+                'headers': {k.lower(): v for k, v in res.headers.items() if k.lower() in [
+                    'content-type', 'etag', 'last-modified'
+                ]},
+                'content': base64.b64encode(res.content).decode('ascii'),
+            }
+
+        return res
+
+    def make_response(self, url, cached):
+        res = requests.Response()
+        res.url = url
+        res.status_code = 200
+        res.headers = requests.structures.CaseInsensitiveDict(cached['headers'])
+        res.encoding = requests.utils.get_encoding_from_headers(res.headers)
+        res._content = base64.b64decode(cached['content'])
+        res._content_consumed = True
+        return res
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import io
+import os
+import re
+
+import duralex.alinea_lexer as alinea_lexer
+
+# The number words, by value: the cardinal and ordinal forms of each number.
+NUMBER_WORDS = [
+    [u'un', u'une', u'premier', u'première'],
+    [u'deux', u'deuxième', u'second', u'seconde'],
+    [u'trois', u'troisième'],
+    [u'quatre', u'quatrième'],
+    [u'cinq', u'cinquième'],
+    [u'six', u'sixième'],
+    [u'sept', u'septième'],
+    [u'huit', u'huitième'],
+    [u'neuf', u'neuvième'],
+    [u'dix', u'dixième'],
+    [u'onze', u'onzième'],
+    [u'douze', u'douzième'],
+    [u'treize', u'treizième'],
+    [u'quatorze', u'quatorzième'],
+    [u'quinze', u'quinzième'],
+    [u'seize', u'seizième'],
+    [u'dix-sept', u'dix-septième'],
+    [u'dix-huit', u'dix-huitième'],
+    [u'dix-neuf', u'dix-neuvième'],
+    [u'vingt', u'vingtième'],
+    [u'vingt-et-un', u'vingt-et-une', u'vingt-et-unième'],
+    [u'vingt-deux', u'vingt-deuxième'],
+    [u'vingt-trois', u'vingt-troisième'],
+    [u'vingt-quatre', u'vingt-quatrième'],
+    [u'vingt-cinq', u'vingt-cinquième'],
+    [u'vingt-six', u'vingt-sixième'],
+    [u'vingt-sept', u'vingt-septième'],
+    [u'vingt-huit', u'vingt-huitième'],
+    [u'vingt-neuf', u'vingt-neuvième'],
+    [u'trente', u'trentième'],
+]
+
+NUMBER_WORD_VALUES = {word: n + 1 for n, words in enumerate(NUMBER_WORDS) for word in words}
+
+MONTH_NUMBERS = {month: n + 1 for n, month in enumerate(alinea_lexer.TOKEN_MONTH_NAMES)}
+
+NUMBER = re.compile(r"\d+")
+
+ROMAN_NUMBER = re.compile(r"[IVXCLDM]+(er)?")
+
+ROMAN_DIGITS = (
+    (1000, u'M'), (900, u'CM'), (500, u'D'), (400, u'CD'), (100, u'C'), (90, u'XC'), (50, u'L'), (40, u'XL'),
+    (10, u'X'), (9, u'IX'), (5, u'V'), (4, u'IV'), (1, u'I'),
+)
+
+# The multiplicative adverbs in a trie of their reversed letters, so the longest adverb a word ends with is found by
+# reading the word backwards once. A node is a dict of its children by letter, the '' key holding the adverb that ends
+# there, if any.
+def build_suffix_trie(words):
+    trie = {}
+    for word in words:
+        node = trie
+        for c in reversed(word):
+            node = node.setdefault(c, {})
+        node[''] = word
+    return trie
+
+MULTIPLICATIVE_ADVERBS = build_suffix_trie(alinea_lexer.TOKEN_MULTIPLICATIVE_ADVERBS)
+
+# The names of the codes in a trie of their lowercase tokens (cf alinea_lexer.tokenize()), where all the spaces are
+# the same u' ' token. A node is a dict of its children by token, the None key holding the name that ends there, if any
+# (the '' key can't be used: it's the sentinel token).
+CODE_NAMES = {}
+
+# the code names bundled with DuraLex
+CODE_NAMES_PATH = os.path.join(os.path.dirname(__file__), 'code_names.txt')
+
+# Return the code names of a file, one per line (the empty lines and the ones starting with '#' are ignored).
+def read_code_names(path):
+    with io.open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+# The number of times code names were added to CODE_NAMES: the code names parsed with a previous generation may have
+# changed since (cf alinea_parser.parse_code_reference()).
+code_names_generation = 0
+
+def add_code_names(names):
+    global code_names_generation
+    code_names_generation += 1
+    for name in names:
+        node = CODE_NAMES
+        for token in alinea_lexer.tokenize(name).lowered:
+            node = node.setdefault(u' ' if token.isspace() else token, {})
+        node[None] = name
+
+add_code_names(read_code_names(CODE_NAMES_PATH))
+
+# Return the index of the token after the longest code name starting at tokens[i] (or -1 if there is none) and the
+# index of the token after the last one read.
+def match_code_name(tokens, i):
+    node = CODE_NAMES
+    end = -1
+    while True:
+        if None in node:
+            end = i
+        token = tokens.lowered[i]
+        node = node.get(u' ' if token.isspace() else token)
+        i += 1
+        if node is None:
+            return end, i
+
+# Raised by the grammar rules on a text they can't parse, such as a back-reference to nothing ("le même article" with
+# no previous article) or an order that is not a number.
+class ParseSyntaxError(Exception):
+    pass
+
+# Whether the token starts with digits ("12", "1er"...), whose value is parse_int(token).
+def is_number(token):
+    return NUMBER.match(token)
+
+def parse_int(s):
+    match = NUMBER.search(s)
+    if match is None:
+        raise ParseSyntaxError(u'not a number: ' + repr(s))
+    return int(match.group())
+
+# Return the value of a number word ("trois", "troisième"...) or -1 if it's not a number word.
+def word_to_number(word):
+    n = NUMBER_WORD_VALUES.get(word)
+    if n is None:
+        n = NUMBER_WORD_VALUES.get(word.lower(), -1)
+    return n
+
+def is_number_word(word):
+    return word_to_number(word) >= 0
+
+def month_to_number(month):
+    if month not in MONTH_NUMBERS:
+        raise ValueError(u'unknown month: ' + month)
+    return MONTH_NUMBERS[month]
+
+def is_roman_number(token):
+    return ROMAN_NUMBER.match(token)
+
+@functools.lru_cache(maxsize=1024)
+def parse_roman_number(n):
+    n = n.upper()
+    i = res = 0
+    for d, r in ROMAN_DIGITS:
+        while n[i:i + len(r)] == r:
+            res += d
+            i += len(r)
+    return res
+
+# Return the longest multiplicative adverb ("bis", "ter"...) the word ends with, or None.
+def get_multiplicative_adverb(word):
+    node = MULTIPLICATIVE_ADVERBS
+    adverb = None
+    for i in range(len(word) - 1, -1, -1):
+        if word[i] not in node:
+            break
+        node = node[word[i]]
+        if '' in node:
+            adverb = node['']
+    return adverb
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import struct
+import sys
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+# the (approximate) size of a dict entry: hash, key and value pointers
+ENTRY_SIZE = 3 * struct.calcsize('P')
+
+# Return the memory retained by a tree, by node type:
+# - 'nodes': the number of nodes and the bytes retained by each type of node (the node dict, its children list and
+#   the values of its other attributes, but not its children nodes);
+# - 'attributes': the overhead of the bookkeeping attributes: the uuid strings, the parent links and the empty
+#   children lists;
+# - 'total': the bytes retained by the whole tree.
+# The sizes are computed with sys.getsizeof(): a string shared by several nodes is counted once for each of them.
+def get_tree_memory_report(tree):
+    nodes = {}
+    attributes = {
+        'uuid': {'count': 0, 'bytes': 0},
+        'parent': {'count': 0, 'bytes': 0},
+        'empty-children': {'count': 0, 'bytes': 0},
+    }
+    total = 0
+
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        node_type = node.get('type', '<root>')
+        size = sys.getsizeof(node)
+        for key, value in node.items():
+            if key == 'children':
+                size += sys.getsizeof(value)
+                if len(value) == 0:
+                    attributes['empty-children']['count'] += 1
+                    attributes['empty-children']['bytes'] += sys.getsizeof(value) + ENTRY_SIZE
+            elif key == 'parent':
+                # the parent is retained by the tree anyway: only the entry itself is an overhead
+                attributes['parent']['count'] += 1
+                attributes['parent']['bytes'] += ENTRY_SIZE
+            else:
+                value_size = get_value_size(value)
+                size += value_size
+                if key == 'uuid':
+                    attributes['uuid']['count'] += 1
+                    attributes['uuid']['bytes'] += value_size + ENTRY_SIZE
+
+        if node_type not in nodes:
+            nodes[node_type] = {'count': 0, 'bytes': 0}
+        nodes[node_type]['count'] += 1
+        nodes[node_type]['bytes'] += size
+        total += size
+
+        stack.extend(node.get('children', []))
+
+    return {'nodes': nodes, 'attributes': attributes, 'total': total}
+
+def get_value_size(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(get_value_size(k) + get_value_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(get_value_size(v) for v in value)
+    return size
+
+def get_max_rss():
+    if not resource:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # in bytes on macOS, in kilobytes everywhere else
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+# Record the memory used by each phase of a pipeline:
+#
+#     profiler = MemoryProfiler()
+#     with profiler.phase('alinea_parser'):
+#         ...
+#
+# For each phase, the report has the peak of the memory allocated by Python during the phase ('peak', or None if it
+# can't be measured), the memory still allocated at its end ('allocated', both relative to the start of the phase) and
+# the peak RSS of the process so far ('maxrss'). When disabled, phase() does nothing.
+class MemoryProfiler(object):
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.phases = []
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        started = tracemalloc.is_tracing()
+        # the peak of a phase is measured from its start: when the memory is already traced, that takes
+        # tracemalloc.reset_peak(), which is only available since Python 3.9
+        has_peak = not started or hasattr(tracemalloc, 'reset_peak')
+        if not started:
+            tracemalloc.start()
+        elif has_peak:
+            tracemalloc.reset_peak()
+        start, peak = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            if not started:
+                tracemalloc.stop()
+            self.phases.append({
+                'name': name,
+                'peak': peak - start if has_peak else None,
+                'allocated': current - start,
+                'maxrss': get_max_rss(),
+            })
+
+def format_memory_report(report, phases=[]):
+    lines = ['%-40s %10s %14s' % ('node type', 'count', 'bytes')]
+    for node_type, data in sorted(report['nodes'].items(), key=lambda item: -item[1]['bytes']):
+        lines.append('%-40s %10d %14d' % (node_type, data['count'], data['bytes']))
+    lines.append('%-40s %10s %14d' % ('total', '', report['total']))
+
+    lines.append('')
+    lines.append('%-40s %10s %14s' % ('attribute overhead', 'count', 'bytes'))
+    for name, data in sorted(report['attributes'].items()):
+        lines.append('%-40s %10d %14d' % (name, data['count'], data['bytes']))
+
+    if phases:
+        lines.append('')
+        lines.append('%-40s %14s %14s %14s' % ('phase', 'peak', 'allocated', 'max RSS'))
+        for phase in phases:
+            lines.append('%-40s %14s %14d %14s' % (
+                phase['name'],
+                phase['peak'] if phase['peak'] is not None else '-',
+                phase['allocated'],
+                phase['maxrss'] if phase['maxrss'] else '-'
+            ))
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import json
+import time
+
+# Spans (timed sections) and counters recorded across the pipeline:
+#
+#     with metrics.span('alinea_parser'):
+#         ...
+#     metrics.count('nodes_created')
+#
+# Each span is aggregated by name with its number of calls and its total duration. When disabled, span() returns a
+# shared no-op context manager and count() returns right away, so the instrumentation costs almost nothing.
+class Metrics(object):
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        self.spans = {}
+        self.counters = {}
+
+    def span(self, name):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name)
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_span(self, name, duration):
+        if name not in self.spans:
+            self.spans[name] = {'count': 0, 'seconds': 0.0}
+        self.spans[name]['count'] += 1
+        self.spans[name]['seconds'] += duration
+
+    def to_json(self):
+        return json.dumps({'spans': self.spans, 'counters': self.counters}, sort_keys=True, indent=2)
+
+    def to_prometheus(self, prefix='duralex'):
+        lines = [
+            '# TYPE ' + prefix + '_span_seconds_total counter',
+        ]
+        for name, span in sorted(self.spans.items()):
+            lines.append(prefix + '_span_seconds_total{span="' + name + '"} ' + repr(span['seconds']))
+        lines.append('# TYPE ' + prefix + '_span_calls_total counter')
+        for name, span in sorted(self.spans.items()):
+            lines.append(prefix + '_span_calls_total{span="' + name + '"} ' + str(span['count']))
+        for name, value in sorted(self.counters.items()):
+            lines.append('# TYPE ' + prefix + '_' + name + '_total counter')
+            lines.append(prefix + '_' + name + '_total ' + str(value))
+        return '\n'.join(lines) + '\n'
+
+class Span(object):
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.metrics.add_span(self.name, time.perf_counter() - self.start)
+        return False
+
+class NullSpan(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+NULL_SPAN = NullSpan()
+
+# The metrics recorded by the library, disabled until enable() is called.
+metrics = Metrics(False)
+
+def enable():
+    metrics.reset()
+    metrics.enabled = True
+    return metrics
+
+def disable():
+    metrics.enabled = False
+
+def span(name):
+    return metrics.span(name)
+
+def count(name, value=1):
+    if metrics.enabled:
+        metrics.count(name, value)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+from duralex.lexicon import is_number, parse_int, is_number_word, word_to_number, is_roman_number, parse_roman_number
+
+# The token classes a phrase can capture: a test of the token and the conversion of the captured token.
+PHRASE_CLASSES = {
+    'int': (is_number, parse_int),
+    'roman': (is_roman_number, parse_roman_number),
+    'ordinal': (is_number_word, word_to_number),
+}
+
+class PhraseMatch(object):
+    def __init__(self, name, end, captures):
+        self.name = name
+        # the index of the token after the phrase and its following space
+        self.end = end
+        self.captures = captures
+
+class PhraseNode(object):
+    def __init__(self):
+        self.words = {}
+        self.lowered = {}
+        self.classes = []
+        self.phrases = []
+
+# Match phrases on the words of a TokenList (the tokens at even offsets, the odd ones being the spaces between them).
+# A phrase is a name and a pattern of space-separated elements:
+# - a word, that must be equal to the token, or several alternative words separated by '|';
+# - the same, prefixed with '~' to ignore the case of the token;
+# - a token class between '<' and '>' (cf PHRASE_CLASSES), whose value is captured.
+#
+#     matcher = PhraseMatcher([('section', u'~la section <int>'), ('section', u'de la section <int>')])
+#     match = matcher.match_first(tokens, i, 'section')
+#
+# The phrases are compiled into a single trie, so all the phrases starting at a given token are found in one pass.
+# The matches are kept in the TokenList: the sibling rules trying the same position don't match the phrases again.
+class PhraseMatcher(object):
+    def __init__(self, phrases):
+        self.root = PhraseNode()
+        for index, (name, pattern) in enumerate(phrases):
+            nodes = [self.root]
+            for element in pattern.split(' '):
+                children = []
+                for node in nodes:
+                    for child in self.add_element(node, element):
+                        if not any(child is c for c in children):
+                            children.append(child)
+                nodes = children
+            for node in nodes:
+                node.phrases.append((index, name))
+
+    # Return the children of node matching element, one for each alternative.
+    def add_element(self, node, element):
+        if element.startswith('<'):
+            cls = element[1:-1]
+            for c, child in node.classes:
+                if c == cls:
+                    return [child]
+            child = PhraseNode()
+            node.classes.append((cls, child))
+            return [child]
+
+        words = node.words
+        if element.startswith('~'):
+            words = node.lowered
+            element = element[1:]
+        for word in element.split('|'):
+            if word not in words:
+                words[word] = PhraseNode()
+        return [words[word] for word in element.split('|')]
+
+    # Return the matches of all the phrases starting at tokens[i], in the order of the phrases.
+    def match(self, tokens, i):
+        key = (id(self), i)
+        if key not in tokens.phrase_matches:
+            tokens.phrase_matches[key] = self.match_phrases(tokens, i)
+        return tokens.phrase_matches[key]
+
+    def match_phrases(self, tokens, i):
+        matches = []
+        stack = [(self.root, i, [])]
+        while stack:
+            node, k, captures = stack.pop()
+            for index, name in node.phrases:
+                matches.append((index, PhraseMatch(name, k, captures)))
+            # past the end, the sentinel tokens match no word nor class
+            token = tokens[k]
+            if token in node.words:
+                stack.append((node.words[token], k + 2, captures))
+            if tokens.lowered[k] in node.lowered:
+                stack.append((node.lowered[tokens.lowered[k]], k + 2, captures))
+            for cls, child in node.classes:
+                test, convert = PHRASE_CLASSES[cls]
+                if test(token):
+                    stack.append((child, k + 2, captures + [convert(token)]))
+
+        return [match for index, match in sorted(matches, key=lambda m: m[0])]
+
+    # Return the first match of the phrases with the given name starting at tokens[i], or None.
+    def match_first(self, tokens, i, name):
+        for match in self.match(tokens, i):
+            if match.name == name:
+                return match
+        return None
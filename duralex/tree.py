@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import functools
 import uuid
 
+import duralex.metrics
+
 TYPE_HEADER1        = u'header1'
 TYPE_HEADER2        = u'header2'
 TYPE_HEADER3        = u'header3'
@@ -11,6 +14,7 @@ TYPE_EDIT           = u'edit'
 TYPE_QUOTE          = u'quote'
 TYPE_LAW_PROJECT    = u'law-project'
 TYPE_LAW_PROPOSAL   = u'law-proposal'
+TYPE_RAW_CONTENT    = u'raw-content'
 
 TYPE_TITLE_DEFINITION           = u'title-definition'
 TYPE_ARTICLE_DEFINITION         = u'article-definition'
@@ -76,11 +80,37 @@ TYPE_REFERENCE = [
     TYPE_BILL_ARTICLE_REFERENCE,
 ]
 
+# Each node type is given a bit, so a set of types can be stored as an int mask. The bits of the TYPE_* constants are
+# assigned in a fixed order when the module is loaded, so the masks of the nodes built by another process (cf
+# diff_parser) match. Any other type gets OTHER_TYPE_BIT, shared by all of them: a mask with that bit may hold any of
+# them.
+TYPE_BITS = {}
+
+for name in sorted(k for k, v in list(globals().items()) if k.startswith('TYPE_') and isinstance(v, str)):
+    TYPE_BITS.setdefault(globals()[name], 1 << len(TYPE_BITS))
+
+OTHER_TYPE_BIT = 1 << len(TYPE_BITS)
+
+def get_type_bit(node_type):
+    return TYPE_BITS.get(node_type, OTHER_TYPE_BIT)
+
+@functools.lru_cache(maxsize=256)
+def get_type_mask(types):
+    mask = 0
+    for node_type in types:
+        mask |= get_type_bit(node_type)
+    return mask
+
+def get_node_type_bit(node):
+    return get_type_bit(node['type']) if 'type' in node else 0
+
 def unshift_node(parent, node):
     node['parent'] = parent
     if 'children' not in parent:
         parent['children'] = []
     parent['children'] = [node] + parent['children']
+    set_node_depth(node, get_node_depth(parent) + 1)
+    attach_descendant_types(parent, node)
 
 def push_node(parent, node):
     if 'parent' in node:
@@ -89,11 +119,15 @@ def push_node(parent, node):
     if 'children' not in parent:
         parent['children'] = []
     parent['children'].append(node)
+    set_node_depth(node, get_node_depth(parent) + 1)
+    attach_descendant_types(parent, node)
 
 def create_node(parent, node):
     if 'children' not in node:
         node['children'] = []
     node['uuid'] = str(uuid.uuid4())
+    node['descendantTypes'] = compute_descendant_types(node) if node['children'] else 0
+    duralex.metrics.count('nodes_created')
 
     if parent:
         push_node(parent, node)
@@ -113,26 +147,107 @@ def remove_node(parent, node):
         if compare_nodes(node, parent['children'][i]):
             del parent['children'][i]
             del node['parent']
+            set_node_depth(node, 0)
+            set_stale_descendant_types(parent)
+            duralex.metrics.count('nodes_removed')
             return True
 
     return False
 
 def copy_node(node, recursive=True):
+    c = copy_single_node(node)
+    if not recursive:
+        return c
+
+    # copy the descendants with an explicit stack rather than recursively, so deep trees can't exceed the recursion limit.
+    # The copies are linked directly rather than with push_node(): their depth is known and, having the same
+    # descendants, they have the same descendant types as the copied nodes.
+    copy_descendant_types(node, c)
+    stack = [(node, c)]
+    while stack:
+        source, target = stack.pop()
+        for child in source.get('children', []):
+            child_copy = copy_single_node(child)
+            copy_descendant_types(child, child_copy)
+            child_copy['parent'] = target
+            child_copy['depth'] = target['depth'] + 1
+            target['children'].append(child_copy)
+            stack.append((child, child_copy))
+    return c
+
+def copy_descendant_types(source, target):
+    if 'descendantTypes' in source:
+        target['descendantTypes'] = source['descendantTypes']
+    else:
+        del target['descendantTypes']
+    if 'staleTypes' in source:
+        target['staleTypes'] = True
+
+def copy_single_node(node):
     c = node.copy()
+    duralex.metrics.count('nodes_created')
     if 'uuid' in c:
         c['uuid'] = str(uuid.uuid4())
     if 'parent' in c:
         del c['parent']
+    c['depth'] = 0
+    c['descendantTypes'] = 0
+    if 'staleTypes' in c:
+        del c['staleTypes']
     c['children'] = []
-    if 'children' in node and recursive:
-        for child in node['children']:
-            push_node(c, copy_node(child))
     return c
 
+# The node attributes left out by dump_node(): the links between the nodes and the attributes computed from them.
+DUMP_NODE_EXCLUDED_KEYS = ['parent', 'uuid', 'depth', 'descendantTypes', 'staleTypes', 'children']
+
+# Return a plain copy of the node and its descendants without the 'parent' links and the 'uuid' fields, suitable for
+# JSON serialization (cf load_node).
+def dump_node(node):
+    data = {k: v for k, v in node.items() if k not in DUMP_NODE_EXCLUDED_KEYS}
+    stack = [(node, data)]
+    while stack:
+        source, target = stack.pop()
+        if 'children' in source:
+            target['children'] = []
+            for child in source['children']:
+                child_data = {k: v for k, v in child.items() if k not in DUMP_NODE_EXCLUDED_KEYS}
+                target['children'].append(child_data)
+                stack.append((child, child_data))
+    return data
+
+# Rebuild a node and its descendants previously serialized with dump_node and push it in parent.
+def load_node(parent, data):
+    node = create_node(parent, {k: v for k, v in data.items() if k != 'children'})
+    stack = [(data, node)]
+    while stack:
+        source, target = stack.pop()
+        for child in source.get('children', []):
+            stack.append((child, create_node(target, {k: v for k, v in child.items() if k != 'children'})))
+    return node
+
+# The depth of the nodes attached with push_node() or unshift_node() is cached in their 'depth' attribute. It's
+# updated for the whole subtree whenever a node is attached or detached (cf set_node_depth()). The nodes linked to their
+# parent by other means (such as AddParentVisitor) have no cached depth: it's then computed from their ancestors.
 def get_node_depth(node):
-    if not 'parent' in node:
-        return 0
-    return 1 + get_node_depth(node['parent'])
+    if 'depth' in node:
+        return node['depth']
+
+    depth = 0
+    while 'parent' in node:
+        node = node['parent']
+        depth += 1
+    return depth
+
+def set_node_depth(node, depth):
+    stack = [(node, depth)]
+    while stack:
+        node, depth = stack.pop()
+        # the descendants of a node that already has the right depth are up to date too
+        if node.get('depth') == depth:
+            continue
+        node['depth'] = depth
+        if 'children' in node:
+            stack.extend((child, depth + 1) for child in node['children'])
 
 def get_root(node):
     while 'parent' in node:
@@ -143,13 +258,30 @@ def get_root(node):
 def filter_nodes(root, fn):
     return filter_nodes_rec(root, fn, [])
 
+# Append the nodes matching fn to results, in depth-first pre-order. The children are pushed in reverse order on an
+# explicit stack so they are popped in document order.
 def filter_nodes_rec(root, fn, results):
-    if fn(root):
-        results.append(root)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if fn(node):
+            results.append(node)
+        if 'children' in node:
+            stack.extend(reversed(node['children']))
+
+    return results
 
-    if 'children' in root:
-        for child in root['children']:
-            filter_nodes_rec(child, fn, results)
+# Same as filter_nodes() for the nodes of the given types, but the subtrees without any node of those types are skipped.
+def filter_nodes_of_type(root, types, fn=None):
+    mask = get_type_mask(tuple(types))
+    results = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if 'type' in node and node['type'] in types and (fn is None or fn(node)):
+            results.append(node)
+        if 'children' in node and ('descendantTypes' not in node or node['descendantTypes'] & mask):
+            stack.extend(reversed(node['children']))
 
     return results
 
@@ -165,6 +297,93 @@ def is_root(node):
 def get_node_descendants(node):
     return filter_nodes(node, lambda n: True)
 
+# The types of the descendants of the nodes built with create_node() are cached in their 'descendantTypes' mask:
+# - when a node is attached, its types are added to the masks of its new ancestors;
+# - when a node is detached (or its type is changed), the masks of its former ancestors may have bits too many: they are
+#   flagged with 'staleTypes' and only recomputed when an exact answer is needed (cf get_descendant_types()). The parser
+#   detaches a lot of nodes it has just tried, so recomputing the masks right away would cost too much.
+# A stale mask is still a superset of the actual types: it's enough to skip the subtrees without some types (cf
+# filter_nodes_of_type()). The nodes without any mask have it computed from their descendants.
+def get_descendant_types(node):
+    if 'staleTypes' in node:
+        refresh_descendant_types(node)
+    return node['descendantTypes'] if 'descendantTypes' in node else compute_descendant_types(node)
+
+def compute_descendant_types(node):
+    mask = 0
+    for child in (node['children'] if 'children' in node else []):
+        mask |= get_node_type_bit(child) | get_descendant_types(child)
+    return mask
+
+# Recompute the stale masks of the subtree, children first.
+def refresh_descendant_types(node):
+    if 'staleTypes' not in node:
+        return
+
+    stack = [(node, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            node['descendantTypes'] = compute_descendant_types(node)
+            del node['staleTypes']
+        else:
+            stack.append((node, True))
+            for child in (node['children'] if 'children' in node else []):
+                if 'staleTypes' in child:
+                    stack.append((child, False))
+
+def add_descendant_types(node, mask):
+    while True:
+        if 'descendantTypes' in node:
+            if node['descendantTypes'] | mask == node['descendantTypes']:
+                return
+            node['descendantTypes'] |= mask
+        if 'parent' not in node:
+            return
+        node = node['parent']
+
+def set_stale_descendant_types(node):
+    while True:
+        if 'staleTypes' in node:
+            # its ancestors are already stale too
+            return
+        if 'descendantTypes' in node:
+            node['staleTypes'] = True
+        if 'parent' not in node:
+            return
+        node = node['parent']
+
+def attach_descendant_types(parent, node):
+    if 'descendantTypes' in node:
+        add_descendant_types(parent, get_node_type_bit(node) | node['descendantTypes'])
+        if 'staleTypes' in node:
+            set_stale_descendant_types(parent)
+    else:
+        add_descendant_types(parent, get_node_type_bit(node) | compute_descendant_types(node))
+
+def set_node_type(node, node_type):
+    node['type'] = node_type
+    if 'parent' in node:
+        set_stale_descendant_types(node['parent'])
+        add_descendant_types(node['parent'], get_node_type_bit(node))
+
+def iter_node_ancestors(node):
+    while 'parent' in node:
+        node = node['parent']
+        yield node
+
+def has_ancestor_of_type(node, types):
+    for ancestor in iter_node_ancestors(node):
+        if 'type' in ancestor and ancestor['type'] in types:
+            return True
+    return False
+
+def has_descendant_of_type(node, types):
+    return get_descendant_types(node) & get_type_mask(tuple(types)) != 0
+
+def has_node_of_type(node, types):
+    return ('type' in node and node['type'] in types) or has_descendant_of_type(node, types)
+
 def get_node_ancestors(node):
     a = []
 
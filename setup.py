@@ -6,11 +6,15 @@ setup(
     install_requires=[
         'html5lib',
         'simplejson',
-        'beautifulsoup4'
+        'beautifulsoup4',
+        'requests'
     ],
     packages=[
         'duralex'
     ],
+    package_data={
+        'duralex': ['code_names.txt']
+    },
     scripts=[
         'bin/duralex'
     ]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import pickle
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.alinea_lexer as lexer
+
+class AlineaLexerTest(DuralexTestCase):
+    def test_lowered_tokens(self):
+        tokens = lexer.tokenize(u'À la fin du Code civil')
+        self.assertEqual(tokens, [u'À', u' ', u'la', u' ', u'fin', u' ', u'du', u' ', u'Code', u' ', u'civil'])
+        self.assertEqual(tokens.lowered, [t.lower() for t in tokens])
+
+    def test_sentinel_tokens(self):
+        tokens = lexer.tokenize(u'Le code')
+        self.assertEqual(len(tokens), 3)
+        self.assertEqual(list(tokens), [u'Le', u' ', u'code'])
+        self.assertEqual(tokens[3 + lexer.TOKEN_PADDING - 1], lexer.TOKEN_SENTINEL)
+        self.assertEqual(tokens.lowered[5], lexer.TOKEN_SENTINEL)
+        self.assertEqual(''.join(tokens[0:8]), u'Le code')
+
+    def test_sentinel_tokens_hidden(self):
+        tokens = lexer.tokenize(u'Le code')
+        items = [u'Le', u' ', u'code']
+        self.assertEqual(tokens[-1], u'code')
+        self.assertEqual(tokens.lowered[-3], u'le')
+        with self.assertRaises(IndexError):
+            tokens[-4]
+        self.assertEqual(tokens[1:], items[1:])
+        self.assertEqual(tokens[-2:], items[-2:])
+        self.assertEqual(tokens[::-1], items[::-1])
+        self.assertEqual(list(reversed(tokens)), items[::-1])
+        self.assertNotIn(lexer.TOKEN_SENTINEL, tokens)
+        self.assertIn(u'code', tokens)
+        self.assertEqual(tokens.count(lexer.TOKEN_SENTINEL), 0)
+        with self.assertRaises(ValueError):
+            tokens.index(lexer.TOKEN_SENTINEL)
+        self.assertEqual(tokens.index(u'code'), 2)
+        self.assertEqual(tokens + [u'!'], items + [u'!'])
+        self.assertEqual([u'!'] + tokens, [u'!'] + items)
+        self.assertEqual(tokens * 2, items * 2)
+        self.assertEqual(tokens.copy(), items)
+        self.assertEqual(json.dumps(tokens), json.dumps(items))
+        self.assertEqual(pickle.loads(pickle.dumps(tokens))[3], lexer.TOKEN_SENTINEL)
+        self.assertEqual(copy.copy(tokens).lowered, [u'le', u' ', u'code'])
+
+    def test_skip_to_token(self):
+        text = u'L\'article 1er de la loi n° 78-17 est ainsi modifié :\n"Art. 1er. - Texte" ;'
+        tokens = lexer.tokenize(text)
+        for token in lexer.TOKEN_ANCHORS + [u'article', u'absent']:
+            for i in range(0, len(tokens) + 2):
+                self.assertEqual(
+                    lexer.skip_to_token(tokens, i, token),
+                    lexer.skip_to_token(list(tokens), i, token)
+                )
+
+    def test_skip_to_quote_start_long_alinea(self):
+        tokens = lexer.tokenize(u' '.join([u'mot'] * 20000) + u' "citation"')
+        for i in range(0, len(tokens) - 3, 1000):
+            self.assertEqual(lexer.skip_to_quote_start(tokens, i), len(tokens) - 3)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from DuralexTestCase import DuralexTestCase
+
+import json
+
+import duralex.amendment_parser
+import duralex.tree
+
+class AmendmentParserTest(DuralexTestCase):
+    def make_amendment(self, numero, sujet, texte, sort=u'Adopté'):
+        return {'amendement': {
+            'numero': numero,
+            'sujet': sujet,
+            'texte': texte,
+            'sort': sort,
+            'expose': u'<p>Exposé</p>',
+            'signataires': u'M. A, Mme B',
+            'source': u'http://www.nosdeputes.fr/14/amendement/1561/' + numero,
+        }}
+
+    def parse_amendments(self, amendments, cache=None):
+        tree = duralex.tree.create_node(None, {})
+        duralex.amendment_parser.parse({'amendements': amendments}, tree, cache)
+        return tree
+
+    def test_cache_hit(self):
+        cache = {}
+        amendments = [self.make_amendment(u'1', u'ART. PREMIER', u'<p>Supprimer cet article.</p>')]
+        tree = self.parse_amendments(amendments, cache)
+        self.assertIn(u'1', cache)
+        self.assertEqualAST(self.parse_amendments(amendments, cache), tree)
+
+    def test_cache_refresh_status(self):
+        cache = {}
+        self.parse_amendments([self.make_amendment(u'1', u'ART. PREMIER', u'<p>Supprimer cet article.</p>')], cache)
+        tree = self.parse_amendments(
+            [self.make_amendment(u'1', u'ART. PREMIER', u'<p>Supprimer cet article.</p>', u'Rejeté')],
+            cache
+        )
+        self.assertEqual(tree['children'][0]['status'], 'rejected')
+        self.assertEqual(tree['children'][0]['children'][0]['editType'], 'delete')
+
+    def test_cache_modified_text(self):
+        cache = {}
+        self.parse_amendments([self.make_amendment(u'1', u'ART. PREMIER', u'<p>Supprimer cet article.</p>')], cache)
+        checksum = cache[u'1']['checksum']
+        amendments = [self.make_amendment(u'1', u'ART. 2', u'<p>Supprimer cet article.</p>')]
+        self.assertEqualAST(self.parse_amendments(amendments, cache), self.parse_amendments(amendments))
+        self.assertNotEqual(cache[u'1']['checksum'], checksum)
+
+    def test_cache_modified_subject_and_text(self):
+        cache = {}
+        self.parse_amendments([self.make_amendment(u'1', u'ART. 1', u'0<p>Supprimer cet article.</p>')], cache)
+        checksum = cache[u'1']['checksum']
+        self.parse_amendments([self.make_amendment(u'1', u'ART. 10', u'<p>Supprimer cet article.</p>')], cache)
+        self.assertNotEqual(cache[u'1']['checksum'], checksum)
+
+    def test_read_amendments(self):
+        amendments = [
+            self.make_amendment(u'1', u'ART. PREMIER', u'<p>Supprimer cet article.</p>'),
+            self.make_amendment(u'2', u'APRÈS ART. 3', u'<p>Texte avec des caractères spéciaux : "[]{},"</p>'),
+        ]
+        data = json.dumps({'amendements': amendments}, indent=1, ensure_ascii=False)
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+        self.assertEqual(
+            list(duralex.amendment_parser.read_amendments(chunks)),
+            [a['amendement'] for a in amendments]
+        )
+
+    def test_read_amendments_empty(self):
+        self.assertEqual(list(duralex.amendment_parser.read_amendments(['{"amendements": [', ' ]}'])), [])
+
+    def test_read_amendments_truncated(self):
+        with self.assertRaises(ValueError):
+            list(duralex.amendment_parser.read_amendments(['{"amendements": [{"amendement": {"numero": "1"']))
+
+    def test_parse_subject(self):
+        tree = duralex.tree.create_node(None, {})
+        duralex.amendment_parser.parse_subject(u'ART. PREMIER', tree)
+        duralex.amendment_parser.parse_subject(u'APRÈS ART. 3', tree)
+        duralex.amendment_parser.parse_subject(u'AVANT ART. 2 BIS', tree)
+        self.assertEqualAST(tree, {'children': [
+            {
+                'type': u'bill-article-reference',
+                'order': 1
+            },
+            {
+                'type': u'bill-article-reference',
+                'position': u'after',
+                'order': 3
+            },
+            {
+                'type': u'bill-article-reference',
+                'position': u'before',
+                'order': 2
+            }
+        ]})
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import io
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.diff_parser
+import duralex.tree
+
+DIFF = (
+    u"diff --git a/loi_78-17/Article_1.md b/loi_78-17/Article_1.md\n"
+    u"index 84f11a0..ae2e294 100644\n"
+    u"--- a/loi_78-17/Article_1.md\n"
+    u"+++ b/loi_78-17/Article_1.md\n"
+    u"@@ -1,4 +1,6 @@\n"
+    u" Alinea 1\n"
+    u"-Alinea 2\n"
+    u"+Nouveau 2\n"
+    u"+Nouveau 2 bis\n"
+    u" Alinea 3\n"
+    u" Alinea 4\n"
+    u"+Alinea 5\n"
+    u"diff --git a/loi_78-17/Article_2.md b/loi_78-17/Article_2.md\n"
+    u"deleted file mode 100644\n"
+    u"index e834e3f..0000000\n"
+    u"--- a/loi_78-17/Article_2.md\n"
+    u"+++ /dev/null\n"
+    u"@@ -1 +0,0 @@\n"
+    u"-Texte\n"
+)
+
+class DiffParserTest(DuralexTestCase):
+    def make_edit(self, edit_type, article_id, words=None):
+        edit = {
+            'type': u'edit',
+            'editType': edit_type,
+            'children': [
+                {
+                    'type': u'law-reference',
+                    'id': u'78-17',
+                    'children': [
+                        {
+                            'type': u'article-reference',
+                            'id': article_id
+                        }
+                    ]
+                }
+            ]
+        }
+        if words:
+            edit['children'].append({
+                'type': u'word-definition',
+                'children': [{'type': u'quote', 'words': w} for w in words]
+            })
+        return edit
+
+    def test_parse(self):
+        tree = duralex.tree.create_node(None, {})
+        duralex.diff_parser.parse(DIFF, tree)
+        self.assertEqualAST(tree, {'children': [
+            {
+                'type': u'amendment',
+                'id': u'1',
+                'children': [
+                    self.make_edit(u'delete', u'1', [u'Alinea 2\n']),
+                    self.make_edit(u'add', u'1', [u'Nouveau 2\n', u'Nouveau 2 bis\n']),
+                    self.make_edit(u'add', u'1', [u'Alinea 5\n']),
+                ]
+            },
+            {
+                'type': u'amendment',
+                'id': u'1',
+                'children': [
+                    self.make_edit(u'delete', u'2'),
+                ]
+            }
+        ]})
+
+    def test_parse_stream(self):
+        tree = duralex.tree.create_node(None, {})
+        duralex.diff_parser.parse_stream(io.StringIO(DIFF), tree)
+        self.assertEqualAST(tree, {'children': [
+            {
+                'type': u'amendment',
+                'id': u'1',
+                'children': [
+                    self.make_edit(u'delete', u'1', [u'Alinea 2\n']),
+                    self.make_edit(u'add', u'1', [u'Nouveau 2\nNouveau 2 bis\n']),
+                    self.make_edit(u'add', u'1', [u'Alinea 5\n']),
+                ]
+            },
+            {
+                'type': u'amendment',
+                'id': u'1',
+                'children': [
+                    self.make_edit(u'delete', u'2'),
+                ]
+            }
+        ]})
+
+    def test_iter_file_diffs(self):
+        self.assertEqual(len(list(duralex.diff_parser.iter_file_diffs(io.StringIO(DIFF)))), 2)
+
+    def test_parse_workers(self):
+        tree = duralex.tree.create_node(None, {})
+        duralex.diff_parser.parse(DIFF, tree)
+        parallel_tree = duralex.tree.create_node(None, {})
+        duralex.diff_parser.parse(DIFF, parallel_tree, workers=2)
+        self.assertEqualAST(parallel_tree, tree)
+
+    def test_iter_amendments_workers_window(self):
+        read = []
+        def lines():
+            for n in range(0, 50):
+                read.append(n)
+                for line in io.StringIO(DIFF):
+                    yield line
+        amendments = duralex.diff_parser.iter_amendments(lines(), workers=1)
+        next(amendments)
+        # only a window of file patches is read ahead of the results
+        self.assertLess(len(read), 5)
+        self.assertEqual(len(list(amendments)), 99)
+
+    def test_parse_law_id(self):
+        self.assertEqual(duralex.diff_parser.parse_law_id(u'a/loi_78-17/Article_1.md'), u'78-17')
+        self.assertEqual(duralex.diff_parser.parse_article_id(u'a/loi_78-17/Article_1.md'), u'1')
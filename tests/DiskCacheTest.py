@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from DuralexTestCase import DuralexTestCase
+
+from duralex.cache import DiskCache
+
+class DiskCacheTest(DuralexTestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_get_set(self):
+        cache = DiskCache(os.path.join(self.path, 'test'))
+        self.assertIsNone(cache.get(u'key'))
+        self.assertNotIn(u'key', cache)
+        cache[u'key'] = {'words': u'élément'}
+        self.assertIn(u'key', cache)
+        self.assertEqual(DiskCache(os.path.join(self.path, 'test'))[u'key'], {'words': u'élément'})
+        del cache[u'key']
+        with self.assertRaises(KeyError):
+            cache[u'key']
+
+    def test_evict(self):
+        cache = DiskCache(self.path, 250)
+        for key in ['a', 'b', 'c']:
+            cache[key] = 'x' * 100
+            # make sure each entry has a distinct access time
+            os.utime(cache.get_path(key), (len(os.listdir(self.path)), len(os.listdir(self.path))))
+        self.assertNotIn('a', cache)
+        self.assertIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_evict_once(self):
+        cache = DiskCache(self.path, 1000)
+        with mock.patch('duralex.cache.os.scandir', wraps=os.scandir) as scandir:
+            for i in range(0, 9):
+                cache[str(i)] = 'x' * 100
+                # the size of the replaced entries is not counted twice
+                cache[str(i)] = 'x' * 100
+            # the size of the directory is only read on the first write
+            self.assertEqual(scandir.call_count, 1)
+            cache['9'] = 'x' * 100
+            cache['10'] = 'x' * 100
+            self.assertEqual(scandir.call_count, 2)
+        self.assertLessEqual(sum(os.path.getsize(os.path.join(self.path, name)) for name in os.listdir(self.path)), 1000)
+        self.assertIn('10', cache)
+
+    def test_namespace(self):
+        a = DiskCache(self.path, namespace=(14, u'1561'))
+        b = DiskCache(self.path, namespace=(14, u'1562'))
+        a[u'1'] = u'a'
+        b[u'1'] = u'b'
+        self.assertEqual(a[u'1'], u'a')
+        self.assertEqual(b[u'1'], u'b')
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import contextlib
+import importlib.machinery
+import importlib.util
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from DuralexTestCase import DuralexTestCase
+from DiffParserTest import DIFF
+
+ROOT = os.path.join(os.path.realpath(os.path.dirname(__file__)), '..')
+
+BILL = u'''Article 1er
+L'article 11 de la loi n° 78-753 du 17 juillet 1978 est abrogé.
+'''
+
+def load_script():
+    loader = importlib.machinery.SourceFileLoader('duralex_script', os.path.join(ROOT, 'bin', 'duralex'))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(loader.name, loader))
+    loader.exec_module(module)
+    return module
+
+class DuralexScriptTest(DuralexTestCase):
+    def setUp(self):
+        self.script = load_script()
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def make_args(self, **kwargs):
+        args = argparse.Namespace(
+            url=None,
+            quiet=False,
+            uuid=False,
+            amendments=False,
+            jobs=None,
+            merge_diff_lines=False,
+            cache_dir=self.path,
+            no_cache=False,
+            offline=True,
+            memory_report=False,
+            article_max_steps=None,
+            article_timeout=None,
+            code_names=None,
+            debug=False,
+        )
+        for key, value in kwargs.items():
+            setattr(args, key, value)
+        return args
+
+    def handle_data(self, args, data=BILL):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            self.script.handle_data(data, args)
+        return out.getvalue()
+
+    def test_result_cache_url(self):
+        url = 'http://www.assemblee-nationale.fr/14/propositions/pion1561.asp'
+        self.assertEqual(json.loads(self.handle_data(self.make_args()))['url'], None)
+        # the same bill from another URL is not the cached result of the first one
+        result = json.loads(self.handle_data(self.make_args(url=url)))
+        self.assertEqual(result['url'], url)
+        self.assertEqual(result['id'], json.loads(self.handle_data(self.make_args(url=url)))['id'])
+
+    def test_result_cache_memory_report(self):
+        self.handle_data(self.make_args())
+        self.assertIsNone(self.script.get_result_cache_key(BILL, self.make_args(memory_report=True)))
+        err = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(err):
+            self.script.handle_data(BILL, self.make_args(memory_report=True))
+        self.assertIn('node type', err.getvalue())
+
+    def test_diff(self):
+        # the lines of a diff file are parsed as they are read, the same way
+        self.assertEqual(
+            self.handle_data(self.make_args(no_cache=True), iter(io.StringIO(DIFF))),
+            self.handle_data(self.make_args(no_cache=True), DIFF)
+        )
+        # the consecutive lines of a diff are only merged on demand
+        self.assertNotEqual(
+            self.handle_data(self.make_args(no_cache=True, merge_diff_lines=True), DIFF),
+            self.handle_data(self.make_args(no_cache=True), DIFF)
+        )
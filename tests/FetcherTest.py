@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+import http.server
+import threading
+
+from DuralexTestCase import DuralexTestCase
+
+from duralex.fetch import Fetcher, OfflineCacheMiss
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        content = u'{"amendements": []}'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('ETag', '"v1"')
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+class FetcherTest(DuralexTestCase):
+    def setUp(self):
+        StandInHandler.requests = []
+        self.server = http.server.HTTPServer(('127.0.0.1', 0), StandInHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = 'http://127.0.0.1:%d/amendements/json' % self.server.server_port
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_etag(self):
+        cache = {}
+        fetcher = Fetcher(cache)
+        self.assertEqual(fetcher.get(self.url).json(), {'amendements': []})
+        res = fetcher.get(self.url)
+        self.assertEqual(res.json(), {'amendements': []})
+        self.assertEqual(res.encoding, 'utf-8')
+        self.assertEqual(StandInHandler.requests, [None, '"v1"'])
+
+    def test_offline(self):
+        cache = {}
+        Fetcher(cache).get(self.url)
+        res = Fetcher(cache, offline=True).get(self.url)
+        self.assertEqual(u''.join(res.iter_content(4, decode_unicode=True)), u'{"amendements": []}')
+        self.assertEqual(len(StandInHandler.requests), 1)
+
+    def test_offline_cache_miss(self):
+        with self.assertRaises(OfflineCacheMiss):
+            Fetcher({}, offline=True).get(self.url)
+        self.assertEqual(StandInHandler.requests, [])
+
+    def test_stream(self):
+        cache = {}
+        res = Fetcher(cache).get(self.url, stream=True)
+        self.assertEqual(u''.join(res.iter_content(4, decode_unicode=True)), u'{"amendements": []}')
+        # the streamed content is not read in memory to be stored
+        self.assertEqual(cache, {})
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import tracemalloc
+from unittest import mock
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.tree
+from duralex.memory import MemoryProfiler, format_memory_report, get_tree_memory_report
+
+class MemoryReportTest(DuralexTestCase):
+    def test_tree_memory_report(self):
+        tree = duralex.tree.create_node(None, {})
+        edit = duralex.tree.create_node(tree, {'type': u'edit', 'editType': u'delete'})
+        duralex.tree.create_node(edit, {'type': u'article-reference', 'id': u'L. 111-1'})
+        duralex.tree.create_node(edit, {'type': u'article-reference', 'id': u'L. 111-2'})
+
+        report = get_tree_memory_report(tree)
+        self.assertEqual(report['nodes']['edit']['count'], 1)
+        self.assertEqual(report['nodes']['article-reference']['count'], 2)
+        self.assertEqual(report['nodes']['<root>']['count'], 1)
+        self.assertEqual(report['total'], sum(n['bytes'] for n in report['nodes'].values()))
+        self.assertEqual(report['attributes']['uuid']['count'], 4)
+        self.assertEqual(report['attributes']['parent']['count'], 3)
+        self.assertEqual(report['attributes']['empty-children']['count'], 2)
+
+    def test_memory_profiler(self):
+        profiler = MemoryProfiler()
+        with profiler.phase('allocate'):
+            data = [bytearray(1024) for i in range(0, 100)]
+        self.assertEqual(profiler.phases[0]['name'], 'allocate')
+        self.assertGreaterEqual(profiler.phases[0]['allocated'], 100 * 1024)
+
+    def test_memory_profiler_without_reset_peak(self):
+        profiler = MemoryProfiler()
+        # Python < 3.9
+        with mock.patch.dict(tracemalloc.__dict__):
+            del tracemalloc.reset_peak
+            with profiler.phase('allocate'):
+                data = [bytearray(1024) for i in range(0, 100)]
+            tracemalloc.start()
+            try:
+                with profiler.phase('nested'):
+                    pass
+            finally:
+                tracemalloc.stop()
+        self.assertGreaterEqual(profiler.phases[0]['peak'], 100 * 1024)
+        self.assertIsNone(profiler.phases[1]['peak'])
+        report = format_memory_report(get_tree_memory_report(duralex.tree.create_node(None, {})), profiler.phases)
+        self.assertEqual(report.splitlines()[-1].split()[:2], ['nested', '-'])
+
+    def test_memory_profiler_disabled(self):
+        profiler = MemoryProfiler(False)
+        with profiler.phase('allocate'):
+            pass
+        self.assertEqual(profiler.phases, [])
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.alinea_lexer
+import duralex.metrics
+import duralex.tree
+from duralex.metrics import Metrics
+
+class MetricsTest(DuralexTestCase):
+    def tearDown(self):
+        duralex.metrics.disable()
+
+    def test_span_count(self):
+        metrics = Metrics()
+        for i in range(0, 2):
+            with metrics.span('parse'):
+                metrics.count('nodes_created', 3)
+        self.assertEqual(metrics.spans['parse']['count'], 2)
+        self.assertGreaterEqual(metrics.spans['parse']['seconds'], 0)
+        self.assertEqual(metrics.counters, {'nodes_created': 6})
+        self.assertEqual(json.loads(metrics.to_json())['counters'], {'nodes_created': 6})
+
+    def test_disabled(self):
+        metrics = Metrics(False)
+        with metrics.span('parse'):
+            metrics.count('nodes_created')
+        self.assertEqual(metrics.spans, {})
+        self.assertEqual(metrics.counters, {})
+
+    def test_prometheus(self):
+        metrics = Metrics()
+        with metrics.span('tokenize'):
+            metrics.count('tokens', 12)
+        lines = metrics.to_prometheus().splitlines()
+        self.assertIn('duralex_span_calls_total{span="tokenize"} 1', lines)
+        self.assertIn('# TYPE duralex_tokens_total counter', lines)
+        self.assertIn('duralex_tokens_total 12', lines)
+
+    def test_library_counters(self):
+        metrics = duralex.metrics.enable()
+        tree = duralex.tree.create_node(None, {})
+        node = duralex.tree.create_node(tree, {'type': u'edit'})
+        duralex.tree.remove_node(tree, node)
+        duralex.alinea_lexer.tokenize(u'Le code civil')
+        self.assertEqual(metrics.counters['nodes_created'], 2)
+        self.assertEqual(metrics.counters['nodes_removed'], 1)
+        self.assertEqual(metrics.counters['tokens'], 5)
+        self.assertEqual(metrics.spans['tokenize']['count'], 1)
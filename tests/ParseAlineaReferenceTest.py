@@ -146,6 +146,20 @@ class ParseAlineaReferenceTest(DuralexTestCase):
             ]}
         )
 
+    def test_number_word_alinea_above_sixteen(self):
+        self.assertEqualAST(
+            self.call_parse_func(
+                parser.parse_alinea_reference,
+                u"au dix-septième alinéa"
+            ),
+            {'children': [
+                {
+                    'order': 17,
+                    'type': u'alinea-reference'
+                }
+            ]}
+        )
+
     def test_number_word_alinea_2(self):
         self.assertEqualAST(
             self.call_parse_func(
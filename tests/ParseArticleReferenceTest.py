@@ -262,3 +262,20 @@ class ParseArticleReferenceTest(DuralexTestCase):
                 }
             ]}
         )
+
+    def test_long_article_reference_list(self):
+        tree = self.call_parse_func(
+            parser.parse_reference_list,
+            u"l'article " + u" et l'article ".join(u'L. ' + str(i) for i in range(1, 1501)) + u' du code civil'
+        )
+        self.assertEqual(len(tree['children']), 1500)
+        self.assertEqual(tree['children'][-1]['id'], u'L. 1500')
+        self.assertEqual(tree['children'][-1]['children'][0]['id'], u'code civil')
+
+    def test_long_article_reference_list_with_comas(self):
+        tree = self.call_parse_func(
+            parser.parse_reference_list,
+            u"à l'article " + u", à l'article ".join(u'L. ' + str(i) for i in range(1, 1501))
+        )
+        self.assertEqual(len(tree['children']), 1500)
+        self.assertEqual(tree['children'][-1]['id'], u'L. 1500')
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+from unittest import mock
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.alinea_parser as parser
+import duralex.metrics
+import duralex.tree
+
+class ParseBillArticleTest(DuralexTestCase):
+    def tearDown(self):
+        duralex.metrics.disable()
+
+    def make_bill(self, *articles):
+        return {'articles': [
+            {'order': i + 1, 'alineas': {'001': alinea}} for i, alinea in enumerate(articles)
+        ]}
+
+    def parse_bill(self, data, cache=None, budget=None):
+        tree = duralex.tree.create_node(None, {})
+        parser.parse(data, tree, cache, budget)
+        return tree
+
+    def test_cache_revised_bill(self):
+        cache = {}
+        self.parse_bill(self.make_bill(
+            u"L'article L. 111-1 du code de la route est abrogé.",
+            u"L'article L. 111-2 du code civil est abrogé."
+        ), cache)
+        self.assertEqual(len(cache), 2)
+
+        revised_bill = self.make_bill(
+            u"L'article L. 111-1 du code de la route est abrogé.",
+            u"L'article L. 111-3 du code civil est abrogé."
+        )
+        tree = self.parse_bill(revised_bill, cache)
+        self.assertEqual(len(cache), 3)
+        self.assertEqualAST(tree, self.parse_bill(revised_bill))
+
+    def test_cache_contextual_article(self):
+        cache = {}
+        tree = self.parse_bill(self.make_bill(
+            u"L'article L. 111-1 du code de la route est abrogé.",
+            u"L'article L. 111-2 du même code est abrogé."
+        ), cache)
+        # the second article refers to the code of the first one
+        self.assertEqual(len(cache), 1)
+        self.assertNotIn('isContextual', tree['children'][1])
+        self.assertEqual(tree['children'][1]['children'][0]['children'][0]['children'][0]['id'], u'code de la route')
+
+    def test_budget_exceeded(self):
+        metrics = duralex.metrics.enable()
+        cache = {}
+        tree = self.parse_bill(self.make_bill(
+            u"L'article L. 111-1 du code de la route est abrogé.",
+            u"I. - Le code civil est ainsi modifié :\n1° L'article 5 est abrogé ;\n2° L'article 6 est abrogé."
+        ), cache, parser.ParseBudget(max_steps=4))
+        self.assertEqual(tree['children'][0]['children'][0]['type'], u'edit')
+        self.assertEqual(len(tree['children'][1]['children']), 1)
+        raw_content = tree['children'][1]['children'][0]
+        self.assertEqual(raw_content['type'], u'raw-content')
+        self.assertEqual(raw_content['content'], tree['children'][1]['content'])
+        self.assertEqual(raw_content['parseError'], 'budget')
+        self.assertEqual(metrics.counters['articles_unparsed_budget'], 1)
+        # the article may be parsed with another budget
+        self.assertEqual(len(cache), 1)
+
+    def test_truncated_article(self):
+        # the rules looking past the end of the alinea read sentinel tokens instead of raising an IndexError
+        tree = self.parse_bill(self.make_bill(
+            u"I. - L'article 3 de la loi n° 78-17 du",
+            u"L'article L. 111-1 du code de la route est abrogé."
+        ))
+        header1 = tree['children'][0]['children'][0]
+        self.assertEqual(header1['type'], u'header1')
+        self.assertEqual(header1['children'][0]['type'], u'raw-content')
+        self.assertNotIn('parseError', header1['children'][0])
+        self.assertEqual(tree['children'][1]['children'][0]['type'], u'edit')
+
+    def test_syntax_error(self):
+        metrics = duralex.metrics.enable()
+        cache = {}
+        # "le même article" refers to no previous article
+        tree = self.parse_bill(self.make_bill(
+            u"II. - Le même article est abrogé.",
+            u"L'article L. 111-1 du code de la route est abrogé."
+        ), cache)
+        self.assertEqual(len(tree['children'][0]['children']), 1)
+        raw_content = tree['children'][0]['children'][0]
+        self.assertEqual(raw_content['type'], u'raw-content')
+        self.assertEqual(raw_content['content'], tree['children'][0]['content'])
+        self.assertEqual(raw_content['parseError'], 'syntax')
+        self.assertEqual(tree['children'][1]['children'][0]['type'], u'edit')
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(metrics.counters['articles_unparsed_syntax'], 1)
+        self.assertNotIn('articles_unparsed_budget', metrics.counters)
+
+    def test_syntax_error_back_references(self):
+        for text in [
+            u"Le même alinéa est supprimé.",
+            u"L'article 3 du même code est abrogé.",
+            u"L'article 3 de la même loi est abrogé.",
+        ]:
+            tree = duralex.tree.create_node(None, {})
+            parser.parse_json_alineas({'001': text}, tree, None, parser.ParseBudget(1000))
+            self.assertEqual(tree['children'][0]['parseError'], 'syntax')
+
+    def test_syntax_error_not_a_number(self):
+        with self.assertRaises(parser.ParseSyntaxError):
+            parser.parse_int(u'')
+
+    def test_truncated_references(self):
+        for text in [u"Supprimer l'alinéa", u"Les alinéas"]:
+            tree = duralex.tree.create_node(None, {})
+            parser.parse_json_alineas({'001': text}, tree, None, parser.ParseBudget(1000))
+            self.assertNotIn('parseError', tree['children'][0])
+
+    def test_index_error(self):
+        # an IndexError is a bug, not a syntax error of the article
+        with mock.patch.object(parser, 'parse_for_each', side_effect=IndexError):
+            with self.assertRaises(IndexError):
+                self.parse_bill(self.make_bill(u"L'article L. 111-1 du code de la route est abrogé."))
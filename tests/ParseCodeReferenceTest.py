@@ -1,10 +1,23 @@
 # -*- coding: utf-8 -*-
 
+import copy
+
 from DuralexTestCase import DuralexTestCase
 
 import duralex.alinea_parser as parser
+import duralex.lexicon as lexicon
 
 class ParseCodeReferenceTest(DuralexTestCase):
+    def setUp(self):
+        self.code_names = copy.deepcopy(lexicon.CODE_NAMES)
+        self.reference_cache = parser.reference_cache.dump()
+
+    def tearDown(self):
+        lexicon.CODE_NAMES.clear()
+        lexicon.CODE_NAMES.update(self.code_names)
+        parser.reference_cache.clear()
+        parser.reference_cache.load(self.reference_cache)
+
     def test_code_with_name(self):
         self.assertEqualAST(
             self.call_parse_func(
@@ -33,6 +46,57 @@ class ParseCodeReferenceTest(DuralexTestCase):
             ]}
         )
 
+    def test_known_code_name(self):
+        self.assertEqualAST(
+            self.call_parse_func(
+                parser.parse_code_reference,
+                u"du code rural et de la pêche maritime sont abrogés"
+            ),
+            {'children':[
+                {
+                    'id': u'code rural et de la pêche maritime',
+                    'type': u'code-reference'
+                }
+            ]}
+        )
+
+    def test_unknown_code_name(self):
+        self.assertEqualAST(
+            self.call_parse_func(
+                parser.parse_code_reference,
+                u"du code des marchés publics, dans sa rédaction"
+            ),
+            {'children':[
+                {
+                    'id': u'code des marchés publics',
+                    'type': u'code-reference'
+                }
+            ]}
+        )
+
+    def test_added_code_name(self):
+        self.assertEqual(
+            self.call_parse_func(
+                parser.parse_code_reference,
+                u"du code de la mer, des ports et des côtes est modifié"
+            )['children'][0]['id'],
+            u'code de la mer'
+        )
+        lexicon.add_code_names([u'code de la mer, des ports et des côtes'])
+        # the name parsed before the code name was added is not the cached one
+        self.assertEqualAST(
+            self.call_parse_func(
+                parser.parse_code_reference,
+                u"du code de la mer, des ports et des côtes est modifié"
+            ),
+            {'children':[
+                {
+                    'id': u'code de la mer, des ports et des côtes',
+                    'type': u'code-reference'
+                }
+            ]}
+        )
+
     def test_the_same_code(self):
         self.assertEqualAST(
             self.call_parse_func(
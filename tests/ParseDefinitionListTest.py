@@ -173,3 +173,11 @@ class ParseDefinitionListTest(DuralexTestCase):
             ]}
         )
     
+
+    def test_long_word_definition_list(self):
+        tree = self.call_parse_func(
+            parser.parse_definition_list,
+            u' et '.join(u'les mots "' + str(i) + u'"' for i in range(1, 1501))
+        )
+        self.assertEqual(len(tree['children']), 1500)
+        self.assertEqual(tree['children'][-1]['children'][0]['words'], u'1500')
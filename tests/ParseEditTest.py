@@ -2,7 +2,9 @@
 
 from DuralexTestCase import DuralexTestCase
 
+import duralex.alinea_lexer as lexer
 import duralex.alinea_parser as parser
+import duralex.tree
 
 class ParseEditTest(DuralexTestCase):
     def test_delete_article(self):
@@ -598,3 +600,61 @@ class ParseEditTest(DuralexTestCase):
                 }
             ]}
         )
+
+    def test_delete_articles_of_known_code(self):
+        # the code name ends before "sont abrogés", which has no comma nor "est"
+        self.assertEqualAST(
+            self.call_parse_func(
+                parser.parse_edit,
+                u"Les articles L. 1 et L. 2 du code de commerce sont abrogés."
+            ),
+            {'children':[
+                {
+                    'editType': 'delete',
+                    'type': 'edit',
+                    'children': [
+                        {
+                            'id': u'L. 1',
+                            'type': u'article-reference',
+                            'children': [
+                                {
+                                    'id': u'code de commerce',
+                                    'type': u'code-reference'
+                                }
+                            ]
+                        },
+                        {
+                            'id': u'L. 2',
+                            'type': u'article-reference',
+                            'children': [
+                                {
+                                    'id': u'code de commerce',
+                                    'type': u'code-reference'
+                                }
+                            ]
+                        }
+                    ]
+                }
+            ]}
+        )
+
+    def test_edit_failures(self):
+        tokens = lexer.tokenize(u'Le présent texte entre en vigueur.\nL\'article 2 est abrogé.')
+        tree = duralex.tree.create_node(None, {})
+        self.assertEqual(parser.parse_edit(tokens, 0, tree), 0)
+        self.assertEqual(tokens.edit_failures, {0: 0})
+        # the rules are not tried again
+        tokens.budget = parser.ParseBudget(max_steps=0)
+        self.assertEqual(parser.parse_edit(tokens, 0, tree), 0)
+        self.assertEqual(tree['children'], [])
+
+    def test_reference_starts(self):
+        tokens = lexer.tokenize(u'Texte l\'ordonnance n° 2016-1 : "Art. 1er" ; après cela')
+        starts = parser.get_reference_starts(tokens)
+        self.assertEqual(
+            [tokens[i] for i in range(0, len(tokens)) if starts[i] and lexer.TOKEN_WORD.match(tokens[i])],
+            [u'Texte', u'l', u'après']
+        )
+        # the quote and spaces before "après" are skipped by parse_word_reference()
+        self.assertTrue(starts[tokens.index(u';')])
+        self.assertFalse(starts[tokens.index(u'Art')])
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.alinea_lexer as lexer
+import duralex.alinea_parser as parser
+import duralex.tree
+
+# A phrase parsed by each rule reading tokens past its current position without checking len(tokens) first
+PHRASES = [
+    (parser.parse_subparagraph_definition, u'un sous-paragraphe 3 ainsi rédigé : "texte"'),
+    (parser.parse_law_reference, u"l'ordonnance n° 2005-1516 du 8 décembre 2005 modifiant la loi n° 78-17"),
+    (parser.parse_law_reference, u'de la loi organique n° 78-17 du 6 janvier 1978 modifiant le code civil'),
+    (parser.parse_sentence_definition, u'deux phrases ainsi rédigées : "a" "b"'),
+    (parser.parse_article_definition, u'un article L. 111-1 ainsi rédigé : "texte"'),
+    (parser.parse_alinea_definition, u'un alinéa ainsi rédigé : "texte"'),
+    (parser.parse_header1_definition, u'un I ainsi rédigé : "texte"'),
+    (parser.parse_header2_definition, u'un 3° ainsi rédigé : "texte"'),
+    (parser.parse_header3_definition, u'un a ainsi rédigé : "texte"'),
+    (parser.parse_article_reference, u"l'article L. 111-1 A du code civil"),
+    (parser.parse_alinea_reference, u"les alinéas 2, 3 et 4 de l'article 5"),
+    (parser.parse_alinea_reference, u"l'alinéa 3 de l'article 5"),
+    (parser.parse_edit, u"l'article 3 est ainsi rédigé : \"texte\""),
+    (parser.parse_edit, u"l'article 3 est remplacé par les mots : \"texte\""),
+    (parser.parse_edit, u"après l'article 3, il est inséré un article 3 bis ainsi rédigé : \"texte\""),
+    (parser.parse_edit, u"l'article L. 123-4-1 est ainsi rétabli"),
+    (parser.parse_edit, u"l'article 3 est complété par un alinéa ainsi rédigé : \"texte\""),
+    (parser.parse_edit, u"l'article 42 est ratifié"),
+    (parser.parse_edit, u"l'article 3 est abrogé."),
+    (parser.parse_definition_list, u'les mots "a", à les mots "b" et deux phrases ainsi rédigées : "c" "d"'),
+    (parser.parse_reference_list, u"l'article 3, à l'article 4 et l'article 5 du code civil"),
+    (parser.parse_header2, u'3° Le code civil est modifié'),
+    (parser.parse_section_reference, u'de la section 2 du chapitre II'),
+]
+
+class ParseEndOfInputTest(DuralexTestCase):
+    def test_truncated_phrases(self):
+        # the rules read the sentinels past the end of the alinea: a phrase cut anywhere doesn't raise
+        for fn, text in PHRASES:
+            self.assertNotEqual(self.call_parse_func(fn, text)['children'][0]['type'], u'raw-content')
+            tokens = list(lexer.tokenize(text))
+            for j in range(0, len(tokens)):
+                with self.subTest(rule=fn.__name__, text=u''.join(tokens[:j])):
+                    self.call_parse_func(fn, u''.join(tokens[:j]))
+
+    def test_truncated_alinea_references(self):
+        for text in [u"L'alinéa", u"les alinéas"]:
+            self.assertEqual(self.call_parse_func(parser.parse_alinea_reference, text)['children'], [])
+        for text in [u"les alinéas 2,", u"les alinéas 2 et"]:
+            tree = self.call_parse_func(parser.parse_alinea_reference, text)
+            self.assertEqual([n['order'] for n in tree['children']], [2])
+
+    def test_truncated_lists(self):
+        for text in [u"l'article 3,", u"l'article 3, à", u"l'article 3 et"]:
+            tree = self.call_parse_func(parser.parse_reference_list, text)
+            self.assertEqual([n['type'] for n in tree['children']], [u'article-reference'])
+        for text in [u'les mots "a",', u'les mots "a", à', u'les mots "a" et']:
+            tree = self.call_parse_func(parser.parse_definition_list, text)
+            self.assertEqual([n['type'] for n in tree['children']], [u'word-definition'])
+
+    def test_truncated_alineas(self):
+        for text in [u"Supprimer l'alinéa", u"Supprimer les alinéas", u"Supprimer la section"]:
+            tree = duralex.tree.create_node(None, {})
+            parser.parse_alineas(text, tree)
+            self.assertEqual(len(tree['children']), 1)
@@ -175,3 +175,18 @@ class ParseLawReferenceTest(DuralexTestCase):
                 }
             ]}
         )
+
+    def test_cached_law_name(self):
+        parser.reference_cache.clear()
+        for i in range(0, 2):
+            self.assertEqualAST(
+                self.call_parse_func(parser.parse_law_reference, u"la loi n° 78-17 modifiée"),
+                {'children':[{'type': u'law-reference', 'id': u'78-17'}]}
+            )
+        self.assertEqual(parser.reference_cache.hits, 1)
+        # the date isn't in the cached tokens
+        self.assertEqualAST(
+            self.call_parse_func(parser.parse_law_reference, u"la loi n° 78-17 du 6 janvier 1978"),
+            {'children':[{'type': u'law-reference', 'id': u'78-17', 'lawDate': u'1978-1-6'}]}
+        )
+        self.assertEqual(parser.reference_cache.hits, 1)
@@ -49,3 +49,33 @@ class ParseMultiplicativeAdverbTest(DuralexTestCase):
                 }
             ]}
         )
+
+    def test_header2_tricies(self):
+        self.assertEqualAST(
+            self.call_parse_func(
+                parser.parse_header2_definition,
+                "un 3° tricies"
+            ),
+            {'children':[
+                {
+                    'type': u'header2-definition',
+                    'order': 3,
+                    'isTricies': True
+                }
+            ]}
+        )
+
+    def test_header2_untricies(self):
+        self.assertEqualAST(
+            self.call_parse_func(
+                parser.parse_header2_definition,
+                "un 3° untricies"
+            ),
+            {'children':[
+                {
+                    'type': u'header2-definition',
+                    'order': 3,
+                    'isUntricies': True
+                }
+            ]}
+        )
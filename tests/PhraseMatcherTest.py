@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.alinea_lexer as lexer
+from duralex.phrases import PhraseMatcher
+
+class PhraseMatcherTest(DuralexTestCase):
+    def setUp(self):
+        self.matcher = PhraseMatcher([
+            ('chapter', u'~du chapitre <roman>'),
+            ('title', u'~le|du titre <roman>'),
+            ('part', u'de la <ordinal> partie'),
+            ('section', u'de la section <int>'),
+        ])
+
+    def test_captures(self):
+        tokens = lexer.tokenize(u'de la troisième partie du code')
+        match = self.matcher.match_first(tokens, 0, 'part')
+        self.assertEqual(match.captures, [3])
+        self.assertEqual(tokens[match.end], u'du')
+
+    def test_case(self):
+        self.assertIsNotNone(self.matcher.match_first(lexer.tokenize(u'Du titre IV'), 0, 'title'))
+        self.assertIsNone(self.matcher.match_first(lexer.tokenize(u'De la section 2'), 0, 'section'))
+
+    def test_int(self):
+        self.assertEqual(self.matcher.match_first(lexer.tokenize(u'de la section 1er'), 0, 'section').captures, [1])
+        # the token must start with the number
+        self.assertIsNone(self.matcher.match_first(lexer.tokenize(u'de la section A1'), 0, 'section'))
+
+    def test_alternatives(self):
+        self.assertEqual(
+            [m.captures for m in self.matcher.match(lexer.tokenize(u'le titre II'), 0)],
+            [[2]]
+        )
+        # "le" is only an alternative of the title phrase
+        self.assertEqual(self.matcher.match(lexer.tokenize(u'le chapitre II'), 0), [])
+
+    def test_no_match_at_end(self):
+        self.assertEqual(self.matcher.match(lexer.tokenize(u'de la section'), 0), [])
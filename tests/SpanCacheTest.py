@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.alinea_lexer as lexer
+from duralex.cache import SpanCache
+
+class SpanCacheTest(DuralexTestCase):
+    def test_get_set(self):
+        cache = SpanCache(10)
+        tokens = lexer.tokenize(u'du code civil , et')
+        self.assertIsNone(cache.get(tokens, 2, 'code'))
+        # "code civil" and the comma
+        cache.set(tokens, 2, 5, {'id': u'code civil'}, 4, 'code')
+        self.assertEqual(cache.get(lexer.tokenize(u'le code civil , ou'), 2, 'code'), ({'id': u'code civil'}, 4))
+        self.assertIsNone(cache.get(lexer.tokenize(u'le code civil local'), 2, 'code'))
+        self.assertIsNone(cache.get(tokens, 2, 'law'))
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_evict(self):
+        cache = SpanCache(2)
+        tokens = lexer.tokenize(u'a b c')
+        cache.set(tokens, 0, 3, 'a b', 3)
+        cache.set(tokens, 0, 1, 'a', 1)
+        cache.get(tokens, 0)
+        cache.set(tokens, 4, 1, 'c', 1)
+        self.assertEqual(len(cache.entries), 2)
+        self.assertEqual(cache.get(tokens, 0), ('a', 1))
+        self.assertEqual(cache.get(tokens, 4), ('c', 1))
+        # the nodes of the evicted span are removed from the trie
+        self.assertEqual(cache.tries[None], {u'a': {None: (None, u'a')}, u'c': {None: (None, u'c')}})
+
+    def test_dump_load(self):
+        cache = SpanCache(10)
+        tokens = lexer.tokenize(u'la loi n° 78-17 ,')
+        cache.set(tokens, 0, 8, {'id': u'78-17'}, 8, 'law')
+        other = SpanCache(10)
+        other.load(cache.dump())
+        self.assertEqual(other.get(tokens, 0, 'law'), ({'id': u'78-17'}, 8))
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+from DuralexTestCase import DuralexTestCase
+
+import duralex.alinea_parser as parser
+import duralex.tree
+from duralex.AbstractVisitor import AbstractVisitor
+from duralex.DeleteParentVisitor import DeleteParentVisitor
+from duralex.ForkReferenceVisitor import ForkReferenceVisitor
+from duralex.SortReferencesVisitor import SortReferencesVisitor
+
+class TypeListVisitor(AbstractVisitor):
+    def __init__(self):
+        self.types = []
+        super(TypeListVisitor, self).__init__()
+
+    def enter_node(self, node):
+        self.types.append(node.get('type'))
+        # skip the descendants of the edit nodes
+        return node.get('type') != u'edit'
+
+class AlineaReferenceCountVisitor(AbstractVisitor):
+    def __init__(self):
+        self.count = 0
+        super(AlineaReferenceCountVisitor, self).__init__()
+
+    def visit_alinea_reference_node(self, node, post):
+        if not post:
+            self.count += 1
+
+class TreeTest(DuralexTestCase):
+    def make_deep_tree(self, depth):
+        tree = duralex.tree.create_node(None, {})
+        node = tree
+        for i in range(0, depth):
+            node = duralex.tree.create_node(node, {'type': u'alinea-reference', 'order': i})
+        return tree, node
+
+    def test_deep_tree(self):
+        depth = sys.getrecursionlimit() * 2
+        tree, leaf = self.make_deep_tree(depth)
+
+        self.assertEqual(duralex.tree.get_node_depth(leaf), depth)
+        self.assertEqual(len(duralex.tree.filter_nodes(tree, lambda n: 'type' in n)), depth)
+
+        c = duralex.tree.copy_node(tree)
+        self.assertEqual(len(duralex.tree.get_node_descendants(c)), depth + 1)
+
+        loaded = duralex.tree.load_node(None, duralex.tree.dump_node(tree))
+        self.assertEqual(
+            [n.get('order') for n in duralex.tree.get_node_descendants(loaded)],
+            [n.get('order') for n in duralex.tree.get_node_descendants(tree)]
+        )
+
+        visitor = AlineaReferenceCountVisitor()
+        visitor.visit(c)
+        self.assertEqual(visitor.count, depth)
+
+        DeleteParentVisitor().visit(tree)
+        self.assertNotIn('parent', leaf)
+
+    def test_filter_nodes_order(self):
+        tree = duralex.tree.create_node(None, {})
+        a = duralex.tree.create_node(tree, {'type': u'a'})
+        duralex.tree.create_node(a, {'type': u'b'})
+        duralex.tree.create_node(tree, {'type': u'c'})
+        self.assertEqual([n['type'] for n in duralex.tree.filter_nodes(tree, lambda n: 'type' in n)], [u'a', u'b', u'c'])
+
+    def test_visitor_enter_node(self):
+        tree = duralex.tree.create_node(None, {})
+        edit = duralex.tree.create_node(tree, {'type': u'edit'})
+        duralex.tree.create_node(edit, {'type': u'article-reference'})
+        duralex.tree.create_node(tree, {'type': u'quote'})
+        visitor = TypeListVisitor()
+        visitor.visit(tree)
+        self.assertEqual(visitor.types, [None, u'edit', u'quote'])
+
+    def test_node_depth(self):
+        tree = duralex.tree.create_node(None, {})
+        edit = duralex.tree.create_node(tree, {'type': u'edit'})
+        law_ref = duralex.tree.create_node(edit, {'type': u'law-reference'})
+        article_ref = duralex.tree.create_node(law_ref, {'type': u'article-reference'})
+        self.assertEqual(duralex.tree.get_node_depth(article_ref), 3)
+
+        duralex.tree.push_node(tree, law_ref)
+        self.assertEqual(duralex.tree.get_node_depth(law_ref), 1)
+        self.assertEqual(duralex.tree.get_node_depth(article_ref), 2)
+
+        duralex.tree.remove_node(tree, law_ref)
+        self.assertEqual(duralex.tree.get_node_depth(article_ref), 1)
+
+        duralex.tree.unshift_node(edit, law_ref)
+        self.assertEqual(duralex.tree.get_node_depth(article_ref), 3)
+
+        c = duralex.tree.copy_node(law_ref)
+        self.assertEqual(duralex.tree.get_node_depth(c), 0)
+        self.assertEqual(duralex.tree.get_node_depth(c['children'][0]), 1)
+
+    def test_node_depth_parsed_bill(self):
+        tree = duralex.tree.create_node(None, {})
+        parser.parse({'articles': [{'order': 1, 'alineas': {
+            '001': u'I. - Le code civil est ainsi modifié :',
+            '002': u'1° L\'article 5 est ainsi rédigé : "Art. 5. - Ceci est un test." ;',
+            '003': u'2° Les articles L. 1, L. 2 et L. 3 du code de commerce sont abrogés.',
+        }}]}, tree)
+        ForkReferenceVisitor().visit(tree)
+        SortReferencesVisitor().visit(tree)
+        for node in duralex.tree.get_node_descendants(tree):
+            self.assertEqual(node.get('depth', 0), len(list(duralex.tree.iter_node_ancestors(node))))
+
+    def test_has_ancestor_descendant_of_type(self):
+        tree = duralex.tree.create_node(None, {})
+        edit = duralex.tree.create_node(tree, {'type': u'edit'})
+        law_ref = duralex.tree.create_node(edit, {'type': u'law-reference'})
+        article_ref = duralex.tree.create_node(law_ref, {'type': u'article-reference'})
+        self.assertEqual(list(duralex.tree.iter_node_ancestors(article_ref)), [law_ref, edit, tree])
+        self.assertTrue(duralex.tree.has_ancestor_of_type(article_ref, [u'edit']))
+        self.assertFalse(duralex.tree.has_ancestor_of_type(law_ref, [u'article-reference']))
+        self.assertTrue(duralex.tree.has_descendant_of_type(tree, [u'article-reference']))
+        self.assertFalse(duralex.tree.has_descendant_of_type(edit, [u'edit']))
+
+    def test_descendant_types(self):
+        tree = duralex.tree.create_node(None, {})
+        edit = duralex.tree.create_node(tree, {'type': u'edit'})
+        law_ref = duralex.tree.create_node(edit, {'type': u'law-reference'})
+        article_ref = duralex.tree.create_node(law_ref, {'type': u'article-reference'})
+        words = duralex.tree.create_node(tree, {'type': u'words'})
+
+        duralex.tree.remove_node(law_ref, article_ref)
+        self.assertFalse(duralex.tree.has_descendant_of_type(tree, [u'article-reference']))
+        self.assertTrue(duralex.tree.has_descendant_of_type(tree, [u'law-reference']))
+
+        duralex.tree.push_node(words, article_ref)
+        self.assertTrue(duralex.tree.has_descendant_of_type(words, [u'article-reference']))
+        self.assertFalse(duralex.tree.has_descendant_of_type(edit, [u'article-reference']))
+
+        duralex.tree.set_node_type(law_ref, u'code-reference')
+        self.assertFalse(duralex.tree.has_descendant_of_type(tree, [u'law-reference']))
+        self.assertTrue(duralex.tree.has_descendant_of_type(tree, [u'code-reference']))
+
+        # a node built without create_node() has no mask
+        duralex.tree.push_node(edit, {'type': u'alinea-reference', 'children': []})
+        self.assertTrue(duralex.tree.has_descendant_of_type(tree, [u'alinea-reference']))
+
+        self.assertEqual(
+            duralex.tree.filter_nodes_of_type(tree, [u'article-reference', u'code-reference']),
+            [law_ref, article_ref]
+        )
+        self.assertEqual(duralex.tree.filter_nodes_of_type(tree, [u'definition']), [])
+
+        c = duralex.tree.copy_node(tree)
+        self.assertTrue(duralex.tree.has_descendant_of_type(c, [u'alinea-reference', u'article-reference']))
+        self.assertFalse(duralex.tree.has_descendant_of_type(c, [u'law-reference']))
+        self.assertEqual(len(duralex.tree.filter_nodes_of_type(c, [u'code-reference'])), 1)
+
+    def test_type_bits_unknown_types(self):
+        type_bits = dict(duralex.tree.TYPE_BITS)
+        self.assertEqual(duralex.tree.get_type_bit(u'foo'), duralex.tree.OTHER_TYPE_BIT)
+        self.assertEqual(duralex.tree.get_type_bit(u'bar'), duralex.tree.OTHER_TYPE_BIT)
+        self.assertEqual(duralex.tree.TYPE_BITS, type_bits)
+        self.assertNotEqual(duralex.tree.get_type_bit(duralex.tree.TYPE_RAW_CONTENT), duralex.tree.OTHER_TYPE_BIT)
+
+        tree = duralex.tree.create_node(None, {})
+        foo = duralex.tree.create_node(tree, {'type': u'foo'})
+        bar = duralex.tree.create_node(foo, {'type': u'bar'})
+        self.assertTrue(duralex.tree.has_descendant_of_type(tree, [u'bar']))
+        self.assertFalse(duralex.tree.has_descendant_of_type(bar, [u'foo']))
+        self.assertEqual(duralex.tree.filter_nodes_of_type(tree, [u'bar']), [bar])
@@ -38,6 +38,19 @@ from ResolveFullyQualifiedReferencesVisitorTest import ResolveFullyQualifiedRefe
 from SortReferencesVisitorTest import SortReferencesVisitorTest
 from ForkReferenceVisitorTest import ForkReferenceVisitorTest
 from ForkEditVisitorTest import ForkEditVisitorTest
+from ParseBillArticleTest import ParseBillArticleTest
+from ParseEndOfInputTest import ParseEndOfInputTest
+from FetcherTest import FetcherTest
+from MemoryReportTest import MemoryReportTest
+from MetricsTest import MetricsTest
+from TreeTest import TreeTest
+from AmendmentParserTest import AmendmentParserTest
+from DiffParserTest import DiffParserTest
+from DiskCacheTest import DiskCacheTest
+from AlineaLexerTest import AlineaLexerTest
+from PhraseMatcherTest import PhraseMatcherTest
+from SpanCacheTest import SpanCacheTest
+from DuralexScriptTest import DuralexScriptTest
 
 if __name__ == '__main__':
     unittest.main()